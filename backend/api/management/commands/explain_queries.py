@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.utils.query_plans import HOT_QUERIES, explain_hot_query
+
+
+class Command(BaseCommand):
+  help = ('Runs EXPLAIN QUERY PLAN on the queries of every list/retrieve endpoint, '
+          'flags full scans and temp B-tree sorts and proposes composite indexes')
+
+  def add_arguments(self, parser):
+    parser.add_argument('--fail-on-scan', action='store_true',
+                        help='exit with an error when any hot query is flagged')
+
+
+  def handle(self, *args, **options):
+    verbose = options['verbosity'] > 1
+    flagged = []
+
+    for hot_query in HOT_QUERIES:
+      plans, suggestion = explain_hot_query(hot_query)
+      is_flagged = any(plan.is_flagged for plan in plans)
+      style = self.style.WARNING if is_flagged else self.style.SUCCESS
+      self.stdout.write(style(f'{hot_query.name}: {"FLAGGED" if is_flagged else "ok"}'))
+
+      for plan in plans:
+        if verbose:
+          self.stdout.write(f'  {plan.sql}')
+        for line in plan.plan:
+          marker = '!' if plan.is_flagged and line in plan.full_scans + plan.temp_sorts else ' '
+          self.stdout.write(f'  {marker} {line}')
+
+      if is_flagged:
+        flagged.append(hot_query.name)
+        if suggestion:
+          self.stdout.write(f'  suggested index: ({", ".join(suggestion)})')
+
+    if flagged and options['fail_on_scan']:
+      raise CommandError(f'{len(flagged)} hot query(ies) scan or sort: {", ".join(flagged)}')
+    self.stdout.write(f'{len(HOT_QUERIES) - len(flagged)}/{len(HOT_QUERIES)} hot queries are index backed')
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.signals.response_cache_signals import INVALIDATED_LABELS, bump_generations
+from api.utils.images import render_lesson_text
+from course.models import Lesson
+
+
+class Command(BaseCommand):
+  help = ('Renders the html served for every lesson text, for the lessons stored before texts were rendered '
+          'on save (migration 0024 copied them as written) or after the rendering changed')
+
+  def add_arguments(self, parser):
+    parser.add_argument('--dry-run', action='store_true', help='only report the lessons that would change')
+    parser.add_argument('--batch-size', type=int, default=500)
+
+
+  def handle(self, *args, **options):
+    lessons = Lesson.objects.order_by('pk').only('pk', 'text', 'text_html')
+    rendered, last_pk = 0, 0
+    while True:
+      batch = list(lessons.filter(pk__gt=last_pk)[:options['batch_size']])
+      if not batch:
+        break
+      last_pk = batch[-1].pk
+
+      for lesson in batch:
+        html = render_lesson_text(lesson.text)
+        if html == lesson.text_html:
+          continue
+        self.stdout.write(f'lesson {lesson.pk}')
+        # a text edited meanwhile was rendered by its save
+        if options['dry_run'] or Lesson.objects.filter(pk=lesson.pk, text=lesson.text).update(
+            text_html=html, updated_at=timezone.now()):
+          rendered += 1
+
+    if rendered and not options['dry_run']:
+      bump_generations(INVALIDATED_LABELS[Lesson])
+    summary = f'Found {rendered} lesson text(s) to render' if options['dry_run'] else f'Rendered {rendered} lesson text(s)'
+    self.stdout.write(self.style.SUCCESS(summary))
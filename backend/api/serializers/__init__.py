@@ -1,8 +1,17 @@
 from .v1 import (
+  RatingStatsSerializerV1,
   CategorySerializerV1, 
   CourseSerializerV1, 
   LessonSerializerV1, 
   CommentSerializerV1,
+  CommentThreadSerializerV1,
   SaveSerializerV1,
-  WatchedSerializerV1
+  SaveBulkSerializerV1,
+  SaveBulkDeleteSerializerV1,
+  WatchedSerializerV1,
+  WatchedHeartbeatSerializerV1,
+  WatchedBulkSerializerV1,
+  WatchedUpsertSerializerV1,
+  SearchResultSerializerV1,
+  VideoUploadSerializerV1,
   )
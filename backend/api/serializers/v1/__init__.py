@@ -1,6 +1,15 @@
+from .rating_stats_serializer_v1 import RatingStatsSerializerV1
 from .category_serializer_v1 import CategorySerializerV1
 from .course_serializer_v1 import CourseSerializerV1
 from .lesson_serializer_v1 import LessonSerializerV1
 from .comment_serializer_v1 import CommentSerializerV1
+from .comment_thread_serializer_v1 import CommentThreadSerializerV1
 from .save_serializer_v1 import SaveSerializerV1
-from .watched_serializer_v1 import WatchedSerializerV1
\ No newline at end of file
+from .save_bulk_serializer_v1 import SaveBulkSerializerV1
+from .save_bulk_delete_serializer_v1 import SaveBulkDeleteSerializerV1
+from .watched_serializer_v1 import WatchedSerializerV1
+from .watched_heartbeat_serializer_v1 import WatchedHeartbeatSerializerV1
+from .watched_bulk_serializer_v1 import WatchedBulkSerializerV1
+from .watched_upsert_serializer_v1 import WatchedUpsertSerializerV1
+from .search_serializer_v1 import SearchResultSerializerV1
+from .video_upload_serializer_v1 import VideoUploadSerializerV1
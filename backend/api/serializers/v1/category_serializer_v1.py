@@ -1,9 +1,10 @@
 from rest_framework import serializers
 
 from course.models import Category
+from api.utils.mixins import SparseFieldsetsMixin
 
 
-class CategorySerializerV1(serializers.ModelSerializer):
+class CategorySerializerV1(SparseFieldsetsMixin, serializers.ModelSerializer):
   class Meta:
     model = Category
     fields = ['id', 'name', 'description', 'color', 'created_at', 'updated_at']
@@ -2,13 +2,16 @@ from rest_framework import serializers
 from django.core.exceptions import ValidationError
 
 from course.models import Comment
+from api.utils.mixins import SparseFieldsetsMixin
+from api.utils.serializers import ValuesListSerializer
 
 
-class CommentSerializerV1(serializers.ModelSerializer):
+class CommentSerializerV1(SparseFieldsetsMixin, serializers.ModelSerializer):
   class Meta:
     model = Comment
     fields = ['id', 'user', 'lesson', 'text', 'stars', 'comment_fk', 'created_at', 'updated_at']
     read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+    list_serializer_class = ValuesListSerializer
 
   
   def create(self, validated_data):
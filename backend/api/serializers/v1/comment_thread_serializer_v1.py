@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from .comment_serializer_v1 import CommentSerializerV1
+
+
+class CommentThreadSerializerV1(CommentSerializerV1):
+  """A comment with its replies nested, as read by `Comment.objects.thread`"""
+  depth = serializers.IntegerField(read_only=True)
+  more_replies = serializers.BooleanField(read_only=True)
+  replies = serializers.SerializerMethodField()
+
+  class Meta(CommentSerializerV1.Meta):
+    fields = CommentSerializerV1.Meta.fields + ['depth', 'more_replies', 'replies']
+
+
+  def get_replies(self, comment):
+    return CommentThreadSerializerV1(comment.replies, many=True, context=self.context).data
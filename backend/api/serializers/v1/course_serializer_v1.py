@@ -1,10 +1,16 @@
 from rest_framework import serializers
 
 from course.models import Course
+from api.utils.mixins import SparseFieldsetsMixin
+from api.utils.serializers import CoverSrcsetField
+from .rating_stats_serializer_v1 import RatingStatsSerializerV1
 
 
-class CourseSerializerV1(serializers.ModelSerializer):
+class CourseSerializerV1(SparseFieldsetsMixin, serializers.ModelSerializer):
+  stats = RatingStatsSerializerV1(read_only=True)
+  cover_srcset = CoverSrcsetField()
+
   class Meta:
     model = Course
-    fields = ['id', 'title', 'description', 'category', 'cover', 'created_at', 'updated_at']
+    fields = ['id', 'title', 'description', 'category', 'cover', 'cover_srcset', 'cover_width', 'cover_height', 'cover_placeholder', 'stats', 'created_at', 'updated_at']
     read_only_fields = ['id', 'created_at', 'updated_at']
\ No newline at end of file
@@ -1,11 +1,18 @@
 from rest_framework import serializers
 
 from course.models import Lesson
+from api.utils.mixins import SparseFieldsetsMixin
+from api.utils.serializers import CoverSrcsetField, RenderedTextField
+from .rating_stats_serializer_v1 import RatingStatsSerializerV1
 
 
-class LessonSerializerV1(serializers.ModelSerializer):
+class LessonSerializerV1(SparseFieldsetsMixin, serializers.ModelSerializer):
+  stats = RatingStatsSerializerV1(read_only=True)
+  cover_srcset = CoverSrcsetField()
+  text = RenderedTextField(read_source='text_html', allow_blank=True, allow_null=True, required=False)
+
   class Meta:
     model = Lesson
-    fields = ['id', 'title', 'description', 'course', 'cover', 'video', 'text', 'author', 'created_at', 'updated_at']
+    fields = ['id', 'title', 'description', 'course', 'cover', 'cover_srcset', 'cover_width', 'cover_height', 'cover_placeholder', 'video', 'text', 'author', 'stats', 'created_at', 'updated_at']
     read_only_fields = ['id', 'created_at', 'updated_at']
   
\ No newline at end of file
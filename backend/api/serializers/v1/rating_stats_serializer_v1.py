@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+from course.stats import STAR_VALUES
+
+
+class RatingStatsSerializerV1(serializers.Serializer):
+  """Read only view of a LessonStats or CourseStats rollup"""
+  rating = serializers.SerializerMethodField()
+  star_count = serializers.IntegerField(read_only=True)
+  stars = serializers.SerializerMethodField()
+  comment_count = serializers.IntegerField(read_only=True)
+  reply_count = serializers.IntegerField(read_only=True)
+
+
+  def get_rating(self, stats) -> float | None:
+    if not stats.star_count:
+      return None
+    return round(stats.rating, 2)
+
+
+  def get_stars(self, stats) -> dict[str, int]:
+    return {str(stars): getattr(stats, f'stars_{stars}') for stars in STAR_VALUES}
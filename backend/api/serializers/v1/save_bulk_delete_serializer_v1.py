@@ -0,0 +1,5 @@
+from rest_framework import serializers
+
+
+class SaveBulkDeleteSerializerV1(serializers.Serializer):
+  lessons = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=500)
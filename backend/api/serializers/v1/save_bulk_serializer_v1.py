@@ -0,0 +1,6 @@
+from rest_framework import serializers
+
+
+class SaveBulkSerializerV1(serializers.Serializer):
+  """One item of a bulk save, the lesson is checked for the whole payload at once"""
+  lesson = serializers.IntegerField(min_value=1)
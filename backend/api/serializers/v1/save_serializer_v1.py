@@ -2,13 +2,16 @@ from rest_framework import serializers
 from django.core.exceptions import ValidationError
 
 from course.models import Save
+from api.utils.mixins import SparseFieldsetsMixin
+from api.utils.serializers import ValuesListSerializer
 
 
-class SaveSerializerV1(serializers.ModelSerializer):
+class SaveSerializerV1(SparseFieldsetsMixin, serializers.ModelSerializer):
   class Meta:
     model = Save
     fields = ['id', 'user', 'lesson', 'created_at', 'updated_at']
     read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+    list_serializer_class = ValuesListSerializer
 
   
   def create(self, validated_data):
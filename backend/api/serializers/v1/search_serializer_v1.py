@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+from api.utils.mixins import SparseFieldsetsMixin
+
+
+class SearchResultSerializerV1(SparseFieldsetsMixin, serializers.Serializer):
+  kind = serializers.CharField()
+  id = serializers.IntegerField(source='object_id')
+  title = serializers.CharField()
+  snippet = serializers.CharField()
+  rank = serializers.FloatField()
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+from course.models import VideoUpload
+
+
+class VideoUploadSerializerV1(serializers.ModelSerializer):
+  class Meta:
+    model = VideoUpload
+    fields = ['id', 'lesson', 'user', 'filename', 'length', 'offset', 'sha256', 'completed_at', 'created_at', 'updated_at']
+    read_only_fields = fields
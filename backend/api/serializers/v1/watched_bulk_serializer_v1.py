@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+from course.models import Lesson, Watched
+from api.utils.serializers import column_max_value
+
+
+class WatchedBulkSerializerV1(serializers.Serializer):
+  """One item of a bulk watched import, the lesson is checked for the whole payload at once"""
+  lesson = serializers.IntegerField(min_value=1, max_value=column_max_value(Lesson, 'id'))
+  watched_time = serializers.IntegerField(
+    min_value=0, max_value=column_max_value(Watched, 'watched_time'), default=0)
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from course.models import Lesson, Watched
+from api.utils.serializers import column_max_value
+
+
+class WatchedHeartbeatSerializerV1(serializers.Serializer):
+  """
+  Progress reported by a video player. The lesson is not looked up here,
+  heartbeats for missing lessons are dropped when the buffer is flushed
+  """
+  lesson = serializers.IntegerField(min_value=1, max_value=column_max_value(Lesson, 'id'))
+  watched_time = serializers.IntegerField(min_value=0, max_value=column_max_value(Watched, 'watched_time'))
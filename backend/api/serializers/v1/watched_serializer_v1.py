@@ -2,13 +2,16 @@ from rest_framework import serializers
 from django.core.exceptions import ValidationError
 
 from course.models import Watched
+from api.utils.mixins import SparseFieldsetsMixin
+from api.utils.serializers import ValuesListSerializer
 
 
-class WatchedSerializerV1(serializers.ModelSerializer):
+class WatchedSerializerV1(SparseFieldsetsMixin, serializers.ModelSerializer):
   class Meta:
     model = Watched
     fields = ['id', 'user', 'lesson', 'watched_time', 'created_at', 'updated_at']
     read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+    list_serializer_class = ValuesListSerializer
 
 
   def create(self, validated_data):
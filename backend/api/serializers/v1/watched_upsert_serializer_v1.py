@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+from course.models import Watched
+from api.utils.serializers import column_max_value
+
+
+class WatchedUpsertSerializerV1(serializers.Serializer):
+  watched_time = serializers.IntegerField(min_value=0, max_value=column_max_value(Watched, 'watched_time'))
@@ -0,0 +1,2 @@
+from . import response_cache_signals
+from . import lesson_text_signals
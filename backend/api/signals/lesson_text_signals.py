@@ -0,0 +1,25 @@
+from django.db.models.signals import pre_save, post_save
+from django.dispatch import receiver
+
+from course.models import Lesson
+from api.utils.images import render_lesson_text
+
+
+def renders_text(update_fields) -> bool:
+  return update_fields is None or 'text' in update_fields
+
+
+@receiver(pre_save, sender=Lesson)
+def render_text(sender, instance, raw=False, update_fields=None, **kwargs):
+  # rendered once per write, reads serve the stored html
+  if raw or not renders_text(update_fields):
+    return
+  instance.text_html = render_lesson_text(instance.text)
+
+
+@receiver(post_save, sender=Lesson)
+def save_rendered_text(sender, instance, raw=False, update_fields=None, **kwargs):
+  # saves limited to `text` did not write the html rendered along with it
+  if raw or update_fields is None or 'text' not in update_fields or 'text_html' in update_fields:
+    return
+  Lesson.objects.filter(pk=instance.pk).update(text_html=instance.text_html)
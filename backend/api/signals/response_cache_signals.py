@@ -0,0 +1,41 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from course.models import Category, Course, Lesson, Comment
+from course.signals.media_blob_signals import media_repointed
+from api.utils.cache import bump_generation
+
+
+# the rating rollups are written with F() updates that send no signal, the
+# responses embedding them are invalidated by the comment and lesson writes
+# that move them
+INVALIDATED_LABELS = {
+  Category: ('course.category', ),
+  Course: ('course.course', ),
+  Lesson: ('course.lesson', 'course.coursestats', ),
+  Comment: ('course.lessonstats', 'course.coursestats', ),
+}
+
+
+def bump_generations(labels):
+  for label in labels:
+    bump_generation(label)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_cached_responses(sender, **kwargs):
+  labels = INVALIDATED_LABELS.get(sender)
+  if labels is None:
+    return
+  bump_generations(labels)
+  # bumped again once committed, a request that read the old rows while the
+  # transaction was open must not keep them cached under the new generation
+  transaction.on_commit(lambda: bump_generations(labels))
+
+
+@receiver(media_repointed)
+def invalidate_repointed_media(sender, **kwargs):
+  # sent once the rows are committed
+  bump_generations(INVALIDATED_LABELS.get(sender, ()))
@@ -0,0 +1,38 @@
+from django.test import TestCase
+from django.core.management import call_command
+from io import StringIO
+
+from api.utils.query_plans import HOT_QUERIES, HotQuery, explain_hot_query
+from api.views import CommentListCreate, WatchedListCreate
+
+
+class TestHotQueryPlans(TestCase):
+  def test_hot_queries_do_not_scan_or_sort(self):
+    for hot_query in HOT_QUERIES:
+      with self.subTest(hot_query.name):
+        plans, _ = explain_hot_query(hot_query)
+        self.assertTrue(plans)
+        for plan in plans:
+          self.assertFalse(plan.is_flagged, f'{plan.sql}\n' + '\n'.join(plan.plan))
+
+
+  def test_list_plans_use_the_updated_at_indexes(self):
+    plans, _ = explain_hot_query(HotQuery('watcheds', WatchedListCreate))
+    page_plan = '\n'.join(plans[-1].plan)
+    self.assertIn('watched_user_updated_at_idx', page_plan)
+
+
+  def test_unsupported_ordering_is_flagged_with_a_suggestion(self):
+    class CommentsByStars(CommentListCreate):
+      def get_queryset(self):
+        return super().get_queryset().filter(stars=5).order_by('-created_at')
+
+    plans, suggestion = explain_hot_query(HotQuery('comments by stars', CommentsByStars))
+    self.assertTrue(any(plan.is_flagged for plan in plans))
+    self.assertEqual(suggestion, ['stars', 'created_at'])
+
+
+  def test_explain_queries_command_passes_regression_gate(self):
+    out = StringIO()
+    call_command('explain_queries', '--fail-on-scan', stdout=out)
+    self.assertIn(f'{len(HOT_QUERIES)}/{len(HOT_QUERIES)} hot queries are index backed', out.getvalue())
@@ -0,0 +1,57 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.db.models import F
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from course.factories import LessonFactory
+from course.models import Lesson
+from backend.faker_base import faker
+
+
+TEXT = '<p><img src="https://example.com/diagram.png"></p>'
+RENDERED = '<p><img src="https://example.com/diagram.png" loading="lazy" decoding="async"></p>'
+
+
+class TestRenderLessonTexts(TestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.lesson = LessonFactory(text=TEXT)
+    self.plain = LessonFactory(text='<p>no images</p>')
+    # as migration 0024 left the lessons stored before it
+    Lesson.objects.update(text_html=F('text'))
+    self.lesson.refresh_from_db()
+
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def render(self, *args):
+    output = StringIO()
+    call_command('render_lesson_texts', *args, stdout=output)
+    return output.getvalue()
+
+
+  def test_stored_texts_are_rendered(self):
+    url = reverse('lesson', kwargs={'pk': self.lesson.pk})
+    before = self.client.get(url)
+    self.assertEqual(before.data['text'], TEXT)
+
+    self.assertIn('Rendered 1 lesson text(s)', self.render())
+    lesson = Lesson.objects.get(pk=self.lesson.pk)
+    self.assertEqual(lesson.text_html, RENDERED)
+    self.assertGreater(lesson.updated_at, self.lesson.updated_at)
+
+    # the cached anonymous response and its validators move along
+    response = self.client.get(url, HTTP_IF_NONE_MATCH=before['ETag'])
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response.data['text'], RENDERED)
+    self.assertIn('Rendered 0 lesson text(s)', self.render())
+
+
+  def test_dry_run_only_reports(self):
+    self.assertIn('Found 1 lesson text(s) to render', self.render('--dry-run'))
+    self.assertEqual(Lesson.objects.get(pk=self.lesson.pk).text_html, TEXT)
@@ -0,0 +1,115 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from api.utils.parsers import ORJSONParser
+from api.utils.renderers import ORJSONRenderer
+from course.factories import CommentFactory, LessonFactory, SaveFactory, UserFactory, WatchedFactory
+from backend.faker_base import faker
+
+
+class TestORJSONRenderer(TestCase):
+  def assert_same_bytes(self, data, accepted_media_type='application/json', renderer_context=None):
+    expected = JSONRenderer().render(data, accepted_media_type, renderer_context)
+    self.assertEqual(ORJSONRenderer().render(data, accepted_media_type, renderer_context), expected)
+
+
+  def test_renders_the_same_bytes_as_drf(self):
+    self.assert_same_bytes({
+      'id': 1,
+      'title': 'Olá, 世界 😀 "quoted" \\ \n\t',
+      'separators': '  and  ',
+      'rating': 4.25,
+      'stars': {0: 1, 5: 2},
+      'nothing': None,
+      'flags': [True, False],
+      'nested': [{'a': []}, {}],
+    })
+
+
+  def test_renders_python_types_through_the_drf_encoder(self):
+    self.assert_same_bytes({
+      'aware': datetime(2024, 6, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+      'naive': datetime(2024, 6, 1, 12, 30),
+      'date': date(2024, 6, 1),
+      'time': time(8, 15),
+      'duration': timedelta(minutes=3),
+      'decimal': Decimal('1.50'),
+      'uuid': uuid.UUID(int=1),
+      'lazy': gettext_lazy('lazy'),
+      'tuple': (1, 2),
+      'bytes': b'bytes',
+    })
+
+
+  def test_falls_back_to_drf(self):
+    self.assert_same_bytes({'big': 2 ** 70})
+    self.assert_same_bytes({'a': [1]}, 'application/json; indent=4')
+    self.assert_same_bytes({'a': [1]}, renderer_context={'indent': 2})
+    self.assertEqual(ORJSONRenderer().render(None), b'')
+    with self.assertRaises(TypeError):
+      ORJSONRenderer().render({'object': object()})
+
+
+class TestORJSONRendererResponses(TestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.user = UserFactory()
+    lesson = LessonFactory(title='Lição 1  ')
+    for _ in range(3):
+      CommentFactory(lesson=lesson)
+      WatchedFactory(user=self.user)
+      SaveFactory(user=self.user)
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_api_responses_are_byte_identical_to_drf(self):
+    for name in ('categories', 'courses', 'lessons', 'comments', 'saves', 'watcheds'):
+      with self.subTest(name):
+        response = self.client.get(reverse(name))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+
+  def test_browsable_api_is_still_rendered(self):
+    client = APIClient()
+    client.force_authenticate(user=self.user)
+    response = client.get(reverse('lessons'), HTTP_ACCEPT='text/html; version=v1')
+    self.assertEqual(response.status_code, 200)
+    self.assertIn(b'<html', response.content)
+
+
+class TestORJSONParser(TestCase):
+  def parse(self, parser, content, encoding='utf-8'):
+    return parser.parse(BytesIO(content), 'application/json', {'encoding': encoding})
+
+
+  def test_parses_the_same_data_as_drf(self):
+    content = '{"title": "Olá 😀", "stars": 5, "time": 1.5, "lessons": [1, 2], "text": null}'.encode()
+    self.assertEqual(self.parse(ORJSONParser(), content), self.parse(JSONParser(), content))
+
+
+  def test_rejects_what_drf_rejects(self):
+    for content in (b'{"a": ', b'{"a": NaN}', b'\xff'):
+      with self.subTest(content):
+        with self.assertRaises(ParseError):
+          self.parse(JSONParser(), content)
+        with self.assertRaises(ParseError):
+          self.parse(ORJSONParser(), content)
+
+
+  def test_other_charsets_are_decoded_by_drf(self):
+    content = '{"title": "Olá"}'.encode('utf-16')
+    self.assertEqual(self.parse(ORJSONParser(), content, 'utf-16'), {'title': 'Olá'})
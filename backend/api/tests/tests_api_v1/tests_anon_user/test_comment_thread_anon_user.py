@@ -0,0 +1,68 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+
+from course.factories import CommentFactory, LessonFactory
+from backend.faker_base import faker
+
+
+class TestAnonUserCommentThread(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.lesson = LessonFactory()
+    self.root = CommentFactory(lesson=self.lesson)
+    self.first = CommentFactory(lesson=self.lesson, comment_fk=self.root)
+    self.second = CommentFactory(lesson=self.lesson, comment_fk=self.root)
+    self.nested = CommentFactory(lesson=self.lesson, comment_fk=self.first)
+    self.deepest = CommentFactory(lesson=self.lesson, comment_fk=self.nested)
+    self.unrelated = CommentFactory(lesson=self.lesson)
+
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def get_thread(self, pk, **params):
+    return self.client.get(path=reverse('comment-thread', kwargs={'pk': pk}), data=params)
+
+
+  def test_anon_user_can_read_a_whole_thread_in_one_query(self):
+    with self.assertNumQueries(1):
+      response = self.get_thread(self.root.pk)
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response.data['id'], self.root.pk)
+    self.assertEqual(response.data['depth'], 0)
+    self.assertEqual([reply['id'] for reply in response.data['replies']], [self.first.pk, self.second.pk])
+
+    first = response.data['replies'][0]
+    self.assertEqual(first['replies'][0]['id'], self.nested.pk)
+    self.assertEqual(first['replies'][0]['replies'][0]['id'], self.deepest.pk)
+    self.assertEqual(first['replies'][0]['replies'][0]['depth'], 3)
+    self.assertEqual(response.data['replies'][1]['replies'], [])
+
+
+  def test_thread_depth_is_limited(self):
+    response = self.get_thread(self.root.pk, depth=1)
+
+    first = response.data['replies'][0]
+    self.assertEqual(first['replies'], [])
+    self.assertTrue(first['more_replies'])
+    self.assertFalse(response.data['replies'][1]['more_replies'])
+
+
+  def test_thread_can_start_at_a_reply(self):
+    response = self.get_thread(self.first.pk)
+    self.assertEqual(response.data['id'], self.first.pk)
+    self.assertEqual(response.data['replies'][0]['id'], self.nested.pk)
+
+
+  def test_thread_of_missing_comment_is_404(self):
+    response = self.get_thread(2 ** 31)
+    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+  def test_thread_rejects_invalid_depth(self):
+    response = self.get_thread(self.root.pk, depth=100)
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    response = self.get_thread(self.root.pk, depth='deep')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
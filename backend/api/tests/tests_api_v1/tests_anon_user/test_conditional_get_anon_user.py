@@ -0,0 +1,105 @@
+from unittest import mock
+
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+
+from course.factories import CategoryFactory, CourseFactory, LessonFactory
+from api.serializers import LessonSerializerV1
+from backend.faker_base import faker
+
+
+class TestAnonUserConditionalGet(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    cache.clear()
+    self.category = CategoryFactory()
+    self.course = CourseFactory(category=self.category)
+    self.lesson = LessonFactory(course=self.course)
+    for _ in range(3):
+      LessonFactory(course=self.course)
+
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_item_response_carries_validators(self):
+    response = self.client.get(path=reverse('lesson', kwargs={'pk': self.lesson.pk}))
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertTrue(response.has_header('ETag'))
+    self.assertTrue(response.has_header('Last-Modified'))
+    self.assertIn('Accept', response['Vary'])
+
+
+  def test_matching_etag_answers_304_without_serializing(self):
+    url = reverse('lesson', kwargs={'pk': self.lesson.pk})
+    etag = self.client.get(path=url)['ETag']
+    cache.clear()
+
+    with mock.patch.object(LessonSerializerV1, 'to_representation') as to_representation:
+      response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+
+    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    self.assertEqual(response.content, b'')
+    self.assertEqual(response['ETag'], etag)
+    to_representation.assert_not_called()
+
+
+  def test_cached_response_still_answers_304(self):
+    url = reverse('lesson', kwargs={'pk': self.lesson.pk})
+    etag = self.client.get(path=url)['ETag']
+
+    with self.assertNumQueries(0):
+      response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    self.assertEqual(response['ETag'], etag)
+
+
+  def test_if_modified_since_answers_304(self):
+    url = reverse('category', kwargs={'pk': self.category.pk})
+    last_modified = self.client.get(path=url)['Last-Modified']
+    response = self.client.get(path=url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+  def test_update_changes_the_etag(self):
+    url = reverse('course', kwargs={'pk': self.course.pk})
+    etag = self.client.get(path=url)['ETag']
+    self.course.description = 'changed'
+    self.course.save()
+
+    response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertNotEqual(response['ETag'], etag)
+
+
+  def test_list_answers_304_from_an_aggregate_fingerprint(self):
+    url = reverse('lessons')
+    etag = self.client.get(path=url)['ETag']
+    cache.clear()
+
+    # the fingerprint aggregate is the only query, no row is loaded
+    with self.assertNumQueries(1):
+      response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+  def test_list_etag_changes_when_a_row_is_added_or_deleted(self):
+    url = reverse('lessons')
+    etag = self.client.get(path=url)['ETag']
+
+    lesson = LessonFactory(course=self.course)
+    added = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(added.status_code, status.HTTP_200_OK)
+
+    lesson.delete()
+    deleted = self.client.get(path=url, HTTP_IF_NONE_MATCH=added['ETag'])
+    self.assertEqual(deleted.status_code, status.HTTP_200_OK)
+
+
+  def test_pages_and_versions_have_their_own_etags(self):
+    url = reverse('lessons')
+    first = self.client.get(path=url)['ETag']
+    second = self.client.get(path=url, QUERY_STRING='page_size=2&page=2')['ETag']
+    self.assertNotEqual(first, second)
@@ -30,11 +30,13 @@ class TestAnonUserCategories(APITestCase):
     results = response.data.get('results')
     if results == None:
       response.data['cover'] = response.data['cover'].removeprefix('http://testserver')
+      response.data['cover_srcset'] = {width: url.removeprefix('http://testserver') for width, url in response.data['cover_srcset'].items()}
       self.assertEqual(response.data, serializer.data)
       return 
     
     for item in results:
       item['cover'] = item['cover'].removeprefix('http://testserver')
+      item['cover_srcset'] = {width: url.removeprefix('http://testserver') for width, url in item['cover_srcset'].items()}
     self.assertCountEqual(response.data.get('results'), serializer.data)
     return 
 
@@ -98,8 +100,8 @@ class TestAnonUserCategories(APITestCase):
       path=reverse('courses'),
       QUERY_STRING=f'max_lessons={self.course_1.lesson_set.count()}')
     courses = Course.objects.annotate(
-      lesson_count=Count('lesson')).filter(
-        lesson_count__lte=self.course_1.lesson_set.count())
+      actual_lesson_count=Count('lesson')).filter(
+        actual_lesson_count__lte=self.course_1.lesson_set.count())
     serializer = CourseSerializerV1(courses, many=True)
 
     self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -111,8 +113,8 @@ class TestAnonUserCategories(APITestCase):
       path=reverse('courses'), 
       QUERY_STRING=f'min_lessons={self.course_1.lesson_set.count()}')
     courses = Course.objects.annotate(
-      lesson_count=Count('lesson')).filter(
-        lesson_count__gte=self.course_1.lesson_set.count())
+      actual_lesson_count=Count('lesson')).filter(
+        actual_lesson_count__gte=self.course_1.lesson_set.count())
     serializer = CourseSerializerV1(courses, many=True)
 
     self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -129,9 +131,9 @@ class TestAnonUserCategories(APITestCase):
     courses = Course.objects.filter(
       title__icontains=self.course_1.title,
       category__name__icontains=self.course_1.category.name).annotate(
-        lesson_count=Count('lesson')).filter(
-          lesson_count__lte=self.course_1.lesson_set.count(),
-          lesson_count__gte=self.course_1.lesson_set.count())
+        actual_lesson_count=Count('lesson')).filter(
+          actual_lesson_count__lte=self.course_1.lesson_set.count(),
+          actual_lesson_count__gte=self.course_1.lesson_set.count())
     serializer = CourseSerializerV1(courses, many=True)
 
     self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,150 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from PIL import Image
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.files.base import ContentFile
+from django.test import override_settings
+from django.urls import reverse
+
+from course.factories import CourseFactory, LessonFactory
+from api.utils.images import DerivativeCache, negotiate_format
+from backend.faker_base import faker
+
+
+class TestAnonUserCoverDerivatives(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.cache_dir = tempfile.mkdtemp()
+    self.settings_override = override_settings(COVER_CACHE_DIR=self.cache_dir)
+    self.settings_override.enable()
+
+    self.lesson = LessonFactory(cover__width=800, cover__height=400)
+    self.client = APIClient()
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.cache_dir)
+
+
+  def get_cover(self, width, accept='image/webp,image/*;q=0.8', **kwargs):
+    return self.client.get(
+      path=reverse('lesson-cover', kwargs={'pk': self.lesson.pk, 'width': width}), HTTP_ACCEPT=accept, **kwargs)
+
+
+  def open_image(self, response):
+    return Image.open(io.BytesIO(b''.join(response.streaming_content)))
+
+
+  def test_anon_user_gets_scaled_webp_cover(self):
+    response = self.get_cover(320)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response['Content-Type'], 'image/webp')
+    self.assertIn('Accept', response['Vary'])
+    self.assertIn('public', response['Cache-Control'])
+
+    image = self.open_image(response)
+    self.assertEqual(image.format, 'WEBP')
+    self.assertEqual(image.size, (320, 160))
+
+
+  def test_cover_falls_back_to_the_source_format(self):
+    response = self.get_cover(160, accept='image/webp;q=0,*/*')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response['Content-Type'], 'image/jpeg')
+    self.assertEqual(self.open_image(response).size, (160, 80))
+
+
+  def test_covers_are_never_upscaled(self):
+    response = self.get_cover(1280)
+    self.assertEqual(self.open_image(response).size, (800, 400))
+
+
+  def test_derivatives_are_cached_and_revalidated(self):
+    first = self.get_cover(640)
+    self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    second = self.get_cover(640, HTTP_IF_NONE_MATCH=first['ETag'])
+    self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+    self.assertEqual(second['ETag'], first['ETag'])
+
+
+  def test_replaced_cover_gets_a_new_derivative(self):
+    first = self.get_cover(320)
+    self.lesson.cover = LessonFactory.build(cover__width=640, cover__height=640).cover
+    self.lesson.save()
+
+    second = self.get_cover(320)
+    self.assertNotEqual(second['ETag'], first['ETag'])
+    self.assertEqual(self.open_image(second).size, (320, 320))
+
+
+  def test_course_covers_are_served(self):
+    course = CourseFactory(cover__width=400, cover__height=400)
+    response = self.client.get(path=reverse('course-cover', kwargs={'pk': course.pk, 'width': 160}))
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(self.open_image(response).size, (160, 160))
+
+
+  def test_unknown_widths_and_missing_covers_are_not_found(self):
+    self.assertEqual(self.get_cover(300).status_code, status.HTTP_404_NOT_FOUND)
+
+    self.lesson.cover = None
+    self.lesson.save()
+    self.assertEqual(self.get_cover(320).status_code, status.HTTP_404_NOT_FOUND)
+
+
+  def test_unreadable_covers_are_not_found(self):
+    with self.lesson.cover.open('rb') as cover:
+      data = cover.read()
+    self.lesson.cover.save('truncated.jpg', ContentFile(data[:len(data) // 2]))
+    self.assertEqual(self.get_cover(320).status_code, status.HTTP_404_NOT_FOUND)
+
+    self.lesson.cover.save('whole.jpg', ContentFile(data))
+    with mock.patch.object(Image, 'MAX_IMAGE_PIXELS', 100):
+      self.assertEqual(self.get_cover(160).status_code, status.HTTP_404_NOT_FOUND)
+
+
+  def test_lessons_expose_a_cover_srcset(self):
+    response = self.client.get(
+      path=reverse('lesson', kwargs={'pk': self.lesson.pk}), HTTP_ACCEPT='application/json; version=v1')
+    srcset = response.data['cover_srcset']
+    self.assertEqual(list(srcset), ['160', '320', '640', '1280'])
+    self.assertEqual(
+      srcset['320'], 'http://testserver' + reverse('lesson-cover', kwargs={'pk': self.lesson.pk, 'width': 320}))
+
+
+  def test_accept_negotiation(self):
+    self.assertEqual(negotiate_format('image/avif,image/webp,*/*', 'a.png'), 'WEBP' if 'AVIF' not in Image.SAVE else 'AVIF')
+    self.assertEqual(negotiate_format('image/webp;q=0, image/*', 'a.jpeg'), 'JPEG')
+    self.assertEqual(negotiate_format('*/*', 'a.gif'), 'PNG')
+
+
+class TestDerivativeCache(APITestCase):
+  def setUp(self):
+    self.directory = tempfile.mkdtemp()
+    self.cache = DerivativeCache(self.directory, max_size=1000)
+
+
+  def tearDown(self):
+    shutil.rmtree(self.directory)
+
+
+  def test_least_recently_used_files_are_evicted(self):
+    for index, key in enumerate(('aa1', 'bb2', 'cc3')):
+      self.cache.put(key, b'x' * 300)
+      os.utime(self.cache.path(key), (index, index))
+    os.utime(self.cache.path('aa1'), (10, 10))
+
+    self.cache.put('dd4', b'x' * 300)
+
+    self.assertIsNone(self.cache.get('bb2'))
+    self.assertIsNotNone(self.cache.get('cc3'))
+    self.assertIsNotNone(self.cache.get('aa1'))
+    self.assertIsNotNone(self.cache.get('dd4'))
+    self.assertLessEqual(sum(size for _, size, _ in self.cache.entries()), 900)
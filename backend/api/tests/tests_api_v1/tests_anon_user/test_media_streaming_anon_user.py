@@ -0,0 +1,43 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from django.core.files.base import ContentFile
+
+from course.factories import LessonFactory
+from backend.faker_base import faker
+
+
+class TestAnonUserMediaStreaming(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.lesson = LessonFactory()
+    self.client = APIClient()
+
+
+  def test_anon_user_cannot_fetch_lesson_videos(self):
+    response = self.client.get(path=self.lesson.video.url, HTTP_RANGE='bytes=0-9')
+    self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+  def test_videos_are_protected_whatever_their_extension(self):
+    self.lesson.video.save('lecture', ContentFile(b'\x00\x00\x00\x18ftypmp42 video without extension'))
+    self.assertEqual(self.lesson.video.name.rsplit('/', 1)[-1].count('.'), 0)
+
+    for path in (self.lesson.video.url, self.lesson.video.url.replace('/classes/', '/classes/./')):
+      with self.subTest(path):
+        response = self.client.get(path=path)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+  def test_anon_user_can_fetch_covers(self):
+    response = self.client.get(path=self.lesson.cover.url)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(b''.join(response.streaming_content), self.lesson.cover.read())
+    self.assertTrue(response['Content-Type'].startswith('image/'))
+
+
+  def test_only_media_root_is_served(self):
+    for path in ('/media/missing.jpg', '/media/../manage.py', '/media/%2e%2e/manage.py', '/media/classes/'):
+      with self.subTest(path):
+        response = self.client.get(path=path)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
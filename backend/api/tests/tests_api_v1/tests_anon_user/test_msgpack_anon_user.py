@@ -0,0 +1,39 @@
+import msgpack
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+
+from course.factories import LessonFactory
+from backend.faker_base import faker
+
+
+class TestAnonUserMessagePack(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    cache.clear()
+    self.lesson = LessonFactory()
+    self.client = APIClient()
+
+
+  def test_cached_responses_are_rendered_in_the_negotiated_format(self):
+    json_response = self.client.get(path=reverse('lessons'), HTTP_ACCEPT='application/json; version=v1')
+    response = self.client.get(path=reverse('lessons'), HTTP_ACCEPT='application/msgpack; version=v1')
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response['Content-Type'], 'application/msgpack')
+    self.assertEqual(msgpack.unpackb(response.content), json_response.json())
+
+
+  def test_json_stays_the_default(self):
+    response = self.client.get(path=reverse('lesson', kwargs={'pk': self.lesson.pk}), HTTP_ACCEPT='*/*')
+    self.assertEqual(response['Content-Type'], 'application/json')
+    self.assertEqual(response.json()['title'], self.lesson.title)
+
+
+  def test_anon_user_cannot_post_msgpack(self):
+    response = self.client.post(
+      path=reverse('comments'), data=msgpack.packb({'text': 'text'}), content_type='application/msgpack',
+      HTTP_ACCEPT='application/msgpack; version=v1')
+    self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    self.assertIn('detail', msgpack.unpackb(response.content))
@@ -0,0 +1,72 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+from django.utils import timezone
+
+from course.factories import CategoryFactory
+from course.models import Category
+from backend.faker_base import faker
+
+
+class TestAnonUserPagination(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    for _ in range(45):
+      CategoryFactory()
+    # ties on updated_at must be broken by id
+    Category.objects.filter(pk__in=Category.objects.order_by('pk').values('pk')[:10]).update(
+      updated_at=timezone.now())
+
+    self.expected_ids = list(Category.objects.order_by('-updated_at', '-id').values_list('id', flat=True))
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def walk(self, url, key):
+    ids = []
+    while url is not None:
+      response = self.client.get(url)
+      self.assertEqual(response.status_code, status.HTTP_200_OK)
+      ids += [item['id'] for item in response.data.get('results')]
+      url = response.data.get(key)
+    return ids
+
+
+  def test_page_number_pagination_is_the_default(self):
+    response = self.client.get(path=reverse('categories'))
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response.data.get('count'), 45)
+    self.assertNotIn('cursor=', response.data.get('next'))
+
+
+  def test_anon_user_can_opt_into_cursor_pagination(self):
+    response = self.client.get(path=reverse('categories'), QUERY_STRING='pagination=cursor')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertNotIn('count', response.data)
+    self.assertIsNone(response.data.get('previous'))
+    self.assertIn('cursor=', response.data.get('next'))
+    self.assertEqual([item['id'] for item in response.data.get('results')], self.expected_ids[:20])
+
+
+  def test_cursor_pagination_walks_forward_through_every_row(self):
+    url = reverse('categories') + '?pagination=cursor&page_size=7'
+    self.assertEqual(self.walk(url, 'next'), self.expected_ids)
+
+
+  def test_cursor_pagination_walks_backwards(self):
+    url = reverse('categories') + '?pagination=cursor&page_size=7'
+    while True:
+      response = self.client.get(url)
+      if response.data.get('next') is None:
+        break
+      url = response.data.get('next')
+
+    last_page = [item['id'] for item in response.data.get('results')]
+    previous_pages = self.walk(response.data.get('previous'), 'previous')
+    self.assertCountEqual(previous_pages + last_page, self.expected_ids)
+    self.assertEqual(len(set(previous_pages)), 45 - len(last_page))
+
+
+  def test_cursor_pagination_rejects_invalid_cursor(self):
+    response = self.client.get(path=reverse('categories'), QUERY_STRING='cursor=not-a-cursor')
+    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
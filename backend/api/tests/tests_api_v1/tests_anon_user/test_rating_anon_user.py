@@ -0,0 +1,82 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+
+from course.factories import CommentFactory, CourseFactory, LessonFactory
+from backend.faker_base import faker
+
+
+class TestAnonUserRating(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    cache.clear()
+    self.course = CourseFactory()
+    self.best = LessonFactory(course=self.course)
+    self.worst = LessonFactory(course=self.course)
+    self.unrated = LessonFactory(course=self.course)
+    for stars in (5, 4):
+      CommentFactory(lesson=self.best, stars=stars)
+    CommentFactory(lesson=self.worst, stars=1)
+
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_lessons_expose_their_rating(self):
+    response = self.client.get(path=reverse('lesson', kwargs={'pk': self.best.pk}))
+    stats = response.data['stats']
+    self.assertEqual(stats['rating'], 4.5)
+    self.assertEqual(stats['star_count'], 2)
+    self.assertEqual(stats['stars']['5'], 1)
+    self.assertEqual(stats['comment_count'], 2)
+
+
+  def test_unrated_lessons_have_no_rating(self):
+    response = self.client.get(path=reverse('lesson', kwargs={'pk': self.unrated.pk}))
+    self.assertIsNone(response.data['stats']['rating'])
+
+
+  def test_courses_expose_their_rating(self):
+    response = self.client.get(path=reverse('course', kwargs={'pk': self.course.pk}))
+    self.assertEqual(response.data['stats']['rating'], 3.33)
+    self.assertEqual(response.data['stats']['star_count'], 3)
+
+
+  def test_lessons_can_be_ordered_by_rating(self):
+    response = self.client.get(path=reverse('lessons'), QUERY_STRING='order=rating')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(
+      [lesson['id'] for lesson in response.data['results']], [self.best.pk, self.worst.pk, self.unrated.pk])
+
+
+  def test_rating_order_list_is_read_without_n_plus_one(self):
+    for _ in range(5):
+      LessonFactory(course=self.course)
+    # fingerprint, count and page
+    with self.assertNumQueries(3):
+      self.client.get(path=reverse('lessons'), QUERY_STRING='order=rating')
+
+
+  def test_courses_can_be_ordered_by_rating(self):
+    better = CourseFactory()
+    CommentFactory(lesson=LessonFactory(course=better), stars=5)
+    response = self.client.get(path=reverse('courses'), QUERY_STRING='order=rating')
+    self.assertEqual([course['id'] for course in response.data['results']], [better.pk, self.course.pk])
+
+
+  def test_rating_order_is_not_available_with_cursors(self):
+    response = self.client.get(path=reverse('lessons'), QUERY_STRING='order=rating&pagination=cursor')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    response = self.client.get(path=reverse('lessons'), QUERY_STRING='order=title')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_new_comment_invalidates_cached_and_validated_lesson(self):
+    url = reverse('lesson', kwargs={'pk': self.unrated.pk})
+    etag = self.client.get(path=url)['ETag']
+
+    CommentFactory(lesson=self.unrated, stars=3)
+    response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response.data['stats']['rating'], 3)
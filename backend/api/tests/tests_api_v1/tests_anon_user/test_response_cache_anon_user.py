@@ -0,0 +1,84 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.cache import cache
+from django.urls import reverse
+
+from course.factories import CategoryFactory, CourseFactory, LessonFactory, UserFactory
+from course.models import Category
+from backend.faker_base import faker
+
+
+class TestAnonUserResponseCache(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    cache.clear()
+    self.category = CategoryFactory()
+    self.course = CourseFactory(category=self.category)
+    self.lesson = LessonFactory(course=self.course)
+
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_repeated_anon_list_is_served_from_cache(self):
+    first = self.client.get(path=reverse('courses'))
+    with self.assertNumQueries(0):
+      second = self.client.get(path=reverse('courses'))
+
+    self.assertEqual(second.status_code, status.HTTP_200_OK)
+    self.assertEqual(first.data, second.data)
+
+
+  def test_repeated_anon_retrieve_is_served_from_cache(self):
+    self.client.get(path=reverse('lesson', kwargs={'pk': self.lesson.pk}))
+    with self.assertNumQueries(0):
+      response = self.client.get(path=reverse('lesson', kwargs={'pk': self.lesson.pk}))
+    self.assertEqual(response.data['title'], self.lesson.title)
+
+
+  def test_query_params_and_pages_are_cached_separately(self):
+    self.client.get(path=reverse('courses'))
+    response = self.client.get(path=reverse('courses'), QUERY_STRING='title=does-not-exist')
+    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+  def test_saving_a_model_invalidates_its_cached_responses(self):
+    self.client.get(path=reverse('category', kwargs={'pk': self.category.pk}))
+    self.category.name = 'renamed'
+    self.category.save()
+
+    response = self.client.get(path=reverse('category', kwargs={'pk': self.category.pk}))
+    self.assertEqual(response.data['name'], 'renamed')
+
+
+  def test_deleting_a_model_invalidates_its_cached_responses(self):
+    other = CategoryFactory()
+    self.client.get(path=reverse('categories'))
+    other.delete()
+
+    response = self.client.get(path=reverse('categories'))
+    self.assertEqual([item['id'] for item in response.data['results']], [self.category.pk])
+
+
+  def test_lesson_changes_invalidate_course_lists(self):
+    self.client.get(path=reverse('courses'), QUERY_STRING='min_lessons=2')
+    LessonFactory(course=self.course)
+
+    response = self.client.get(path=reverse('courses'), QUERY_STRING='min_lessons=2')
+    self.assertEqual([item['id'] for item in response.data['results']], [self.course.pk])
+
+
+  def test_unrelated_changes_keep_the_cache(self):
+    self.client.get(path=reverse('categories'))
+    LessonFactory(course=self.course)
+    with self.assertNumQueries(0):
+      self.client.get(path=reverse('categories'))
+
+
+  def test_authenticated_requests_bypass_the_cache(self):
+    self.client.get(path=reverse('categories'))
+    Category.objects.filter(pk=self.category.pk).update(name='changed without signals')
+
+    self.client.force_authenticate(user=UserFactory())
+    response = self.client.get(path=reverse('categories'))
+    self.assertEqual(response.data['results'][0]['name'], 'changed without signals')
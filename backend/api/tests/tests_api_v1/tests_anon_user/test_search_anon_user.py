@@ -0,0 +1,54 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+
+from course.factories import CourseFactory, LessonFactory
+from backend.faker_base import faker
+
+
+class TestAnonUserSearch(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.course = CourseFactory(title='Cooking with python', description='Recipes')
+    self.lesson_1 = LessonFactory(title='Python dictionaries', course=self.course)
+    self.lesson_2 = LessonFactory(title='Loops', description='Iterating in python', course=self.course)
+    for _ in range(10):
+      LessonFactory()
+
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_anon_user_can_search_the_catalog(self):
+    response = self.client.get(path=reverse('search'), QUERY_STRING='q=python')
+    results = response.data.get('results')
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response.data.get('count'), 3)
+    self.assertCountEqual(
+      [(item['kind'], item['id']) for item in results],
+      [('course', self.course.id), ('lesson', self.lesson_1.id), ('lesson', self.lesson_2.id)])
+    self.assertEqual(sorted([item['rank'] for item in results], reverse=True), [item['rank'] for item in results])
+
+
+  def test_anon_user_can_search_by_kind(self):
+    response = self.client.get(path=reverse('search'), QUERY_STRING='q=python&kind=course')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual([item['id'] for item in response.data.get('results')], [self.course.id])
+
+
+  def test_search_results_are_paginated(self):
+    response = self.client.get(path=reverse('search'), QUERY_STRING='q=python&page_size=2')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(len(response.data.get('results')), 2)
+    self.assertIsNotNone(response.data.get('next'))
+
+
+  def test_search_without_query_is_a_bad_request(self):
+    response = self.client.get(path=reverse('search'))
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_search_with_unknown_kind_is_a_bad_request(self):
+    response = self.client.get(path=reverse('search'), QUERY_STRING='q=python&kind=user')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,91 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from course.factories import CategoryFactory, LessonFactory
+from backend.faker_base import faker
+
+
+class TestAnonUserSparseFieldsets(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    cache.clear()
+    self.lesson = LessonFactory()
+    for _ in range(3):
+      LessonFactory()
+
+    self.client = APIClient()
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def get_with_queries(self, url, query_string):
+    with CaptureQueriesContext(connection) as queries:
+      response = self.client.get(path=url, QUERY_STRING=query_string)
+    lesson_selects = [
+      query['sql'] for query in queries.captured_queries
+      if query['sql'].startswith('SELECT') and 'FROM "course_lesson"' in query['sql'] and 'COUNT(' not in query['sql']]
+    return response, lesson_selects
+
+
+  def test_fields_picks_the_returned_fields(self):
+    response = self.client.get(path=reverse('lessons'), QUERY_STRING='fields=id,title,course')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    for lesson in response.data['results']:
+      self.assertEqual(set(lesson), {'id', 'title', 'course'})
+
+
+  def test_omit_drops_fields(self):
+    response = self.client.get(path=reverse('lesson', kwargs={'pk': self.lesson.pk}), QUERY_STRING='omit=text,video')
+    self.assertNotIn('text', response.data)
+    self.assertNotIn('video', response.data)
+    self.assertEqual(response.data['title'], self.lesson.title)
+
+
+  def test_heavy_columns_are_not_read(self):
+    response, selects = self.get_with_queries(reverse('lessons'), 'fields=id,title,course')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertTrue(selects)
+    for sql in selects:
+      self.assertNotIn('"course_lesson"."text"', sql)
+      self.assertNotIn('"course_lesson"."description"', sql)
+
+
+  def test_omitted_columns_are_not_read_on_retrieve(self):
+    url = reverse('lesson', kwargs={'pk': self.lesson.pk})
+    response, selects = self.get_with_queries(url, 'omit=text')
+    self.assertEqual(response.data['description'], self.lesson.description)
+    self.assertTrue(selects)
+    self.assertNotIn('"course_lesson"."text"', selects[0])
+
+
+  def test_sparse_lists_do_not_add_queries(self):
+    url = reverse('lessons')
+    _, full = self.get_with_queries(url, '')
+    cache.clear()
+    _, sparse = self.get_with_queries(url, 'fields=title')
+    self.assertEqual(len(full), len(sparse))
+
+
+  def test_cursor_pages_still_work_with_sparse_fields(self):
+    response = self.client.get(path=reverse('lessons'), QUERY_STRING='pagination=cursor&page_size=2&fields=title')
+    self.assertEqual(set(response.data['results'][0]), {'title'})
+    response = self.client.get(response.data['next'])
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(len(response.data['results']), 2)
+
+
+  def test_sparse_responses_are_cached_and_validated_separately(self):
+    url = reverse('category', kwargs={'pk': CategoryFactory().pk})
+    full = self.client.get(path=url)
+    sparse = self.client.get(path=url, QUERY_STRING='fields=name')
+    self.assertEqual(set(sparse.data), {'name'})
+    self.assertIn('description', full.data)
+    self.assertNotEqual(full['ETag'], sparse['ETag'])
+
+
+  def test_unknown_fields_are_ignored(self):
+    response = self.client.get(path=reverse('lessons'), QUERY_STRING='fields=title,nope')
+    self.assertEqual(set(response.data['results'][0]), {'title'})
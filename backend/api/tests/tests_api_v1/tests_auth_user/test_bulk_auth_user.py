@@ -0,0 +1,120 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+
+from course.factories import LessonFactory, SaveFactory, WatchedFactory, UserFactory
+from course.models import Save, Watched
+from backend.faker_base import faker
+
+
+class TestAuthUserBulk(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.user = UserFactory()
+    self.lessons = [LessonFactory() for _ in range(5)]
+    self.save_ = SaveFactory(user=self.user, lesson=self.lessons[0])
+    self.watched = WatchedFactory(user=self.user, lesson=self.lessons[0])
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_auth_user_can_save_many_lessons_at_once(self):
+    data = [{'lesson': lesson.pk} for lesson in self.lessons[1:]]
+    response = self.client.post(path=reverse('saves'), data=data, format='json')
+
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    self.assertEqual([result['status'] for result in response.data], ['created'] * 4)
+    saves = Save.objects.filter(user=self.user)
+    self.assertEqual(saves.count(), 5)
+    self.assertCountEqual([result['id'] for result in response.data], saves.exclude(pk=self.save_.pk).values_list('pk', flat=True))
+
+
+  def test_bulk_save_query_count_does_not_grow_with_the_payload(self):
+    more_lessons = [LessonFactory() for _ in range(20)]
+    data = [{'lesson': lesson.pk} for lesson in more_lessons]
+
+    # lookup, insert and the read back of the ids
+    with self.assertNumQueries(3):
+      response = self.client.post(path=reverse('saves'), data=data, format='json')
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+  def test_bulk_save_reports_every_item(self):
+    data = [
+      {'lesson': self.lessons[0].pk},
+      {'lesson': self.lessons[1].pk},
+      {'lesson': self.lessons[1].pk},
+      {'lesson': 2 ** 31},
+      {'lesson': 'not a lesson'},
+    ]
+    response = self.client.post(path=reverse('saves'), data=data, format='json')
+
+    self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+    self.assertEqual(
+      [result['status'] for result in response.data],
+      ['exists', 'created', 'duplicate', 'invalid', 'invalid'])
+    self.assertEqual(response.data[0]['id'], self.save_.pk)
+    self.assertEqual(response.data[2]['of'], 1)
+    self.assertIn('lesson', response.data[3]['errors'])
+    self.assertEqual(Save.objects.filter(user=self.user).count(), 2)
+
+
+  def test_bulk_payload_size_is_capped(self):
+    data = [{'lesson': self.lessons[1].pk}] * 501
+    response = self.client.post(path=reverse('saves'), data=data, format='json')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_single_item_post_still_works(self):
+    response = self.client.post(path=reverse('saves'), data={'lesson': self.lessons[1].pk}, format='json')
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    self.assertEqual(response.data['lesson'], self.lessons[1].pk)
+
+
+  def test_auth_user_can_import_watched_history(self):
+    data = [{'lesson': lesson.pk, 'watched_time': 10 * index} for index, lesson in enumerate(self.lessons[1:])]
+    data.append({'lesson': self.lessons[2].pk, 'watched_time': -1})
+    response = self.client.post(path=reverse('watcheds'), data=data, format='json')
+
+    self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+    self.assertEqual([result['status'] for result in response.data], ['created'] * 4 + ['invalid'])
+    watched = Watched.objects.get(user=self.user, lesson=self.lessons[3])
+    self.assertEqual(watched.watched_time, 20)
+    self.assertIsNotNone(watched.updated_at)
+
+
+  def test_watched_import_rejects_values_past_the_column_range(self):
+    for item in ({'lesson': self.lessons[1].pk, 'watched_time': 2 ** 63}, {'lesson': 2 ** 63, 'watched_time': 1}):
+      with self.subTest(item):
+        response = self.client.post(path=reverse('watcheds'), data=[item], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0]['status'], 'invalid')
+    self.assertFalse(Watched.objects.filter(user=self.user, lesson=self.lessons[1]).exists())
+
+
+  def test_auth_user_can_delete_saves_by_lesson(self):
+    SaveFactory(user=self.user, lesson=self.lessons[1])
+    others = SaveFactory(lesson=self.lessons[2])
+
+    response = self.client.delete(
+      path=reverse('saves'),
+      data={'lessons': [self.lessons[0].pk, self.lessons[1].pk, self.lessons[2].pk]},
+      format='json')
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual([result['status'] for result in response.data], ['deleted', 'deleted', 'not_found'])
+    self.assertFalse(Save.objects.filter(user=self.user).exists())
+    self.assertTrue(Save.objects.filter(pk=others.pk).exists())
+
+
+  def test_auth_user_can_delete_saves_with_query_params(self):
+    response = self.client.delete(path=reverse('saves') + f'?lessons={self.lessons[0].pk}')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertFalse(Save.objects.filter(pk=self.save_.pk).exists())
+
+
+  def test_bulk_delete_requires_lessons(self):
+    response = self.client.delete(path=reverse('saves'))
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
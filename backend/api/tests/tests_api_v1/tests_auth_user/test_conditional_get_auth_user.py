@@ -0,0 +1,61 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+
+from course.factories import CommentFactory, SaveFactory, WatchedFactory, UserFactory
+from backend.faker_base import faker
+
+
+class TestAuthUserConditionalGet(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.user = UserFactory()
+    self.other_user = UserFactory()
+    self.watched = WatchedFactory(user=self.user)
+    self.save_ = SaveFactory(user=self.user)
+    self.comment = CommentFactory(user=self.user)
+    WatchedFactory(user=self.other_user)
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def assert_not_modified(self, url):
+    response = self.client.get(path=url)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    etag = response['ETag']
+
+    response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    self.assertEqual(response['ETag'], etag)
+    return etag
+
+
+  def test_auth_user_detail_views_answer_304(self):
+    self.assert_not_modified(reverse('watched', kwargs={'pk': self.watched.pk}))
+    self.assert_not_modified(reverse('save', kwargs={'pk': self.save_.pk}))
+    self.assert_not_modified(reverse('comment', kwargs={'pk': self.comment.pk}))
+
+
+  def test_auth_user_list_views_answer_304(self):
+    self.assert_not_modified(reverse('watcheds'))
+    self.assert_not_modified(reverse('saves'))
+    self.assert_not_modified(reverse('comments'))
+
+
+  def test_etags_are_not_shared_between_users(self):
+    etag = self.assert_not_modified(reverse('watcheds'))
+
+    self.client.force_authenticate(user=self.other_user)
+    response = self.client.get(path=reverse('watcheds'), HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+  def test_watched_update_changes_the_etag(self):
+    url = reverse('watched', kwargs={'pk': self.watched.pk})
+    etag = self.assert_not_modified(url)
+
+    self.client.patch(path=url, data={'watched_time': self.watched.watched_time + 1}, format='json')
+    response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
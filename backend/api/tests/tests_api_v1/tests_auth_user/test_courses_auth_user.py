@@ -33,11 +33,13 @@ class TestAuthUserCategories(APITestCase):
     results = response.data.get('results')
     if results == None:
       response.data['cover'] = response.data['cover'].removeprefix('http://testserver')
+      response.data['cover_srcset'] = {width: url.removeprefix('http://testserver') for width, url in response.data['cover_srcset'].items()}
       self.assertEqual(response.data, serializer.data)
       return 
     
     for item in results:
       item['cover'] = item['cover'].removeprefix('http://testserver')
+      item['cover_srcset'] = {width: url.removeprefix('http://testserver') for width, url in item['cover_srcset'].items()}
     self.assertCountEqual(response.data.get('results'), serializer.data)
     return 
   
@@ -92,9 +94,9 @@ class TestAuthUserCategories(APITestCase):
     courses = Course.objects.filter(
       title__icontains=self.course_1.title,
       category__name__icontains=self.course_1.category.name).annotate(
-        lesson_count=Count('lesson')).filter(
-          lesson_count__lte=self.course_1.lesson_set.count(),
-          lesson_count__gte=self.course_1.lesson_set.count()).only(*self.only_fields)
+        actual_lesson_count=Count('lesson')).filter(
+          actual_lesson_count__lte=self.course_1.lesson_set.count(),
+          actual_lesson_count__gte=self.course_1.lesson_set.count()).only(*self.only_fields)
     serializer = CourseSerializerV1(courses, many=True)
 
     self.assertEqual(response.status_code, status.HTTP_200_OK)
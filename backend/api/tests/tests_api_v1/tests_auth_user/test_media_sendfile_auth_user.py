@@ -0,0 +1,60 @@
+import os
+
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from course.factories import LessonFactory, UserFactory
+from backend.faker_base import faker
+
+
+ACCEL_REDIRECT = override_settings(
+  MEDIA_SENDFILE_BACKEND='x-accel-redirect', MEDIA_ACCEL_REDIRECT_LOCATIONS={settings.MEDIA_ROOT: '/internal/media/'})
+
+
+class TestAuthUserMediaSendfile(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.lesson = LessonFactory()
+    self.client = APIClient()
+    self.client.force_authenticate(user=UserFactory())
+
+
+  @ACCEL_REDIRECT
+  def test_video_transfer_is_handed_to_the_proxy(self):
+    response = self.client.get(path=self.lesson.video.url)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response['X-Accel-Redirect'], f'/internal/media/{self.lesson.video.name}')
+    self.assertEqual(response['Content-Type'], 'video/mp4')
+    self.assertFalse(response.streaming)
+    self.assertEqual(response.content, b'')
+
+
+  @ACCEL_REDIRECT
+  def test_proxy_is_only_used_once_authorized(self):
+    response = APIClient().get(path=self.lesson.video.url)
+    self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    self.assertNotIn('X-Accel-Redirect', response)
+
+
+  @override_settings(MEDIA_SENDFILE_BACKEND='x-sendfile')
+  def test_x_sendfile_gets_the_file_path(self):
+    response = self.client.get(path=self.lesson.cover.url)
+    self.assertEqual(response['X-Sendfile'], os.path.join(settings.MEDIA_ROOT, self.lesson.cover.name))
+    self.assertIn('immutable', response['Cache-Control'])
+
+
+  @override_settings(MEDIA_SENDFILE_BACKEND='x-accel-redirect', MEDIA_ACCEL_REDIRECT_LOCATIONS={})
+  def test_files_outside_the_internal_locations_are_streamed(self):
+    response = self.client.get(path=self.lesson.video.url)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertTrue(response.streaming)
+    self.assertNotIn('X-Accel-Redirect', response)
+
+
+  @override_settings(MEDIA_SENDFILE_BACKEND='sendfile')
+  def test_unknown_backend_is_a_configuration_error(self):
+    with self.assertRaises(ImproperlyConfigured):
+      self.client.get(path=self.lesson.video.url)
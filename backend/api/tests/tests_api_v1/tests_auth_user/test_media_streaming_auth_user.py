@@ -0,0 +1,91 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+
+from course.factories import LessonFactory, UserFactory
+from backend.faker_base import faker
+
+
+VIDEO = bytes(range(256)) * 40
+
+
+class TestAuthUserMediaStreaming(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.lesson = LessonFactory(video__data=VIDEO)
+    self.url = self.lesson.video.url
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=UserFactory())
+    self.client.credentials(HTTP_ACCEPT='video/*')
+
+
+  def get(self, **headers):
+    response = self.client.get(path=self.url, **headers)
+    body = b''.join(response.streaming_content) if response.streaming else response.content
+    return response, body
+
+
+  def test_whole_video_is_streamed(self):
+    response, body = self.get()
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(body, VIDEO)
+    self.assertEqual(response['Content-Type'], 'video/mp4')
+    self.assertEqual(response['Content-Length'], str(len(VIDEO)))
+    self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+
+  def test_byte_ranges_are_partial_content(self):
+    size = len(VIDEO)
+    cases = {
+      'bytes=0-9': (0, 9),
+      'bytes=100-': (100, size - 1),
+      'bytes=-256': (size - 256, size - 1),
+      'bytes=5000-99999': (5000, size - 1),
+    }
+    for header, (first, last) in cases.items():
+      with self.subTest(header):
+        response, body = self.get(HTTP_RANGE=header)
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(body, VIDEO[first:last + 1])
+        self.assertEqual(response['Content-Range'], f'bytes {first}-{last}/{size}')
+        self.assertEqual(response['Content-Length'], str(last - first + 1))
+
+
+  def test_unsatisfiable_ranges(self):
+    for header in ('bytes=20000-', 'bytes=-0'):
+      with self.subTest(header):
+        response, _ = self.get(HTTP_RANGE=header)
+        self.assertEqual(response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(VIDEO)}')
+
+
+  def test_ranges_the_server_may_ignore_get_the_whole_video(self):
+    for header in ('bytes=0-1,5-6', 'items=0-1', 'bytes=9-2', 'bytes=x-y'):
+      with self.subTest(header):
+        response, body = self.get(HTTP_RANGE=header)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(body, VIDEO)
+
+
+  def test_if_range(self):
+    etag = self.get()[0]['ETag']
+    response, body = self.get(HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE=etag)
+    self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+    self.assertEqual(body, VIDEO[:10])
+
+    response, body = self.get(HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(body, VIDEO)
+
+
+  def test_conditional_get(self):
+    etag = self.get()[0]['ETag']
+    response, _ = self.get(HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+  def test_head_has_the_headers_without_the_body(self):
+    response = self.client.head(path=self.url, HTTP_RANGE='bytes=0-9')
+    self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+    self.assertEqual(response['Content-Length'], '10')
+    self.assertEqual(response.content, b'')
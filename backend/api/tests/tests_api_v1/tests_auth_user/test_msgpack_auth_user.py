@@ -0,0 +1,99 @@
+import msgpack
+from datetime import datetime, timezone
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+
+from course.factories import CommentFactory, LessonFactory, SaveFactory, WatchedFactory, UserFactory
+from course.models import Watched
+from backend.faker_base import faker
+
+
+MSGPACK = 'application/msgpack; version=v1'
+
+
+class TestAuthUserMessagePack(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.user = UserFactory()
+    self.lessons = [LessonFactory() for _ in range(3)]
+    for lesson in self.lessons:
+      WatchedFactory(user=self.user, lesson=lesson)
+      SaveFactory(user=self.user, lesson=lesson)
+      CommentFactory(lesson=lesson)
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT=MSGPACK)
+
+    self.json_client = APIClient()
+    self.json_client.force_authenticate(user=self.user)
+    self.json_client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_lists_are_negotiated_as_msgpack(self):
+    for name in ('watcheds', 'comments', 'lessons', 'saves', 'courses', 'categories'):
+      with self.subTest(name):
+        response = self.client.get(path=reverse(name))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+
+        json_response = self.json_client.get(path=reverse(name))
+        self.assertEqual(msgpack.unpackb(response.content), json_response.json())
+        self.assertLess(len(response.content), len(json_response.content))
+
+
+  def test_errors_are_rendered_as_msgpack(self):
+    response = self.client.get(path=reverse('watched', kwargs={'pk': 0}))
+    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    self.assertIn('detail', msgpack.unpackb(response.content))
+
+
+  def test_unknown_version_is_not_acceptable(self):
+    client = APIClient()
+    client.force_authenticate(user=self.user)
+    response = client.get(path=reverse('watcheds'), HTTP_ACCEPT='application/msgpack; version=v9')
+    self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+
+
+  def test_msgpack_bodies_are_parsed(self):
+    lesson = LessonFactory()
+    response = self.client.post(
+      path=reverse('watcheds'), data={'lesson': lesson.pk, 'watched_time': 30}, format='msgpack')
+
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    self.assertEqual(msgpack.unpackb(response.content)['watched_time'], 30)
+    self.assertEqual(Watched.objects.get(user=self.user, lesson=lesson).watched_time, 30)
+
+
+  def test_msgpack_bulk_bodies_are_parsed(self):
+    lessons = [LessonFactory() for _ in range(3)]
+    data = [{'lesson': lesson.pk, 'watched_time': 10} for lesson in lessons]
+    response = self.client.post(path=reverse('watcheds'), data=data, format='msgpack')
+
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    self.assertEqual([result['status'] for result in msgpack.unpackb(response.content)], ['created'] * 3)
+
+
+  def test_msgpack_timestamps_are_accepted_as_datetimes(self):
+    parsed = self.client.post(
+      path=reverse('watcheds'),
+      data=msgpack.packb({'lesson': LessonFactory().pk, 'watched_time': 1,
+                          'created_at': datetime(2024, 1, 1, tzinfo=timezone.utc)}, datetime=True),
+      content_type='application/msgpack')
+    self.assertEqual(parsed.status_code, status.HTTP_201_CREATED)
+
+
+  def test_malformed_msgpack_is_a_bad_request(self):
+    response = self.client.post(path=reverse('watcheds'), data=b'\xc1', content_type='application/msgpack')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    response = self.client.post(path=reverse('watcheds'), data=b'\x81\x01\x02', content_type='application/msgpack')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_json_and_msgpack_have_their_own_etags(self):
+    url = reverse('watched', kwargs={'pk': Watched.objects.filter(user=self.user).first().pk})
+    etag = self.client.get(path=url)['ETag']
+    self.assertNotEqual(self.json_client.get(path=url)['ETag'], etag)
+    response = self.client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,50 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+
+from course.factories import CategoryFactory, LessonFactory, WatchedFactory, UserFactory
+from course.models import Category
+from backend.faker_base import faker
+
+
+class TestAuthUserSparseFieldsets(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.user = UserFactory()
+    self.user.is_staff = True
+    self.user.save()
+    self.watched = WatchedFactory(user=self.user)
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def test_writes_ignore_sparse_fieldsets(self):
+    category = CategoryFactory()
+    response = self.client.patch(
+      path=reverse('category', kwargs={'pk': category.pk}) + '?fields=id',
+      data={'description': 'changed'}, format='json')
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertIn('description', response.data)
+    category.refresh_from_db()
+    self.assertEqual(category.description, 'changed')
+    self.assertEqual(category.name, Category.objects.get(pk=category.pk).name)
+
+
+  def test_sparse_watched_list_reads_no_extra_rows(self):
+    for _ in range(5):
+      WatchedFactory(user=self.user)
+    with self.assertNumQueries(3):
+      response = self.client.get(path=reverse('watcheds'), QUERY_STRING='fields=id,watched_time')
+    self.assertEqual(set(response.data['results'][0]), {'id', 'watched_time'})
+
+
+  def test_sparse_lesson_create_is_not_partial(self):
+    response = self.client.post(
+      path=reverse('lessons') + '?fields=id',
+      data={'title': 'A new lesson', 'course': LessonFactory().course.pk, 'author': self.user.pk, 'text': 'text'},
+      format='json')
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    self.assertIn('title', response.data)
@@ -0,0 +1,48 @@
+import shutil
+import tempfile
+
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.test import override_settings
+from django.urls import reverse
+
+from course.factories import LessonFactory, UserFactory
+from course.models import VideoUpload
+from api.utils.uploads import create_part
+from backend.faker_base import faker
+
+
+class TestAuthUserVideoUpload(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.upload_dir = tempfile.mkdtemp()
+    self.settings_override = override_settings(VIDEO_UPLOAD_DIR=self.upload_dir)
+    self.settings_override.enable()
+
+    self.lesson = LessonFactory()
+    staff = UserFactory(is_staff=True)
+    self.upload = VideoUpload.objects.create(lesson=self.lesson, user=staff, filename='video.mp4', length=10)
+    create_part(self.upload)
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=UserFactory())
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.upload_dir)
+
+
+  def test_auth_user_cannot_start_an_upload(self):
+    response = self.client.post(
+      path=reverse('lesson-video-uploads', kwargs={'pk': self.lesson.pk}), HTTP_UPLOAD_LENGTH='10')
+    self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+  def test_auth_user_cannot_touch_uploads_of_others(self):
+    url = reverse('video-upload', kwargs={'pk': self.upload.pk})
+    self.assertEqual(self.client.head(url).status_code, status.HTTP_403_FORBIDDEN)
+    response = self.client.generic(
+      'PATCH', url, b'0123456789', content_type='application/offset+octet-stream', HTTP_UPLOAD_OFFSET='0')
+    self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    self.assertEqual(VideoUpload.objects.get().offset, 0)
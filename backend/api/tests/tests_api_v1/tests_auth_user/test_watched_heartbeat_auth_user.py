@@ -0,0 +1,129 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.test import override_settings
+from django.urls import reverse
+
+from course.factories import WatchedFactory, LessonFactory, UserFactory
+from course.models import Watched
+from api.utils.heartbeats import WatchedHeartbeatBuffer, get_heartbeat_buffer
+from backend.faker_base import faker
+
+
+class TestAuthUserWatchedHeartbeat(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.user = UserFactory()
+    self.lesson = LessonFactory()
+    self.watched = WatchedFactory(user=self.user, lesson=self.lesson, watched_time=10)
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def heartbeat(self, lesson, watched_time):
+    return self.client.post(
+      path=reverse('watched-heartbeat'), data={'lesson': lesson.pk, 'watched_time': watched_time}, format='json')
+
+
+  @override_settings(WATCHED_HEARTBEAT_FLUSH_INTERVAL=0)
+  def test_heartbeat_without_buffering_is_written_straight_away(self):
+    lesson = LessonFactory()
+    response = self.heartbeat(lesson, 30)
+
+    self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+    self.assertEqual(Watched.objects.get(user=self.user, lesson=lesson).watched_time, 30)
+
+
+  @override_settings(WATCHED_HEARTBEAT_FLUSH_INTERVAL=3600)
+  def test_heartbeats_are_coalesced_and_merged_into_the_list(self):
+    buffer = get_heartbeat_buffer()
+    self.addCleanup(buffer.stop)
+
+    with self.assertNumQueries(0):
+      for watched_time in (40, 60, 50):
+        self.assertEqual(self.heartbeat(self.lesson, watched_time).status_code, status.HTTP_202_ACCEPTED)
+
+    self.watched.refresh_from_db()
+    self.assertEqual(self.watched.watched_time, 10)
+
+    response = self.client.get(path=reverse('watcheds'))
+    self.assertEqual(response.data['results'][0]['watched_time'], 60)
+
+    self.assertEqual(buffer.flush(), 1)
+    self.watched.refresh_from_db()
+    self.assertEqual(self.watched.watched_time, 60)
+
+
+  @override_settings(WATCHED_HEARTBEAT_FLUSH_INTERVAL=3600)
+  def test_pending_heartbeats_change_the_list_etag(self):
+    self.addCleanup(get_heartbeat_buffer().stop)
+    etag = self.client.get(path=reverse('watcheds'))['ETag']
+
+    self.heartbeat(self.lesson, 90)
+    response = self.client.get(path=reverse('watcheds'), HTTP_IF_NONE_MATCH=etag)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+  @override_settings(WATCHED_HEARTBEAT_FLUSH_INTERVAL=3600)
+  def test_cursor_pages_are_walked_once_with_a_pending_heartbeat(self):
+    self.addCleanup(get_heartbeat_buffer().stop)
+    for _ in range(4):
+      WatchedFactory(user=self.user)
+    expected = list(Watched.objects.filter(user=self.user).order_by('-updated_at', '-id').values_list('id', flat=True))
+    # the last row of the first page, the one its cursor is taken from
+    watched = Watched.objects.get(pk=expected[1])
+    self.heartbeat(watched.lesson, watched.watched_time + 100)
+
+    ids, url = [], reverse('watcheds') + '?pagination=cursor&page_size=2'
+    while url is not None:
+      response = self.client.get(url)
+      self.assertEqual(response.status_code, status.HTTP_200_OK)
+      ids += [item['id'] for item in response.data['results']]
+      url = response.data['next']
+      self.assertLessEqual(len(ids), len(expected))
+
+    self.assertEqual(ids, expected)
+
+
+  def test_heartbeat_rejects_negative_time(self):
+    response = self.heartbeat(self.lesson, -1)
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_heartbeat_rejects_values_past_the_column_range(self):
+    for data in ({'lesson': self.lesson.pk, 'watched_time': 10 ** 20}, {'lesson': 2 ** 63, 'watched_time': 1}):
+      with self.subTest(data):
+        response = self.client.post(path=reverse('watched-heartbeat'), data=data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_rows_the_database_refuses_do_not_block_the_others(self):
+    other = WatchedFactory(watched_time=0)
+    buffer = WatchedHeartbeatBuffer(flush_interval=3600)
+    buffer.add(self.user.pk, self.lesson.pk, 10 ** 20)
+    buffer.add(other.user_id, other.lesson_id, 45)
+
+    with self.assertLogs('api.utils.heartbeats.watched_heartbeat_buffer', 'ERROR'):
+      self.assertEqual(buffer.flush(), 2)
+    other.refresh_from_db()
+    self.assertEqual(other.watched_time, 45)
+    self.assertEqual(buffer.get_pending([(self.user.pk, self.lesson.pk), (other.user_id, other.lesson_id)]), {})
+    buffer.stop()
+
+
+  def test_anon_user_cannot_send_heartbeats(self):
+    self.client.force_authenticate(user=None)
+    response = self.heartbeat(self.lesson, 20)
+    self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+  def test_stop_flushes_pending_heartbeats(self):
+    buffer = WatchedHeartbeatBuffer(flush_interval=3600)
+    buffer.add(self.user.pk, self.lesson.pk, 70)
+    buffer.add(self.user.pk, self.lesson.pk, 20)
+    buffer.stop()
+
+    self.watched.refresh_from_db()
+    self.assertEqual(self.watched.watched_time, 70)
+    self.assertEqual(buffer.get_pending([(self.user.pk, self.lesson.pk)]), {})
@@ -0,0 +1,94 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+
+from course.factories import LessonFactory, WatchedFactory, UserFactory
+from course.models import Watched
+from backend.faker_base import faker
+
+
+class TestAuthUserWatchedUpsert(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.user = UserFactory()
+    self.lesson = LessonFactory()
+    self.watched = WatchedFactory(user=self.user, lesson=self.lesson, watched_time=50)
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def put(self, lesson_id, watched_time):
+    return self.client.put(
+      path=reverse('watched-lesson', kwargs={'lesson_id': lesson_id}),
+      data={'watched_time': watched_time}, format='json')
+
+
+  def test_first_put_creates_the_watched(self):
+    lesson = LessonFactory()
+    with self.assertNumQueries(1):
+      response = self.put(lesson.pk, 30)
+
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    watched = Watched.objects.get(user=self.user, lesson=lesson)
+    self.assertEqual(response.data['id'], watched.pk)
+    self.assertEqual(response.data['watched_time'], 30)
+    self.assertEqual(response.data['user'], self.user.pk)
+
+
+  def test_put_raises_existing_progress(self):
+    response = self.put(self.lesson.pk, 80)
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response.data['id'], self.watched.pk)
+    self.watched.refresh_from_db()
+    self.assertEqual(self.watched.watched_time, 80)
+    self.assertEqual(response.data['updated_at'], self.watched.updated_at.isoformat().replace('+00:00', 'Z'))
+
+
+  def test_put_keeps_the_greater_progress(self):
+    updated_at = self.watched.updated_at
+    response = self.put(self.lesson.pk, 10)
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response.data['watched_time'], 50)
+    self.watched.refresh_from_db()
+    self.assertEqual(self.watched.watched_time, 50)
+    self.assertEqual(self.watched.updated_at, updated_at)
+
+
+  def test_put_does_not_touch_other_users_progress(self):
+    other = WatchedFactory(lesson=self.lesson, watched_time=5)
+    self.put(self.lesson.pk, 90)
+    other.refresh_from_db()
+    self.assertEqual(other.watched_time, 5)
+
+
+  def test_put_on_missing_lesson_is_404(self):
+    response = self.put(2 ** 31, 10)
+    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    self.assertEqual(Watched.objects.count(), 1)
+
+
+  def test_put_rejects_negative_time(self):
+    response = self.put(self.lesson.pk, -5)
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_put_rejects_time_past_the_column_range(self):
+    response = self.put(self.lesson.pk, 9223372036854775808)
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    self.watched.refresh_from_db()
+    self.assertEqual(self.watched.watched_time, 50)
+
+
+  def test_put_on_lesson_id_past_the_column_range_is_404(self):
+    response = self.put(2 ** 63, 10)
+    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+  def test_anon_user_cannot_upsert(self):
+    self.client.force_authenticate(user=None)
+    response = self.put(self.lesson.pk, 10)
+    self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,100 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.urls import reverse
+from django.db import connection
+from django.db.models.signals import post_init
+from django.test.utils import CaptureQueriesContext
+
+from course.factories import CommentFactory, WatchedFactory, UserFactory, LessonFactory
+from course.models import Category, Course, Lesson, Comment, Watched
+from backend.faker_base import faker
+
+
+PAGE_SIZE = 20
+
+
+class TestStaffUserBoundedLists(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    lesson = LessonFactory()
+    for _ in range(2 * PAGE_SIZE + 5):
+      WatchedFactory()
+      CommentFactory(lesson=lesson)
+
+    self.user = UserFactory()
+    self.user.is_staff = True
+    self.user.save()
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def get_counting_instances(self, url, model):
+    instances = []
+    def count_instance(sender, instance, **kwargs):
+      instances.append(instance)
+
+    post_init.connect(count_instance, sender=model)
+    try:
+      with CaptureQueriesContext(connection) as queries:
+        response = self.client.get(url)
+    finally:
+      post_init.disconnect(count_instance, sender=model)
+    return response, len(instances), queries
+
+
+  def assert_list_is_bounded(self, url, model):
+    table = model._meta.db_table
+    response, instances, queries = self.get_counting_instances(url, model)
+
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    # keyset pages fetch one extra row to know whether a next page exists
+    self.assertLessEqual(instances, PAGE_SIZE + 1)
+    for query in queries.captured_queries:
+      sql = query['sql']
+      if not sql.startswith('SELECT') or f'FROM "{table}"' not in sql:
+        continue
+      # COUNT(*) for the paginator, MAX/COUNT for the conditional GET fingerprint
+      self.assertTrue(
+        'LIMIT' in sql or sql.startswith('SELECT COUNT(*)') or sql.startswith('SELECT MAX('),
+        f'unbounded query over {table}: {sql}')
+
+
+  def test_staff_watcheds_list_only_materializes_one_page(self):
+    self.assert_list_is_bounded(reverse('watcheds'), Watched)
+
+
+  def test_staff_comments_list_only_materializes_one_page(self):
+    self.assert_list_is_bounded(reverse('comments'), Comment)
+
+
+  def test_lessons_list_only_materializes_one_page(self):
+    self.assert_list_is_bounded(reverse('lessons'), Lesson)
+
+
+  def test_courses_list_only_materializes_one_page(self):
+    self.assert_list_is_bounded(reverse('courses'), Course)
+
+
+  def test_categories_list_only_materializes_one_page(self):
+    self.assert_list_is_bounded(reverse('categories'), Category)
+
+
+  def test_cursor_paginated_list_only_materializes_one_page(self):
+    self.assert_list_is_bounded(reverse('watcheds') + '?pagination=cursor', Watched)
+
+
+  def test_materialized_rows_do_not_grow_with_the_table(self):
+    _, small_table, _ = self.get_counting_instances(reverse('watcheds'), Watched)
+    for _ in range(3 * PAGE_SIZE):
+      WatchedFactory()
+    _, large_table, _ = self.get_counting_instances(reverse('watcheds'), Watched)
+
+    self.assertEqual(small_table, large_table)
+
+
+  def test_empty_filtered_list_still_returns_404(self):
+    Watched.objects.all().delete()
+    response = self.client.get(reverse('watcheds'))
+    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,125 @@
+import hashlib
+import io
+from unittest import mock
+
+from PIL import Image
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+
+from course.factories import CourseFactory, LessonFactory, UserFactory
+from course.models import Course, Lesson
+from api.utils.images import CoverPipeline, encode_blurhash, process_cover
+from api.utils.images.cover_pipeline import apply_processed_cover
+from backend.faker_base import faker
+
+
+ORIENTATION = 0x0112
+
+
+def photo(width, height, rotated=False, image_format='JPEG', mode='RGB'):
+  image = Image.linear_gradient('L').resize((width, height)).convert(mode)
+  exif = Image.Exif()
+  exif[ORIENTATION] = 6 if rotated else 1
+  output = io.BytesIO()
+  image.save(output, image_format, exif=exif)
+  return output.getvalue()
+
+
+@override_settings(COVER_PROCESSING_WORKERS=0)
+class TestStaffUserCoverPipeline(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.course = CourseFactory()
+    self.lesson = LessonFactory()
+
+    self.user = UserFactory()
+    self.user.is_staff = True
+    self.user.save()
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def upload(self, url, data, method='patch'):
+    with self.captureOnCommitCallbacks(execute=True):
+      return getattr(self.client, method)(path=url, data=data, format='multipart')
+
+
+  def test_uploaded_cover_is_processed_after_commit(self):
+    cover = SimpleUploadedFile('phone.jpg', photo(3000, 2000, rotated=True), content_type='image/jpeg')
+    response = self.upload(reverse('course', kwargs={'pk': self.course.pk}), {'cover': cover})
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    self.course.refresh_from_db()
+    # rotated by its EXIF orientation, then scaled down to the maximum dimension
+    self.assertEqual((self.course.cover_width, self.course.cover_height), (1707, 2560))
+    self.assertEqual(len(self.course.cover_placeholder), 28)
+
+    with Image.open(self.course.cover) as image:
+      self.assertEqual(image.size, (1707, 2560))
+      self.assertEqual(image.format, 'JPEG')
+      self.assertNotIn(ORIENTATION, image.getexif())
+
+
+  def test_placeholder_is_exposed_once_processed(self):
+    cover = SimpleUploadedFile('cover.jpg', photo(400, 300), content_type='image/jpeg')
+    self.upload(reverse('lesson', kwargs={'pk': self.lesson.pk}), {'cover': cover})
+
+    response = self.client.get(reverse('lesson', kwargs={'pk': self.lesson.pk}))
+    self.assertEqual(response.data['cover_width'], 400)
+    self.assertEqual(response.data['cover_height'], 300)
+    self.assertEqual(response.data['cover_placeholder'], Lesson.objects.get(pk=self.lesson.pk).cover_placeholder)
+    self.assertTrue(response.data['cover'].endswith('.jpg'))
+
+
+  def test_transparent_covers_stay_png(self):
+    cover = SimpleUploadedFile('logo.png', photo(64, 64, image_format='PNG', mode='RGBA'), content_type='image/png')
+    self.upload(reverse('course', kwargs={'pk': self.course.pk}), {'cover': cover})
+
+    self.course.refresh_from_db()
+    self.assertTrue(self.course.cover.name.endswith('.png'))
+    self.assertEqual(self.course.cover_width, 64)
+
+
+  def test_processed_cover_is_sharded_once_under_upload_to(self):
+    cover = SimpleUploadedFile('cover.jpg', photo(200, 100), content_type='image/jpeg')
+    self.upload(reverse('course', kwargs={'pk': self.course.pk}), {'cover': cover})
+
+    self.course.refresh_from_db()
+    digest = hashlib.sha256(self.course.cover.read()).hexdigest()
+    self.assertEqual(self.course.cover.name, f'courses/{digest[:2]}/{digest[2:4]}/{digest}.jpg')
+
+
+  def test_metadata_is_cleared_until_the_new_cover_is_processed(self):
+    Course.objects.filter(pk=self.course.pk).update(cover_width=10, cover_height=10, cover_placeholder='x')
+    cover = SimpleUploadedFile('cover.jpg', photo(200, 100), content_type='image/jpeg')
+    response = self.client.patch(
+      path=reverse('course', kwargs={'pk': self.course.pk}), data={'cover': cover}, format='multipart')
+
+    self.assertIsNone(response.data['cover_width'])
+    self.assertEqual(response.data['cover_placeholder'], '')
+
+
+  def test_updates_without_a_cover_do_not_reprocess(self):
+    with mock.patch.object(CoverPipeline, 'schedule') as schedule:
+      response = self.client.patch(path=reverse('course', kwargs={'pk': self.course.pk}), data={'description': 'updated'})
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    schedule.assert_not_called()
+
+
+  def test_replaced_cover_is_not_overwritten_by_a_stale_result(self):
+    name = self.course.cover.name
+    processed = process_cover(photo(100, 100))
+    Course.objects.filter(pk=self.course.pk).update(cover='courses/other.jpg')
+
+    apply_processed_cover(Course, self.course.pk, name, processed)
+    self.assertEqual(Course.objects.get(pk=self.course.pk).cover.name, 'courses/other.jpg')
+
+
+  def test_blurhash_of_a_flat_image(self):
+    # a single color only has the DC component, which encodes the color itself
+    self.assertEqual(encode_blurhash(Image.new('RGB', (8, 8), (255, 0, 0)), components=(1, 1)), '00TI:j')
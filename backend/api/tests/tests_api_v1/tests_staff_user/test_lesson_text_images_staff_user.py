@@ -0,0 +1,141 @@
+import io
+import shutil
+import tempfile
+
+from PIL import Image
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse
+
+from course.factories import LessonFactory, UserFactory
+from course.models import Lesson
+from api.utils.images import INLINE_IMAGE_DIRECTORY, inline_image_name, render_lesson_text
+from backend.faker_base import faker
+
+
+def picture(width, height, image_format='PNG'):
+  output = io.BytesIO()
+  Image.linear_gradient('L').resize((width, height)).convert('RGB').save(output, image_format)
+  return output.getvalue()
+
+
+def animation(width, height):
+  frames = [Image.new('RGB', (width, height), color) for color in ('red', 'blue')]
+  output = io.BytesIO()
+  frames[0].save(output, 'GIF', save_all=True, append_images=frames[1:])
+  return output.getvalue()
+
+
+class TestStaffUserLessonTextImages(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.cache_dir = tempfile.mkdtemp()
+    self.settings_override = override_settings(COVER_CACHE_DIR=self.cache_dir)
+    self.settings_override.enable()
+
+    self.user = UserFactory()
+    self.user.is_staff = True
+    self.user.save()
+
+    self.client = APIClient()
+    self.client.force_login(self.user)
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.cache_dir)
+
+
+  def upload(self, name, data):
+    response = self.client.post(
+      reverse('ck_editor_5_upload_file'), {'upload': SimpleUploadedFile(name, data)}, format='multipart')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    return response.json()['url']
+
+
+  def test_editor_uploads_are_scaled_down_and_recompressed(self):
+    url = self.upload('diagram.png', picture(3000, 1500))
+    name = inline_image_name(url)
+    self.assertIsNotNone(name)
+    self.assertTrue(name.startswith(INLINE_IMAGE_DIRECTORY))
+
+    with default_storage.open(name) as file, Image.open(file) as image:
+      self.assertEqual(image.size, (1280, 640))
+      self.assertEqual(image.format, 'JPEG')
+
+
+  def test_same_editor_upload_is_stored_once(self):
+    first = self.upload('first.png', picture(500, 250))
+    second = self.upload('second.png', picture(500, 250))
+    self.assertEqual(first, second)
+
+
+  def test_animated_editor_uploads_are_kept(self):
+    name = inline_image_name(self.upload('loop.gif', animation(40, 20)))
+    with default_storage.open(name) as file, Image.open(file) as image:
+      self.assertTrue(image.is_animated)
+
+
+  def test_saved_text_images_get_dimensions_and_srcset(self):
+    url = self.upload('diagram.png', picture(800, 400))
+    lesson = LessonFactory(text=f'<p>Look:</p>\n<figure class="image"><img src="{url}" alt="a &amp; b"></figure>')
+
+    html = Lesson.objects.get(pk=lesson.pk).text_html
+    self.assertIn('width="800" height="400"', html)
+    self.assertIn('loading="lazy" decoding="async"', html)
+    self.assertIn('alt="a &amp; b"', html)
+    self.assertIn(f'{url} 800w', html)
+    name = inline_image_name(url)
+    for width in (160, 320, 640):
+      self.assertIn(reverse('lesson-text-image', kwargs={'width': width, 'name': name}) + f' {width}w', html)
+    self.assertTrue(html.startswith('<p>Look:</p>\n<figure class="image"><img '))
+
+
+  def test_other_images_are_only_lazily_loaded(self):
+    text = '<p><img src="https://example.com/a.png" width="10"> text</p>'
+    self.assertEqual(
+      render_lesson_text(text),
+      '<p><img src="https://example.com/a.png" width="10" loading="lazy" decoding="async"> text</p>')
+    self.assertEqual(render_lesson_text('<p>no images</p>'), '<p>no images</p>')
+    self.assertIsNone(render_lesson_text(None))
+
+
+  def test_rendered_text_is_served_and_follows_updates(self):
+    lesson = LessonFactory(text='<p>old</p>')
+    url = self.upload('diagram.png', picture(400, 200))
+    response = self.client.patch(
+      reverse('lesson', kwargs={'pk': lesson.pk}), {'text': f'<p><img src="{url}"></p>'}, format='json')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    # the rendered html is read back as the text, it is not sent twice
+    self.assertIn('width="400" height="200"', response.data['text'])
+    self.assertNotIn('text_html', response.data)
+    self.assertEqual(Lesson.objects.get(pk=lesson.pk).text, f'<p><img src="{url}"></p>')
+
+    response = self.client.get(reverse('lesson', kwargs={'pk': lesson.pk}), QUERY_STRING='fields=id,text')
+    self.assertEqual(response.data['text'], Lesson.objects.get(pk=lesson.pk).text_html)
+
+    lesson.text = '<p>plain</p>'
+    lesson.save(update_fields=['text'])
+    self.assertEqual(Lesson.objects.get(pk=lesson.pk).text_html, '<p>plain</p>')
+
+
+  def test_text_image_derivatives_are_served(self):
+    name = inline_image_name(self.upload('diagram.png', picture(800, 400)))
+    # public, like the lessons embedding them
+    response = APIClient().get(
+      reverse('lesson-text-image', kwargs={'width': 320, 'name': name}), HTTP_ACCEPT='image/webp')
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(response['Content-Type'], 'image/webp')
+    with Image.open(io.BytesIO(b''.join(response.streaming_content))) as image:
+      self.assertEqual(image.size, (320, 160))
+
+
+  def test_only_text_images_have_derivatives(self):
+    for name in ('classes/ab/cd/' + 'a' * 64 + '.jpg', INLINE_IMAGE_DIRECTORY + '../secret.jpg'):
+      response = self.client.get(reverse('lesson-text-image', kwargs={'width': 320, 'name': name}))
+      self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -32,12 +32,14 @@ class TestStaffUserLessons(APITestCase):
     results = response.data.get('results')
     if results == None:
       response.data['cover'] = response.data['cover'].removeprefix('http://testserver')
+      response.data['cover_srcset'] = {width: url.removeprefix('http://testserver') for width, url in response.data['cover_srcset'].items()}
       response.data['video'] = response.data['video'].removeprefix('http://testserver')
       self.assertEqual(response.data, serializer.data)
       return 
     
     for item in results:
       item['cover'] = item['cover'].removeprefix('http://testserver')
+      item['cover_srcset'] = {width: url.removeprefix('http://testserver') for width, url in item['cover_srcset'].items()}
       item['video'] = item['video'].removeprefix('http://testserver')
       
     self.assertCountEqual(response.data.get('results'), serializer.data)
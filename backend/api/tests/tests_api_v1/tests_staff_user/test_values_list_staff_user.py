@@ -0,0 +1,102 @@
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import serializers, status
+from django.db.models.signals import post_init
+from django.urls import reverse
+from django.utils import timezone
+
+from api.serializers import CommentSerializerV1, LessonSerializerV1, SaveSerializerV1, WatchedSerializerV1
+from api.utils.heartbeats import get_heartbeat_buffer
+from api.utils.serializers import row_converters
+from course.factories import CommentFactory, SaveFactory, WatchedFactory, UserFactory
+from course.models import Comment, Save, Watched
+from backend.faker_base import faker
+
+
+class TestStaffUserValuesLists(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    for stars in (None, 0, 5):
+      comment = CommentFactory(stars=stars)
+      CommentFactory(lesson=comment.lesson, comment_fk=comment, text=None)
+      SaveFactory()
+      WatchedFactory()
+
+    self.user = UserFactory()
+    self.user.is_staff = True
+    self.user.save()
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+
+  def get_without_instances(self, url, model, query_string=''):
+    instances = []
+    def count_instance(sender, instance, **kwargs):
+      instances.append(instance)
+
+    post_init.connect(count_instance, sender=model)
+    try:
+      response = self.client.get(path=url, QUERY_STRING=query_string)
+    finally:
+      post_init.disconnect(count_instance, sender=model)
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertEqual(instances, [])
+    return response
+
+
+  def test_lists_match_the_v1_serializers_without_model_instances(self):
+    cases = (
+      ('comments', Comment, CommentSerializerV1),
+      ('saves', Save, SaveSerializerV1),
+      ('watcheds', Watched, WatchedSerializerV1),
+    )
+    for name, model, serializer_class in cases:
+      with self.subTest(name):
+        response = self.get_without_instances(reverse(name), model)
+        expected = serializer_class(list(model.objects.order_by('-updated_at')), many=True).data
+        self.assertEqual(response.data['results'], expected)
+
+
+  def test_sparse_and_cursor_pages_use_rows(self):
+    response = self.get_without_instances(reverse('comments'), Comment, 'fields=id,stars&pagination=cursor&page_size=2')
+    self.assertEqual([set(comment) for comment in response.data['results']], [{'id', 'stars'}] * 2)
+
+    response = self.get_without_instances(response.data['next'], Comment)
+    self.assertEqual(len(response.data['results']), 2)
+
+
+  def test_rows_see_unflushed_heartbeats(self):
+    watched = Watched.objects.first()
+    get_heartbeat_buffer().add(watched.user_id, watched.lesson_id, watched.watched_time + 100)
+    try:
+      response = self.get_without_instances(reverse('watcheds'), Watched)
+    finally:
+      get_heartbeat_buffer().flush()
+
+    results = {result['id']: result for result in response.data['results']}
+    self.assertEqual(results[watched.pk]['watched_time'], watched.watched_time + 100)
+
+
+  def test_instances_are_used_when_a_field_needs_them(self):
+    self.assertIsNone(row_converters(LessonSerializerV1()))
+
+    class CommentWithUsernameSerializer(CommentSerializerV1):
+      username = serializers.CharField(source='user.username')
+
+      class Meta(CommentSerializerV1.Meta):
+        fields = CommentSerializerV1.Meta.fields + ['username']
+
+    self.assertIsNone(row_converters(CommentWithUsernameSerializer()))
+    self.assertEqual(
+      [column for _, column, _ in row_converters(CommentSerializerV1())],
+      ['id', 'user_id', 'lesson_id', 'text', 'stars', 'comment_fk_id', 'created_at', 'updated_at'])
+
+
+  def test_rows_and_instances_render_the_same_datetimes_in_any_time_zone(self):
+    rows = Comment.objects.order_by('pk').values('id', 'user_id', 'lesson_id', 'text', 'stars', 'comment_fk_id', 'created_at', 'updated_at')
+    for zone in ('UTC', 'America/Sao_Paulo', 'Asia/Kolkata'):
+      with self.subTest(zone), timezone.override(zone):
+        self.assertEqual(
+          CommentSerializerV1(list(rows), many=True).data,
+          CommentSerializerV1(list(Comment.objects.order_by('pk')), many=True).data)
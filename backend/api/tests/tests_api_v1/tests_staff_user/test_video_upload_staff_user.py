@@ -0,0 +1,198 @@
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from rest_framework.test import APITestCase, APIClient
+from rest_framework import status
+from django.test import override_settings
+from django.urls import reverse
+
+from api.utils.uploads import resumable_upload
+from course.factories import LessonFactory, UserFactory
+from course.models import VideoUpload
+from backend.faker_base import faker
+
+
+VIDEO = os.urandom(300 * 1024)
+CHUNK = 'application/offset+octet-stream'
+
+
+def b64(value : bytes | str) -> str:
+  return base64.b64encode(value.encode() if isinstance(value, str) else value).decode()
+
+
+class TestStaffUserVideoUpload(APITestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.upload_dir = tempfile.mkdtemp()
+    self.settings_override = override_settings(VIDEO_UPLOAD_DIR=self.upload_dir)
+    self.settings_override.enable()
+
+    self.lesson = LessonFactory()
+    self.user = UserFactory()
+    self.user.is_staff = True
+    self.user.save()
+
+    self.client = APIClient()
+    self.client.force_authenticate(user=self.user)
+    self.client.credentials(HTTP_TUS_RESUMABLE='1.0.0')
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.upload_dir)
+    resumable_upload._hashers.clear()
+
+
+  def create(self, length=len(VIDEO), filename='lesson.mp4'):
+    return self.client.post(
+      path=reverse('lesson-video-uploads', kwargs={'pk': self.lesson.pk}),
+      HTTP_UPLOAD_LENGTH=str(length), HTTP_UPLOAD_METADATA=f'filename {b64(filename)},kind {b64("video")}')
+
+
+  def patch_chunk(self, url, offset, data, **headers):
+    return self.client.generic(
+      'PATCH', url, data, content_type=CHUNK, HTTP_UPLOAD_OFFSET=str(offset), **headers)
+
+
+  def upload_in_chunks(self, url, chunk_size, start=0):
+    for offset in range(start, len(VIDEO), chunk_size):
+      response = self.patch_chunk(url, offset, VIDEO[offset:offset + chunk_size])
+      self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+      self.assertEqual(response['Upload-Offset'], str(min(offset + chunk_size, len(VIDEO))))
+
+
+  def assert_lesson_has_the_video(self, upload_id):
+    upload = VideoUpload.objects.get(pk=upload_id)
+    self.lesson.refresh_from_db()
+    self.assertIsNotNone(upload.completed_at)
+    self.assertEqual(upload.sha256, hashlib.sha256(VIDEO).hexdigest())
+    sha256 = upload.sha256
+    self.assertEqual(self.lesson.video.name, f'classes/{sha256[:2]}/{sha256[2:4]}/{sha256}.mp4')
+    with self.lesson.video.open('rb') as video:
+      self.assertEqual(video.read(), VIDEO)
+    self.assertFalse(os.path.exists(upload.part_path))
+
+
+  def test_staff_user_can_upload_a_video_in_chunks(self):
+    response = self.create()
+    self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+    self.assertEqual(response['Tus-Resumable'], '1.0.0')
+    url = response['Location']
+
+    response = self.client.head(url)
+    self.assertEqual((response['Upload-Offset'], response['Upload-Length']), ('0', str(len(VIDEO))))
+
+    # blocks smaller than the chunks, so each chunk is streamed in pieces
+    with patch.object(resumable_upload, 'BLOCK_SIZE', 16 * 1024):
+      self.upload_in_chunks(url, 100 * 1024)
+
+    upload_id = url.rstrip('/').rsplit('/', 1)[-1]
+    self.assert_lesson_has_the_video(upload_id)
+    response = self.client.get(url)
+    self.assertEqual(response.data['sha256'], hashlib.sha256(VIDEO).hexdigest())
+    self.assertEqual(response.data['offset'], len(VIDEO))
+
+
+  def test_upload_resumes_in_another_process(self):
+    url = self.create()['Location']
+    self.patch_chunk(url, 0, VIDEO[:1000])
+    # a process that never saw the first chunk rebuilds the hash from the partial file
+    resumable_upload._hashers.clear()
+
+    self.assertEqual(self.client.head(url)['Upload-Offset'], '1000')
+    self.upload_in_chunks(url, 128 * 1024, start=1000)
+    self.assert_lesson_has_the_video(url.rstrip('/').rsplit('/', 1)[-1])
+
+
+  def test_interrupted_chunk_keeps_the_bytes_received(self):
+    url = self.create()['Location']
+    upload = VideoUpload.objects.get()
+
+    class DroppedConnection:
+      def __init__(self, data):
+        self.data = data
+
+      def read(self, size):
+        if not self.data:
+          raise OSError('connection reset')
+        block, self.data = self.data[:size], self.data[size:]
+        return block
+
+    with patch.object(resumable_upload, 'BLOCK_SIZE', 100):
+      resumable_upload.append_chunk(upload, 0, DroppedConnection(VIDEO[:500]), 4000)
+    self.assertEqual(self.client.head(url)['Upload-Offset'], '500')
+    self.upload_in_chunks(url, 128 * 1024, start=500)
+    self.assert_lesson_has_the_video(upload.pk)
+
+
+  def test_chunk_at_the_wrong_offset_is_a_conflict(self):
+    url = self.create()['Location']
+    response = self.patch_chunk(url, 10, VIDEO[10:20])
+    self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+
+  def test_chunk_checksums(self):
+    url = self.create()['Location']
+    response = self.patch_chunk(url, 0, VIDEO[:100], HTTP_UPLOAD_CHECKSUM=f'sha1 {b64(hashlib.sha1(b"other").digest())}')
+    self.assertEqual(response.status_code, 460)
+    self.assertEqual(self.client.head(url)['Upload-Offset'], '0')
+
+    response = self.patch_chunk(url, 0, VIDEO[:100], HTTP_UPLOAD_CHECKSUM=f'sha256 {b64(hashlib.sha256(VIDEO[:100]).digest())}')
+    self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+    self.upload_in_chunks(url, 128 * 1024, start=100)
+    self.assert_lesson_has_the_video(url.rstrip('/').rsplit('/', 1)[-1])
+
+
+  def test_rejected_requests(self):
+    url = self.create(length=10)['Location']
+    self.assertEqual(self.patch_chunk(url, 0, b'x' * 11).status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+    response = self.client.patch(url, b'x', content_type='application/octet-stream', HTTP_UPLOAD_OFFSET='0')
+    self.assertEqual(response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+    response = self.patch_chunk(url, 0, b'x', HTTP_UPLOAD_CHECKSUM='crc32 AAAA')
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    client = APIClient()
+    client.force_authenticate(user=self.user)
+    response = client.head(url, HTTP_TUS_RESUMABLE='0.2.2')
+    self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+    self.assertEqual(response['Tus-Version'], '1.0.0')
+
+    with override_settings(VIDEO_UPLOAD_MAX_SIZE=100):
+      self.assertEqual(self.create(length=101).status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+    response = self.client.post(path=reverse('lesson-video-uploads', kwargs={'pk': self.lesson.pk}))
+    self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+  def test_completed_upload_takes_no_more_chunks(self):
+    url = self.create(length=3)['Location']
+    self.patch_chunk(url, 0, b'abc')
+    self.assertEqual(self.patch_chunk(url, 3, b'').status_code, status.HTTP_409_CONFLICT)
+
+
+  def test_empty_video_is_complete_when_created(self):
+    self.create(length=0)
+    upload = VideoUpload.objects.get()
+    self.assertEqual(upload.sha256, hashlib.sha256(b'').hexdigest())
+
+
+  def test_staff_user_can_terminate_an_upload(self):
+    url = self.create()['Location']
+    self.patch_chunk(url, 0, VIDEO[:100])
+    part_path = VideoUpload.objects.get().part_path
+
+    response = self.client.delete(url)
+    self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+    self.assertFalse(VideoUpload.objects.exists())
+    self.assertFalse(os.path.exists(part_path))
+    self.assertEqual(self.client.head(url).status_code, status.HTTP_404_NOT_FOUND)
+
+
+  def test_options_describe_the_protocol(self):
+    response = self.client.options(reverse('lesson-video-uploads', kwargs={'pk': self.lesson.pk}))
+    self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+    self.assertEqual(response['Tus-Version'], '1.0.0')
+    self.assertEqual(response['Tus-Extension'], 'creation,checksum,termination')
+    self.assertIn('sha256', response['Tus-Checksum-Algorithm'])
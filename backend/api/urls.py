@@ -1,12 +1,16 @@
 from django.urls import path, include, re_path
 
+from course.models import Course, Lesson
 from .views import (
   CategoryListCreate, CategoryRetrieveUpdateDestroy, 
   CourseListCreate, CourseRetrieveUpdateDestroy,
   LessonListCreate, LessonRetrieveUpdateDestroy,
-  CommentListCreate, CommentRetrieveUpdateDestroy,
+  CommentListCreate, CommentRetrieveUpdateDestroy, CommentThread,
   SaveListCreate, SaveRetrieveDestroy,
-  WatchedListCreate, WatchedRetrieveUpdateDestroy
+  WatchedListCreate, WatchedRetrieveUpdateDestroy, WatchedHeartbeat, WatchedLessonUpsert,
+  SearchList,
+  VideoUploadCreate, VideoUploadDetail,
+  CoverDerivative, LessonTextImageDerivative,
   )
 
 
@@ -25,6 +29,7 @@ course_paths = [
     name='courses'),
   path('only/<int:pk>/', CourseRetrieveUpdateDestroy.as_view(), name='course'),
   path('only/<str:title>/', CourseRetrieveUpdateDestroy.as_view(), name='course'),
+  path('only/<int:pk>/cover/<int:width>/', CoverDerivative.as_view(model=Course), name='course-cover'),
 ]
 
 lesson_paths = [
@@ -35,12 +40,17 @@ lesson_paths = [
     name='lessons'),
   path('only/<int:pk>/', LessonRetrieveUpdateDestroy.as_view(), name='lesson'),
   path('only/<str:title>/', LessonRetrieveUpdateDestroy.as_view(), name='lesson'),
+  path('only/<int:pk>/cover/<int:width>/', CoverDerivative.as_view(model=Lesson), name='lesson-cover'),
+  path('text/images/<int:width>/<path:name>', LessonTextImageDerivative.as_view(), name='lesson-text-image'),
+  path('only/<int:pk>/video/uploads/', VideoUploadCreate.as_view(), name='lesson-video-uploads'),
+  path('video/uploads/<uuid:pk>/', VideoUploadDetail.as_view(), name='video-upload'),
 ]
 
 comment_paths = [
   path('', CommentListCreate.as_view(), name='comments'),
   re_path('^(?P<user>.+)/^(?P<lesson>.+)/^(?P<stars>[0-9]+)/$', CommentListCreate.as_view(), name='comments'),
   path('only/<int:pk>/', CommentRetrieveUpdateDestroy.as_view(), name='comment'),
+  path('only/<int:pk>/thread/', CommentThread.as_view(), name='comment-thread'),
 ]
 
 save_paths = [
@@ -51,6 +61,8 @@ save_paths = [
 watched_paths = [
   path('', WatchedListCreate.as_view(), name='watcheds'),
   path('only/<int:pk>/', WatchedRetrieveUpdateDestroy.as_view(), name='watched'),
+  path('heartbeat/', WatchedHeartbeat.as_view(), name='watched-heartbeat'),
+  path('lesson/<int:lesson_id>/', WatchedLessonUpsert.as_view(), name='watched-lesson'),
 ]
 
 urlpatterns = [
@@ -60,4 +72,5 @@ urlpatterns = [
   path('comments/', include(comment_paths)),
   path('saves/', include(save_paths)),
   path('watcheds/', include(watched_paths)),
+  path('search/', SearchList.as_view(), name='search'),
 ]
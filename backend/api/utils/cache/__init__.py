@@ -0,0 +1 @@
+from .response_cache import AnonymousResponseCacheMixin, bump_generation, get_generations
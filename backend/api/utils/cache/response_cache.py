@@ -0,0 +1,106 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.http import parse_http_date
+from rest_framework.response import Response
+
+from api.utils.mixins import conditional_response, set_validators
+
+
+KEY_PREFIX = 'api-response'
+
+
+def get_cache():
+  return caches[getattr(settings, 'API_RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def generation_key(label : str) -> str:
+  return f'{KEY_PREFIX}:generation:{label}'
+
+
+def get_generations(labels) -> list[int]:
+  """
+  Current generation of each model label.
+  Every cached response embeds the generations of the models it was built
+  from, so bumping one generation invalidates exactly those responses.
+  """
+  cache = get_cache()
+  keys = [generation_key(label) for label in labels]
+  generations = cache.get_many(keys)
+  for key in keys:
+    if key not in generations:
+      # seeded from the clock so an evicted counter never repeats old values
+      cache.add(key, time.time_ns(), timeout=None)
+      generations[key] = cache.get(key)
+  return [generations[key] for key in keys]
+
+
+def bump_generation(label : str):
+  cache = get_cache()
+  try:
+    cache.incr(generation_key(label))
+  except ValueError:
+    cache.set(generation_key(label), time.time_ns(), timeout=None)
+
+
+class AnonymousResponseCacheMixin:
+  """
+  Caches the responses of anonymous GET requests.
+  `cache_dependencies` lists the labels of the models the response is built
+  from; their post_save/post_delete signals bump the generations that are
+  part of the key, see api/signals. The timeout is only a backstop.
+  The ETag and Last-Modified of the response are cached along with it, so a
+  cache hit still answers conditional requests with 304.
+  """
+  cache_dependencies : tuple[str, ...] = ()
+
+  def get(self, request, *args, **kwargs):
+    if request.user.is_authenticated:
+      return super().get(request, *args, **kwargs)
+
+    cache = get_cache()
+    key = self.get_response_cache_key(request)
+    cached = cache.get(key)
+    if cached is not None:
+      return self.get_cached_response(request, cached)
+
+    response = super().get(request, *args, **kwargs)
+    if response.status_code == 200:
+      cached = {
+        'data': response.data,
+        'etag': response.get('ETag'),
+        'last_modified': response.get('Last-Modified'),
+      }
+      cache.set(key, cached, getattr(settings, 'API_RESPONSE_CACHE_TIMEOUT', 3600))
+    return response
+
+
+  def get_cached_response(self, request, cached : dict):
+    etag = cached['etag']
+    if etag is None:
+      return Response(cached['data'])
+
+    last_modified = None
+    if cached['last_modified'] is not None:
+      last_modified = datetime.fromtimestamp(parse_http_date(cached['last_modified']), tz=timezone.utc)
+
+    not_modified = conditional_response(request, etag, last_modified)
+    if not_modified is not None:
+      return not_modified
+    return set_validators(Response(cached['data']), etag, last_modified)
+
+
+  def get_response_cache_key(self, request) -> str:
+    parts = [
+      ','.join(str(generation) for generation in get_generations(self.cache_dependencies)),
+      str(request.version),
+      request.accepted_media_type,
+      request.get_host(),
+      request.path,
+      '&'.join(sorted(f'{key}={value}' for key, values in request.query_params.lists() for value in values)),
+    ]
+    digest = hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+    return f'{KEY_PREFIX}:{self.__class__.__name__}:{digest}'
@@ -0,0 +1 @@
+from .watched_heartbeat_buffer import WatchedHeartbeatBuffer, get_heartbeat_buffer
@@ -0,0 +1,160 @@
+import atexit
+import logging
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, connection
+from django.utils import timezone
+
+from course.models import Watched
+
+
+logger = logging.getLogger(__name__)
+
+# errors caused by the values of a row rather than by the database
+ROW_ERRORS = (DataError, IntegrityError, OverflowError, ValueError)
+
+
+class WatchedHeartbeatBuffer:
+  """
+  Write-behind buffer for video progress heartbeats.
+  Heartbeats are coalesced per (user, lesson) keeping the greatest
+  `watched_time` and written every `flush_interval` seconds by a background
+  thread in one batched upsert, see `Watched.objects.bulk_upsert_max`.
+  Whatever is pending is flushed at interpreter exit; a flush interval of 0
+  writes every heartbeat straight away.
+  A row the database refuses is logged and dropped, it does not hold back
+  the rest of the batch.
+  """
+
+  def __init__(self, flush_interval : float):
+    self.flush_interval = flush_interval
+    self.version = 0
+    self._lock = threading.Lock()
+    self._flush_lock = threading.Lock()
+    self._pending : dict[tuple[int, int], tuple[int, datetime]] = {}
+    # entries being written stay visible to readers until committed
+    self._flushing : dict[tuple[int, int], tuple[int, datetime]] = {}
+    self._stopped = threading.Event()
+    self._thread = None
+    atexit.register(self.stop)
+
+
+  def add(self, user_id : int, lesson_id : int, watched_time : int):
+    key = (user_id, lesson_id)
+    with self._lock:
+      current = self._pending.get(key)
+      if current is None or watched_time > current[0]:
+        self._pending[key] = (watched_time, timezone.now())
+        self.version += 1
+
+    if self.flush_interval <= 0:
+      self.flush()
+    else:
+      self._ensure_thread()
+
+
+  def get_pending(self, keys) -> dict[tuple[int, int], tuple[int, datetime]]:
+    """Unflushed `(watched_time, received_at)` for each of `keys` that has one"""
+    pending = {}
+    with self._lock:
+      for key in keys:
+        values = [entry for entry in (self._flushing.get(key), self._pending.get(key)) if entry is not None]
+        if values:
+          pending[key] = max(values)
+    return pending
+
+
+  def merge_pending(self, watcheds):
+    """
+    Raises the `watched_time` of `watcheds`, model instances or `.values()`
+    rows, to their unflushed values, in memory. `updated_at` is left as
+    stored: the keyset cursor of the page is taken from it
+    """
+    rows = [watched if isinstance(watched, dict) else vars(watched) for watched in watcheds]
+    pending = self.get_pending((row['user_id'], row['lesson_id']) for row in rows)
+    for row in rows:
+      entry = pending.get((row['user_id'], row['lesson_id']))
+      if entry is not None and entry[0] > row['watched_time']:
+        row['watched_time'] = entry[0]
+    return watcheds
+
+
+  def flush(self) -> int:
+    with self._flush_lock:
+      with self._lock:
+        self._flushing, self._pending = self._pending, {}
+        batch = {key: watched_time for key, (watched_time, _) in self._flushing.items()}
+
+      try:
+        if batch:
+          self._write(batch)
+      except Exception:
+        # handed back so the next flush retries them
+        with self._lock:
+          for key, entry in self._flushing.items():
+            current = self._pending.get(key)
+            if current is None or entry[0] > current[0]:
+              self._pending[key] = entry
+        raise
+      finally:
+        with self._lock:
+          self._flushing = {}
+      return len(batch)
+
+
+  def _write(self, batch : dict[tuple[int, int], int]):
+    try:
+      Watched.objects.bulk_upsert_max(batch)
+      return
+    except ROW_ERRORS:
+      pass
+
+    for (user_id, lesson_id), watched_time in batch.items():
+      try:
+        Watched.objects.bulk_upsert_max({(user_id, lesson_id): watched_time})
+      except ROW_ERRORS:
+        logger.exception(
+          'dropped the heartbeat of user %s on lesson %s (%s)', user_id, lesson_id, watched_time)
+
+
+  def stop(self):
+    """Stops the background thread and flushes what is left"""
+    self._stopped.set()
+    if self._thread is not None:
+      self._thread.join()
+      self._thread = None
+    self._stopped.clear()
+    self.flush()
+
+
+  def _ensure_thread(self):
+    if self._thread is not None and self._thread.is_alive():
+      return
+    with self._flush_lock:
+      if self._thread is not None and self._thread.is_alive():
+        return
+      self._thread = threading.Thread(target=self._run, name='watched-heartbeat-flush', daemon=True)
+      self._thread.start()
+
+
+  def _run(self):
+    while not self._stopped.wait(self.flush_interval):
+      try:
+        self.flush()
+      except Exception:
+        logger.exception('could not flush watched heartbeats')
+      finally:
+        connection.close()
+
+
+@lru_cache
+def load_heartbeat_buffer(flush_interval : float) -> WatchedHeartbeatBuffer:
+  return WatchedHeartbeatBuffer(flush_interval)
+
+
+def get_heartbeat_buffer() -> WatchedHeartbeatBuffer:
+  """Process wide buffer for `settings.WATCHED_HEARTBEAT_FLUSH_INTERVAL`"""
+  return load_heartbeat_buffer(getattr(settings, 'WATCHED_HEARTBEAT_FLUSH_INTERVAL', 5))
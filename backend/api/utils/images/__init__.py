@@ -0,0 +1,8 @@
+from .derivative_cache import DerivativeCache
+from .cover_derivatives import (
+  CONTENT_TYPES, derivative_key, get_cover_cache, negotiate_format, render_derivative,
+  )
+from .blurhash import encode_blurhash
+from .cover_pipeline import CoverPipeline, ProcessedCover, get_cover_pipeline, process_cover
+from .inline_images import INLINE_IMAGE_DIRECTORY, inline_image_name, is_inline_image, render_lesson_text
+from .inline_image_storage import InlineImageStorage
@@ -0,0 +1,62 @@
+import numpy as np
+from PIL import Image
+
+
+BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+# the placeholder only has a handful of frequencies, a thumbnail is plenty
+SAMPLE_WIDTH = 32
+
+
+def base83(value : int, length : int) -> str:
+  return ''.join(BASE83[value // 83 ** (length - position) % 83] for position in range(1, length + 1))
+
+
+def srgb_to_linear(values : np.ndarray) -> np.ndarray:
+  values = values / 255
+  return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(values : np.ndarray) -> np.ndarray:
+  values = np.clip(values, 0, 1)
+  srgb = np.where(values <= 0.0031308, values * 12.92, 1.055 * values ** (1 / 2.4) - 0.055)
+  return (srgb * 255 + 0.5).astype(int)
+
+
+def encode_blurhash(image : Image.Image, components : tuple[int, int] = (4, 3)) -> str:
+  """
+  BlurHash (https://blurha.sh) of `image`: the `components` lowest cosine
+  frequencies on each axis, computed for every component at once as two
+  matrix products over the linear RGB pixels of a thumbnail
+  """
+  x_components, y_components = components
+  if image.width > SAMPLE_WIDTH:
+    image = image.resize((SAMPLE_WIDTH, max(1, round(image.height * SAMPLE_WIDTH / image.width))), Image.BILINEAR)
+  pixels = srgb_to_linear(np.asarray(image.convert('RGB'), dtype=np.float64))
+  height, width, _ = pixels.shape
+
+  basis_x = np.cos(np.pi * np.outer(np.arange(x_components), np.arange(width)) / width)
+  basis_y = np.cos(np.pi * np.outer(np.arange(y_components), np.arange(height)) / height)
+  # factors[j, i] = sum over y, x of basis_y[j, y] * basis_x[i, x] * pixels[y, x]
+  factors = np.einsum('jy,yxc,ix->jic', basis_y, pixels, basis_x) / (width * height)
+  factors[1:] *= 2
+  factors[0, 1:] *= 2
+  factors = factors.reshape(-1, 3)
+
+  dc, ac = factors[0], factors[1:]
+  blurhash = base83(x_components - 1 + (y_components - 1) * 9, 1)
+
+  if len(ac):
+    quantised_maximum = int(np.clip(np.floor(np.abs(ac).max() * 166 - 0.5), 0, 82))
+    maximum = (quantised_maximum + 1) / 166
+  else:
+    quantised_maximum, maximum = 0, 1
+  blurhash += base83(quantised_maximum, 1)
+
+  red, green, blue = linear_to_srgb(dc)
+  blurhash += base83((int(red) << 16) + (int(green) << 8) + int(blue), 4)
+
+  scaled = ac / maximum
+  quantised = np.clip(np.floor(np.sign(scaled) * np.abs(scaled) ** 0.5 * 9 + 9.5), 0, 18).astype(int)
+  for red, green, blue in quantised:
+    blurhash += base83(int(red) * 19 * 19 + int(green) * 19 + int(blue), 2)
+  return blurhash
@@ -0,0 +1,67 @@
+import hashlib
+import io
+import os
+from functools import lru_cache
+
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from .derivative_cache import DerivativeCache
+
+
+Image.init()
+# negotiated in this order of preference, when Pillow can write them
+NEGOTIATED_FORMATS = [name for name in ('AVIF', 'WEBP') if name in Image.SAVE]
+CONTENT_TYPES = {'AVIF': 'image/avif', 'WEBP': 'image/webp', 'JPEG': 'image/jpeg', 'PNG': 'image/png'}
+QUALITY = 80
+
+
+def accepted_types(accept : str) -> set[str]:
+  """Media types of an Accept header that are not refused with `q=0`"""
+  types = set()
+  for item in accept.split(','):
+    media_type, *params = [part.strip() for part in item.split(';')]
+    if not any(param.replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000') for param in params):
+      types.add(media_type.lower())
+  return types
+
+
+def negotiate_format(accept : str, name : str) -> str:
+  """The best format the client accepts, else the one of the source `name` (or PNG)"""
+  accepted = accepted_types(accept)
+  for image_format in NEGOTIATED_FORMATS:
+    if CONTENT_TYPES[image_format] in accepted:
+      return image_format
+  source_format = Image.registered_extensions().get(os.path.splitext(name)[1].lower())
+  return source_format if source_format in ('JPEG', 'PNG') else 'PNG'
+
+
+def derivative_key(name : str, size : int, modified, width : int, image_format : str) -> str:
+  # the size and modification time of the source change whenever a cover is replaced under the same name
+  key = f'{name}\n{size}\n{modified.timestamp()}\n{width}\n{image_format}'
+  return hashlib.sha256(key.encode()).hexdigest()
+
+
+def render_derivative(source, width : int, image_format : str) -> bytes:
+  """`source` scaled down (never up) to `width`, encoded as `image_format`"""
+  with Image.open(source) as image:
+    # lets JPEG decoding skip straight to a smaller scale
+    image.draft('RGB', (width, width * image.height // max(image.width, 1)))
+    image = ImageOps.exif_transpose(image)
+    if image.width > width:
+      image = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'P') and image_format != 'JPEG'
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+    output = io.BytesIO()
+    image.save(output, image_format, quality=QUALITY, optimize=image_format in ('JPEG', 'PNG'))
+  return output.getvalue()
+
+
+@lru_cache
+def load_cover_cache(directory : str, max_size : int) -> DerivativeCache:
+  return DerivativeCache(directory, max_size)
+
+
+def get_cover_cache() -> DerivativeCache:
+  return load_cover_cache(settings.COVER_CACHE_DIR, settings.COVER_CACHE_MAX_SIZE)
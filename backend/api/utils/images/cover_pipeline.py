@@ -0,0 +1,136 @@
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from .blurhash import encode_blurhash
+
+
+logger = logging.getLogger(__name__)
+
+# larger uploads are scaled down, the biggest derivative is COVER_WIDTHS[-1]
+MAX_DIMENSION = 2560
+JPEG_QUALITY = 85
+
+
+@dataclass(frozen=True)
+class ProcessedCover:
+  data : bytes
+  extension : str
+  width : int
+  height : int
+  placeholder : str
+
+
+def process_cover(data : bytes, max_size : tuple[int, int] = (MAX_DIMENSION, MAX_DIMENSION)) -> ProcessedCover:
+  """
+  Verifies and decodes an uploaded cover, applies and drops its EXIF data,
+  scales it down to fit `max_size` and recompresses it as progressive JPEG
+  (PNG when it has transparency). Runs in the worker processes, so it only
+  deals with bytes.
+  """
+  with Image.open(io.BytesIO(data)) as image:
+    image.verify()
+
+  with Image.open(io.BytesIO(data)) as image:
+    image.load()
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail(max_size, Image.LANCZOS)
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+    output = io.BytesIO()
+    if has_alpha:
+      image.save(output, 'PNG', optimize=True)
+    else:
+      image.save(output, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+
+    return ProcessedCover(
+      data=output.getvalue(), extension='.png' if has_alpha else '.jpg',
+      width=image.width, height=image.height, placeholder=encode_blurhash(image))
+
+
+def apply_processed_cover(model, pk : int, name : str, processed : ProcessedCover):
+  """
+  Stores the processed cover of the `model` row `pk` under the `upload_to`
+  of its field and points the row to it, unless the cover was replaced
+  meanwhile. Saved with update_fields so the usual signals invalidate cached
+  responses and move the blob references; the upload is left to the orphan
+  collector.
+  """
+  field = model._meta.get_field('cover')
+  # `name` is already sharded, the storage shards the new blob by its own hash
+  filename = os.path.splitext(os.path.basename(name))[0] + processed.extension
+  new_name = field.storage.save(field.generate_filename(None, filename), ContentFile(processed.data))
+
+  with transaction.atomic():
+    instance = model.objects.select_for_update().filter(pk=pk, cover=name).first()
+    if instance is not None:
+      instance.cover.name = new_name
+      instance.cover_width, instance.cover_height = processed.width, processed.height
+      instance.cover_placeholder = processed.placeholder
+      instance.save(update_fields=['cover', 'cover_width', 'cover_height', 'cover_placeholder', 'updated_at'])
+
+
+class CoverPipeline:
+  """
+  Post-upload processing of course and lesson covers.
+  Covers are decoded and recompressed by `workers` processes once the
+  upload is committed, and a thread writes the results back. With 0
+  workers the cover is processed in the committing thread instead.
+  """
+
+  def __init__(self, workers : int):
+    self.workers = workers
+    self._processes = ProcessPoolExecutor(max_workers=workers) if workers else None
+    self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cover-pipeline') if workers else None
+
+
+  def schedule(self, instance):
+    """Processes the cover of `instance` after the current transaction commits"""
+    model, pk, name = type(instance), instance.pk, instance.cover.name
+    transaction.on_commit(lambda: self.submit(model, pk, name))
+
+
+  def submit(self, model, pk : int, name : str):
+    try:
+      with model._meta.get_field('cover').storage.open(name, 'rb') as file:
+        data = file.read()
+    except FileNotFoundError:
+      return
+
+    if self._processes is None:
+      self.apply(model, pk, name, process_cover, data)
+      return
+    future = self._processes.submit(process_cover, data)
+    future.add_done_callback(lambda future: self._writer.submit(self.write, model, pk, name, future))
+
+
+  def write(self, model, pk : int, name : str, future):
+    try:
+      self.apply(model, pk, name, future.result)
+    finally:
+      connection.close()
+
+
+  def apply(self, model, pk : int, name : str, process, *args):
+    try:
+      apply_processed_cover(model, pk, name, process(*args))
+    except Exception:
+      logger.warning('could not process cover %s of %s %s', name, model._meta.label, pk, exc_info=True)
+
+
+@lru_cache
+def load_cover_pipeline(workers : int) -> CoverPipeline:
+  return CoverPipeline(workers)
+
+
+def get_cover_pipeline() -> CoverPipeline:
+  return load_cover_pipeline(settings.COVER_PROCESSING_WORKERS)
@@ -0,0 +1,89 @@
+import os
+import threading
+
+
+class DerivativeCache:
+  """
+  Generated files kept on disk under `directory`, bounded to `max_size`
+  bytes with least recently used eviction. Reads bump the mtime of the
+  file, which is what eviction orders by. Every process sharing the
+  directory rescans it once its own estimate of the size is over the bound
+  or every `rescan_every` writes, and evicts down to `low_watermark`.
+  """
+  low_watermark = 0.9
+  rescan_every = 64
+
+  def __init__(self, directory : str, max_size : int):
+    self.directory = directory
+    self.max_size = max_size
+    self._lock = threading.Lock()
+    self._size = None
+    self._writes = 0
+
+
+  def path(self, key : str) -> str:
+    return os.path.join(self.directory, key[:2], key)
+
+
+  def get(self, key : str) -> str | None:
+    path = self.path(key)
+    try:
+      os.utime(path)
+    except FileNotFoundError:
+      return None
+    return path
+
+
+  def put(self, key : str, data : bytes) -> str:
+    path = self.path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(temporary, 'wb') as file:
+      file.write(data)
+    os.replace(temporary, path)
+
+    with self._lock:
+      self._writes += 1
+      if self._size is not None:
+        self._size += len(data)
+      rescan = self._size is None or self._size > self.max_size or self._writes % self.rescan_every == 0
+    if rescan:
+      self.evict()
+    return path
+
+
+  def entries(self) -> list[tuple[float, int, str]]:
+    entries = []
+    for root, _, files in os.walk(self.directory):
+      for name in files:
+        if name.endswith('.tmp'):
+          continue
+        path = os.path.join(root, name)
+        try:
+          stat = os.stat(path)
+        except FileNotFoundError:
+          continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return entries
+
+
+  def evict(self) -> int:
+    """Removes the least recently used files once over `max_size`, returns how many"""
+    entries = self.entries()
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    if total > self.max_size:
+      entries.sort()
+      for _, size, path in entries:
+        if total <= self.max_size * self.low_watermark:
+          break
+        try:
+          os.remove(path)
+        except FileNotFoundError:
+          pass
+        total -= size
+        removed += 1
+
+    with self._lock:
+      self._size = total
+    return removed
@@ -0,0 +1,41 @@
+import io
+import os
+import posixpath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils.deconstruct import deconstructible
+from PIL import Image
+
+from course.storages import ContentAddressedStorage
+from .cover_pipeline import MAX_DIMENSION, process_cover
+from .inline_images import INLINE_IMAGE_DIRECTORY
+
+
+def is_animated(data : bytes) -> bool:
+  with Image.open(io.BytesIO(data)) as image:
+    return getattr(image, 'is_animated', False)
+
+
+@deconstructible(path='api.utils.images.InlineImageStorage')
+class InlineImageStorage(ContentAddressedStorage):
+  """
+  Storage of the lesson text editor uploads, see CKEDITOR_5_FILE_STORAGE.
+  Images are recompressed like covers, scaled down to the widest of
+  COVER_WIDTHS and kept under INLINE_IMAGE_DIRECTORY. Being content
+  addressed, the same picture uploaded twice is stored once.
+  Animated images are kept as they were uploaded.
+  """
+
+  def _save(self, name, content):
+    name = posixpath.join(INLINE_IMAGE_DIRECTORY, os.path.basename(name))
+    content.seek(0)
+    data = content.read()
+    content.seek(0)
+
+    if not is_animated(data):
+      # tall screenshots keep a readable width
+      processed = process_cover(data, (max(settings.COVER_WIDTHS), 4 * MAX_DIMENSION))
+      name = os.path.splitext(name)[0] + processed.extension
+      content = ContentFile(processed.data)
+    return super()._save(name, content)
@@ -0,0 +1,110 @@
+import posixpath
+import re
+from html import escape
+from html.parser import HTMLParser
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from PIL import Image, UnidentifiedImageError
+
+from course.storages import is_content_addressed
+
+
+# where the lesson text editor uploads go, see InlineImageStorage
+INLINE_IMAGE_DIRECTORY = 'lesson_text/'
+NEWLINE = re.compile('\n')
+
+
+def is_inline_image(name : str) -> bool:
+  """Whether `name` is an image uploaded from the lesson text editor"""
+  return (name.startswith(INLINE_IMAGE_DIRECTORY) and posixpath.normpath(name) == name
+          and is_content_addressed(name))
+
+
+def inline_image_name(src : str) -> str | None:
+  """The storage name of an inline image URL, None for any other URL"""
+  if not src.startswith(settings.MEDIA_URL):
+    return None
+  name = unquote(src[len(settings.MEDIA_URL):].split('?', 1)[0])
+  return name if is_inline_image(name) else None
+
+
+class ImageTags(HTMLParser):
+  """Collects the position, source text and attributes of every `<img>` tag"""
+
+  def __init__(self):
+    super().__init__(convert_charrefs=True)
+    self.tags = []
+
+
+  def handle_starttag(self, tag, attrs):
+    if tag == 'img':
+      self.tags.append((self.getpos(), self.get_starttag_text(), attrs))
+
+
+def image_size(name : str) -> tuple[int, int] | None:
+  # only the header is read
+  try:
+    with default_storage.open(name, 'rb') as file, Image.open(file) as image:
+      return image.size
+  except (FileNotFoundError, UnidentifiedImageError):
+    return None
+
+
+def image_attributes(attrs : list[tuple[str, str | None]]) -> dict[str, str | None]:
+  attributes = {}
+  for key, value in attrs:
+    attributes.setdefault(key, value)
+  attributes.setdefault('loading', 'lazy')
+  attributes.setdefault('decoding', 'async')
+
+  name = inline_image_name(attributes.get('src') or '')
+  size = image_size(name) if name is not None else None
+  if size is None:
+    return attributes
+
+  width, height = size
+  if 'width' not in attributes and 'height' not in attributes:
+    attributes.update(width=str(width), height=str(height))
+  widths = [derivative for derivative in settings.COVER_WIDTHS if derivative < width]
+  if widths and 'srcset' not in attributes:
+    candidates = [
+      f"{reverse('lesson-text-image', kwargs={'width': derivative, 'name': name})} {derivative}w"
+      for derivative in widths]
+    candidates.append(f"{attributes['src']} {width}w")
+    attributes['srcset'] = ', '.join(candidates)
+    attributes.setdefault('sizes', f'(max-width: {width}px) 100vw, {width}px')
+  return attributes
+
+
+def image_tag(attributes : dict[str, str | None]) -> str:
+  rendered = [key if value is None else f'{key}="{escape(value)}"' for key, value in attributes.items()]
+  return '<img %s>' % ' '.join(rendered)
+
+
+def render_lesson_text(text : str | None) -> str | None:
+  """
+  `text` with its `<img>` tags lazily loaded and decoded off the main
+  thread. Inline images also get their intrinsic width and height, so the
+  page does not shift as they load, and a `srcset` of their derivatives.
+  Everything else is left as it was written.
+  """
+  if not text or '<img' not in text.lower():
+    return text
+
+  parser = ImageTags()
+  parser.feed(text)
+  parser.close()
+
+  line_starts = [0] + [match.end() for match in NEWLINE.finditer(text)]
+  rendered, position = [], 0
+  for (line, column), source, attrs in parser.tags:
+    start = line_starts[line - 1] + column
+    if start < position:
+      continue
+    rendered += [text[position:start], image_tag(image_attributes(attrs))]
+    position = start + len(source)
+  rendered.append(text[position:])
+  return ''.join(rendered)
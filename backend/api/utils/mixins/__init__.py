@@ -0,0 +1,7 @@
+from .non_empty_list_mixin import NonEmptyListMixin
+from .conditional_get_mixin import ConditionalGetMixin, conditional_response, make_etag, set_validators
+from .bulk_create_mixin import BulkCreateMixin
+from .sparse_fieldsets_mixin import SparseFieldsetsMixin, requested_fields
+from .deferred_fields_mixin import DeferredFieldsMixin
+from .values_list_mixin import ValuesListMixin
+from .cover_processing_mixin import CoverProcessingMixin
@@ -0,0 +1,80 @@
+from django.db.models import OuterRef, Subquery
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.response import Response
+
+
+class BulkCreateMixin:
+  """
+  Lets a ListCreate view of per-user rows take a JSON array of items.
+  Items are shape checked by `bulk_serializer_class`, then the related rows
+  they point at and the rows the user already has are looked up in a single
+  query and the new rows go in with one `bulk_create`. Conflicts are
+  ignored, so a concurrent insert of the same row is not an error. The
+  answer holds the outcome of every item in payload order, with 201 when all
+  of them were created, 400 when all of them were invalid and 207 otherwise.
+  """
+  bulk_serializer_class = None
+  bulk_owner_field = 'user'
+  bulk_lookup_field = 'lesson'
+  bulk_max_items = 500
+
+  def create(self, request, *args, **kwargs):
+    if not isinstance(request.data, list):
+      return super().create(request, *args, **kwargs)
+    if len(request.data) > self.bulk_max_items:
+      raise ValidationError(f'at most {self.bulk_max_items} items can be sent at once')
+
+    model = self.get_queryset().model
+    lookup_field = self.bulk_lookup_field
+    results = [None] * len(request.data)
+
+    valid = {}
+    for index, item in enumerate(request.data):
+      serializer = self.bulk_serializer_class(data=item)
+      if serializer.is_valid():
+        valid[index] = serializer.validated_data
+      else:
+        results[index] = {'index': index, 'status': 'invalid', 'errors': serializer.errors}
+
+    # one query tells which targets exist and which the user already has
+    existing = model.objects.filter(
+      **{self.bulk_owner_field: request.user, lookup_field: OuterRef('pk')}).values('pk')[:1]
+    related_model = model._meta.get_field(lookup_field).related_model
+    targets = dict(
+      related_model.objects
+      .filter(pk__in={data[lookup_field] for data in valid.values()})
+      .annotate(existing_id=Subquery(existing))
+      .values_list('pk', 'existing_id'))
+
+    to_create = {}
+    instances = []
+    for index, data in valid.items():
+      target = data[lookup_field]
+      if target not in targets:
+        message = PrimaryKeyRelatedField.default_error_messages['does_not_exist'].format(pk_value=target)
+        results[index] = {'index': index, 'status': 'invalid', 'errors': {lookup_field: [message]}}
+      elif targets[target] is not None:
+        results[index] = {'index': index, 'status': 'exists', 'id': targets[target]}
+      elif target in to_create:
+        results[index] = {'index': index, 'status': 'duplicate', 'of': to_create[target]}
+      else:
+        to_create[target] = index
+        fields = {name: value for name, value in data.items() if name != lookup_field}
+        instances.append(model(
+          **{self.bulk_owner_field: request.user, f'{lookup_field}_id': target}, **fields))
+
+    if instances:
+      model.objects.bulk_create(instances, ignore_conflicts=True)
+      created = dict(model.objects.filter(
+        **{self.bulk_owner_field: request.user, f'{lookup_field}__in': list(to_create)}
+        ).values_list(f'{lookup_field}_id', 'pk'))
+      for target, index in to_create.items():
+        results[index] = {'index': index, 'status': 'created', 'id': created.get(target)}
+
+    if len(to_create) == len(results):
+      return Response(results, status=status.HTTP_201_CREATED)
+    if all(result['status'] == 'invalid' for result in results):
+      return Response(results, status=status.HTTP_400_BAD_REQUEST)
+    return Response(results, status=status.HTTP_207_MULTI_STATUS)
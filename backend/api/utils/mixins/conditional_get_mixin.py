@@ -0,0 +1,102 @@
+import hashlib
+from datetime import datetime
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+
+def make_etag(request, *parts) -> str:
+  """
+  Strong ETag for one representation: the same validators rendered under
+  another version, media type, query string or user are a different body
+  """
+  user = request.user.pk if request.user.is_authenticated else ''
+  key = [str(request.version), str(request.accepted_media_type), request.get_full_path(), str(user)]
+  key += [str(part) for part in parts]
+  return '"%s"' % hashlib.sha256('\n'.join(key).encode()).hexdigest()
+
+
+def set_validators(response, etag : str, last_modified : datetime | None):
+  response['ETag'] = etag
+  if last_modified is not None:
+    response['Last-Modified'] = http_date(last_modified.timestamp())
+  patch_vary_headers(response, ('Accept', ))
+  return response
+
+
+def conditional_response(request, etag : str, last_modified : datetime | None):
+  """
+  The 304 (or 412) answer to the request preconditions, None when the
+  representation has to be sent
+  """
+  timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+  response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+  if response is None:
+    return None
+  return set_validators(response, etag, last_modified)
+
+
+def latest(values) -> datetime | None:
+  return max((value for value in values if value is not None), default=None)
+
+
+class ConditionalGetMixin:
+  """
+  Emits ETag and Last-Modified on GET and answers 304 before serializing.
+  Items are validated by their `validator_fields`, which may follow
+  relations (`stats__updated_at`); lists by a fingerprint of the filtered
+  queryset (latest value of each field and row count) taken with a single
+  aggregate query, so no row is loaded to validate a collection.
+  """
+  validator_fields = ('updated_at', )
+
+  def get_instance_validators(self, instance) -> list:
+    validators = []
+    for field in self.validator_fields:
+      value = instance
+      try:
+        for attribute in field.split('__'):
+          value = getattr(value, attribute)
+      except ObjectDoesNotExist:
+        value = None
+      validators.append(value)
+    return validators
+
+
+  def retrieve(self, request, *args, **kwargs):
+    instance = self.get_object()
+    validators = self.get_instance_validators(instance)
+    last_modified = latest(validators)
+    etag = make_etag(request, instance._meta.label, instance.pk, *validators)
+
+    not_modified = conditional_response(request, etag, last_modified)
+    if not_modified is not None:
+      return not_modified
+
+    serializer = self.get_serializer(instance)
+    return set_validators(Response(serializer.data), etag, last_modified)
+
+
+  def get_collection_fingerprint(self, queryset) -> dict:
+    latest_values = {f'max_{field}': Max(field) for field in self.validator_fields}
+    return queryset.aggregate(**latest_values, count=Count('pk'))
+
+
+  def list(self, request, *args, **kwargs):
+    queryset = self.filter_queryset(self.get_queryset())
+    fingerprint = self.get_collection_fingerprint(queryset)
+    if not fingerprint['count']:
+      return super().list(request, *args, **kwargs)
+
+    last_modified = latest(fingerprint[f'max_{field}'] for field in self.validator_fields)
+    etag = make_etag(request, queryset.model._meta.label, *sorted(fingerprint.items()))
+
+    not_modified = conditional_response(request, etag, last_modified)
+    if not_modified is not None:
+      return not_modified
+
+    response = super().list(request, *args, **kwargs)
+    return set_validators(response, etag, last_modified)
@@ -0,0 +1,26 @@
+from api.utils.images import get_cover_pipeline
+
+
+class CoverProcessingMixin:
+  """
+  View mixin that hands the covers uploaded through create and update to
+  the cover pipeline instead of processing them in the request. The stored
+  dimensions and placeholder are cleared until the new cover is processed.
+  """
+
+  def perform_create(self, serializer):
+    self.save_with_cover(serializer)
+
+
+  def perform_update(self, serializer):
+    self.save_with_cover(serializer)
+
+
+  def save_with_cover(self, serializer):
+    if 'cover' not in serializer.validated_data:
+      serializer.save()
+      return
+
+    instance = serializer.save(cover_width=None, cover_height=None, cover_placeholder='')
+    if instance.cover:
+      get_cover_pipeline().schedule(instance)
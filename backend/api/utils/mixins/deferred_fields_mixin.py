@@ -0,0 +1,39 @@
+from .sparse_fieldsets_mixin import requested_fields
+
+
+class DeferredFieldsMixin:
+  """
+  View mixin that defers the columns a sparse fieldset does not render, see
+  SparseFieldsetsMixin, so heavy columns such as the lesson text are never
+  read. The primary key, `updated_at` (keyset cursors), the relations of
+  the `validator_fields` and `required_fields` are always loaded. Fields
+  read from another column than they write to name it `read_source`.
+  """
+  required_fields : tuple[str, ...] = ()
+
+  def filter_queryset(self, queryset):
+    queryset = super().filter_queryset(queryset)
+    if requested_fields(self.request) is None:
+      return queryset
+
+    sources = set()
+    for field in self.get_serializer().fields.values():
+      if field.source == '*':
+        return queryset
+      sources.add(getattr(field, 'read_source', field.source).split('.')[0])
+
+    validator_fields = getattr(self, 'validator_fields', ())
+    sources.update(('updated_at', ) + self.required_fields)
+    sources.update(field.split('__')[0] for field in validator_fields)
+
+    related = queryset.query.select_related
+    if isinstance(related, dict):
+      kept = [name for name in related if name in sources]
+      queryset = queryset.select_related(None)
+      if kept:
+        queryset = queryset.select_related(*kept)
+
+    deferred = [
+      field.name for field in queryset.model._meta.concrete_fields
+      if not field.primary_key and field.name not in sources]
+    return queryset.defer(*deferred)
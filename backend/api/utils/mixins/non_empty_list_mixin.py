@@ -0,0 +1,24 @@
+from django.http import Http404
+
+
+class NonEmptyListMixin:
+  """
+  List mixin that answers 404 when the filtered queryset is empty.
+  The queryset is never evaluated as a whole: the page is fetched with
+  COUNT/LIMIT by the paginator and emptiness is only confirmed with an
+  EXISTS query when that page comes back empty.
+  """
+
+  def list(self, request, *args, **kwargs):
+    queryset = self.filter_queryset(self.get_queryset())
+
+    page = self.paginate_queryset(queryset)
+    if page is not None:
+      if not page and not queryset.exists():
+        raise Http404
+      serializer = self.get_serializer(page, many=True)
+      return self.get_paginated_response(serializer.data)
+
+    if not queryset.exists():
+      raise Http404
+    return super().list(request, *args, **kwargs)
@@ -0,0 +1,44 @@
+from rest_framework.permissions import SAFE_METHODS
+
+
+FIELDS_QUERY_PARAM = 'fields'
+OMIT_QUERY_PARAM = 'omit'
+
+
+def split_names(value : str | None) -> list[str]:
+  if not value:
+    return []
+  return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def requested_fields(request) -> tuple[list[str], list[str]] | None:
+  """
+  The `?fields=` and `?omit=` lists of a read request, None when the
+  request does not ask for a sparse fieldset
+  """
+  if request is None or request.method not in SAFE_METHODS:
+    return None
+  fields = split_names(request.query_params.get(FIELDS_QUERY_PARAM))
+  omit = split_names(request.query_params.get(OMIT_QUERY_PARAM))
+  if not fields and not omit:
+    return None
+  return fields, omit
+
+
+class SparseFieldsetsMixin:
+  """
+  Serializer mixin that lets read requests pick the fields they get back
+  with `?fields=id,title` and drop some with `?omit=text`. Unknown names are
+  ignored. Writes always see every field, so validation is never partial.
+  """
+
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    requested = requested_fields(self.context.get('request'))
+    if requested is None:
+      return
+
+    fields, omit = requested
+    for name in list(self.fields):
+      if (fields and name not in fields) or name in omit:
+        self.fields.pop(name)
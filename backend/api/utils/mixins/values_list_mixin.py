@@ -0,0 +1,29 @@
+from api.utils.serializers import ValuesListSerializer, row_converters
+
+
+class ValuesListMixin:
+  """
+  View mixin that reads GET lists with `.values()` when the serializer has
+  a ValuesListSerializer as `list_serializer_class` and only renders column
+  values and foreign key ids. The primary key, `updated_at` (keyset cursors)
+  and the view's `required_fields` are always read.
+  """
+
+  def filter_queryset(self, queryset):
+    queryset = super().filter_queryset(queryset)
+    if self.request.method not in ('GET', 'HEAD'):
+      return queryset
+
+    serializer = self.get_serializer()
+    list_serializer_class = getattr(serializer.Meta, 'list_serializer_class', None)
+    if list_serializer_class is None or not issubclass(list_serializer_class, ValuesListSerializer):
+      return queryset
+    converters = row_converters(serializer)
+    if converters is None:
+      return queryset
+
+    opts = queryset.model._meta
+    names = ('updated_at', ) + getattr(self, 'required_fields', ())
+    columns = [opts.pk.attname] + [column for _, column, _ in converters]
+    columns += [opts.get_field(name).attname for name in names]
+    return queryset.values(*dict.fromkeys(columns))
@@ -1,13 +1,198 @@
-from rest_framework.pagination import PageNumberPagination
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from urllib import parse
+
+from django.core.exceptions import BadRequest
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.utils.urls import replace_query_param
 
 # by default, all page size query params will be set as 'page_size'
 
 QUERY_PARAM = 'page_size'
+CURSOR_QUERY_PARAM = 'cursor'
+PAGINATION_QUERY_PARAM = 'pagination'
+ORDER_QUERY_PARAM = 'order'
+
+# best rated first, the rollup key breaks ties so pages are stable
+RATING_ORDERING = ('-stats__rating', '-stats__star_count', '-stats__pk')
+
+
+class KeysetPagination(CursorPagination):
+  """
+  Cursor pagination keyed on (updated_at, id), with stardard 20 and max 100.
+  Each page is a single `WHERE (updated_at, id) < cursor LIMIT n` query, so
+  page 10,000 costs the same as page 1
+  """
+  page_size = 20
+  page_size_query_param = QUERY_PARAM
+  max_page_size = 100
+  cursor_query_param = CURSOR_QUERY_PARAM
+  ordering = ('-updated_at', '-id')
+
+  def paginate_queryset(self, queryset, request, view=None):
+    self.request = request
+    self.page_size = self.get_page_size(request)
+    self.base_url = request.build_absolute_uri()
+
+    self.cursor = self.decode_cursor(request)
+    reverse = self.cursor is not None and self.cursor[2]
+
+    if reverse:
+      queryset = queryset.order_by('updated_at', 'id')
+    else:
+      queryset = queryset.order_by('-updated_at', '-id')
+
+    if self.cursor is not None:
+      updated_at, pk, _ = self.cursor
+      lookup = 'gt' if reverse else 'lt'
+      queryset = queryset.filter(
+        Q(**{f'updated_at__{lookup}': updated_at}) |
+        Q(updated_at=updated_at, **{f'id__{lookup}': pk}))
+
+    # one extra row tells whether there is anything past this page
+    results = list(queryset[:self.page_size + 1])
+    has_following = len(results) > self.page_size
+    self.page = results[:self.page_size]
+
+    if reverse:
+      self.page.reverse()
+      self.has_next = True
+      self.has_previous = has_following
+    else:
+      self.has_next = has_following
+      self.has_previous = self.cursor is not None
+
+    self.display_page_controls = bool(self.page) and (self.has_next or self.has_previous)
+    return self.page
+
+
+  def get_next_link(self):
+    if not self.has_next or not self.page:
+      return None
+    return self.encode_cursor(self.page[-1], reverse=False)
+
+
+  def get_previous_link(self):
+    if not self.has_previous or not self.page:
+      return None
+    return self.encode_cursor(self.page[0], reverse=True)
+
+
+  def decode_cursor(self, request):
+    encoded = request.query_params.get(self.cursor_query_param)
+    if encoded is None:
+      return None
+
+    try:
+      querystring = urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+      tokens = parse.parse_qs(querystring, strict_parsing=True)
+      updated_at = datetime.fromisoformat(tokens['u'][0])
+      pk = int(tokens['i'][0])
+      reverse = tokens.get('r', ['0'])[0] == '1'
+    except (TypeError, ValueError, KeyError, UnicodeError):
+      raise NotFound(self.invalid_cursor_message)
+
+    return updated_at, pk, reverse
+
+
+  def encode_cursor(self, instance, reverse):
+    tokens = {
+      'u': self._get_value(instance, 'updated_at').isoformat(),
+      'i': self._get_value(instance, 'id'),
+    }
+    if reverse:
+      tokens['r'] = '1'
+
+    querystring = parse.urlencode(tokens)
+    encoded = urlsafe_b64encode(querystring.encode('ascii')).decode('ascii')
+    return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+
+  def _get_value(self, instance, field_name):
+    if isinstance(instance, dict):
+      return instance[field_name]
+    return getattr(instance, field_name)
+
 
 class StandardPagination(PageNumberPagination):
   """
-  Pagination class with stardard 20 and max 100
+  Pagination class with stardard 20 and max 100.
+  Clients can switch a request to keyset pagination with `?pagination=cursor`
+  (any request carrying a `cursor` is keyset paginated as well)
+  """
+  page_size = 20
+  page_size_query_param = QUERY_PARAM
+  max_page_size = 100
+  pagination_query_param = PAGINATION_QUERY_PARAM
+  cursor_pagination_class = KeysetPagination
+  cursor_paginator = None
+
+  @classmethod
+  def is_cursor_request(cls, request):
+    return (request.query_params.get(cls.pagination_query_param) == 'cursor' or
+            cls.cursor_pagination_class.cursor_query_param in request.query_params)
+
+
+  def paginate_queryset(self, queryset, request, view=None):
+    if self.is_cursor_request(request):
+      self.cursor_paginator = self.cursor_pagination_class()
+      page = self.cursor_paginator.paginate_queryset(queryset, request, view)
+      self.display_page_controls = self.cursor_paginator.display_page_controls
+      return page
+
+    self.cursor_paginator = None
+    return super().paginate_queryset(queryset, request, view)
+
+
+  def get_paginated_response(self, data):
+    if self.cursor_paginator is not None:
+      return self.cursor_paginator.get_paginated_response(data)
+    return super().get_paginated_response(data)
+
+
+  def to_html(self):
+    if self.cursor_paginator is not None:
+      return self.cursor_paginator.to_html()
+    return super().to_html()
+
+
+  def get_schema_operation_parameters(self, view):
+    parameters = super().get_schema_operation_parameters(view)
+    cursor_parameters = self.cursor_pagination_class().get_schema_operation_parameters(view)
+    parameters += [p for p in cursor_parameters if p['name'] != self.page_size_query_param]
+    parameters.append({
+      'name': self.pagination_query_param,
+      'required': False,
+      'in': 'query',
+      'description': 'Pagination style, `page` (default) or `cursor`.',
+      'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+    })
+    return parameters
+
+
+class SearchPagination(PageNumberPagination):
+  """
+  Pagination class with stardard 20 and max 100 for ranked search results,
+  which have no (updated_at, id) order to keep a cursor on
   """
   page_size = 20
   page_size_query_param = QUERY_PARAM
-  max_page_size = 100
\ No newline at end of file
+  max_page_size = 100
+
+
+def rating_order(request, pagination_class) -> tuple[str, ...] | None:
+  """
+  The ordering asked for with `?order=rating`, None for the default one.
+  Keyset pages are keyed on (updated_at, id), so the rating order is only
+  offered with page number pagination
+  """
+  order = request.query_params.get(ORDER_QUERY_PARAM)
+  if order is None:
+    return None
+  if order != 'rating':
+    raise BadRequest("order must be 'rating'")
+  if pagination_class.is_cursor_request(request):
+    raise BadRequest('the rating order is only available with page number pagination')
+  return RATING_ORDERING
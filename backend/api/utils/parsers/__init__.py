@@ -0,0 +1,2 @@
+from .orjson_parser import ORJSONParser
+from .msgpack_parser import MessagePackParser
@@ -0,0 +1,21 @@
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from api.utils.renderers import MessagePackRenderer
+
+
+class MessagePackParser(BaseParser):
+  """
+  Parses MessagePack request bodies. Map keys must be strings and
+  timestamps are decoded to aware datetimes, which the serializer
+  DateTimeFields accept as they are.
+  """
+  media_type = 'application/msgpack'
+  renderer_class = MessagePackRenderer
+
+  def parse(self, stream, media_type=None, parser_context=None):
+    try:
+      return msgpack.unpackb(stream.read(), raw=False, timestamp=3)
+    except (ValueError, msgpack.UnpackException) as exc:
+      raise ParseError('MessagePack parse error - %s' % str(exc))
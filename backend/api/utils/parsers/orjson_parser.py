@@ -0,0 +1,24 @@
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+class ORJSONParser(JSONParser):
+  """
+  JSONParser decoding with orjson. orjson only reads UTF-8 and always
+  rejects NaN and Infinity, so other charsets and non strict settings are
+  left to DRF.
+  """
+  def parse(self, stream, media_type=None, parser_context=None):
+    parser_context = parser_context or {}
+    encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+    if not self.strict or codecs.lookup(encoding).name != 'utf-8':
+      return super().parse(stream, media_type, parser_context)
+
+    try:
+      return orjson.loads(stream.read())
+    except orjson.JSONDecodeError as exc:
+      raise ParseError('JSON parse error - %s' % str(exc))
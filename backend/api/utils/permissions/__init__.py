@@ -1,3 +1,4 @@
 from .is_staff_or_owner_or_read_only import IsStaffOrOwnerOrReadOnly
 from .is_staff_or_owner import IsStaffOrOwner
-from .is_staff_or_read_only import IsStaffOrReadOnly
\ No newline at end of file
+from .is_staff_or_read_only import IsStaffOrReadOnly
+from .is_authenticated_for_videos import IsAuthenticatedForVideos, is_lesson_video
\ No newline at end of file
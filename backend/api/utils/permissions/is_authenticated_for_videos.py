@@ -0,0 +1,27 @@
+import posixpath
+
+from rest_framework import permissions
+
+from course.models import Lesson
+
+
+def is_lesson_video(path : str) -> bool:
+  """
+  Whether the MEDIA_ROOT relative `path` is the video of a lesson. Decided by
+  reference rather than extension, uploads keep whatever name they came with
+  """
+  name = posixpath.normpath(path).lstrip('/')
+  return Lesson.objects.filter(video=name).exists()
+
+
+class IsAuthenticatedForVideos(permissions.BasePermission):
+  """
+  Custom permission to only allow authenticated users to fetch video files.
+  Assumes that the view gets the file `path` as a url kwarg.
+  """
+  message = 'only authenticated users have access to videos'
+
+  def has_permission(self, request, view):
+    if request.user and request.user.is_authenticated:
+      return True
+    return not is_lesson_video(view.kwargs.get('path', ''))
@@ -0,0 +1 @@
+from .query_plan_advisor import HotQuery, QueryPlan, HOT_QUERIES, explain_hot_query
@@ -0,0 +1,186 @@
+from dataclasses import dataclass, field
+from urllib.parse import urlparse, parse_qs
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models.lookups import Exact
+from django.http import Http404
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.mixins import ListModelMixin
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.views import (
+  CategoryListCreate, CourseListCreate, LessonListCreate, CommentListCreate,
+  SaveListCreate, SaveRetrieveDestroy, WatchedListCreate, WatchedRetrieveUpdateDestroy,
+  )
+from api.utils.pagination.pagination_classes import KeysetPagination, StandardPagination
+
+
+@dataclass
+class HotQuery:
+  """
+  A list/retrieve request whose queries must stay index backed.
+  `deep_cursor` requests a keyset page far away from the first one and
+  `sorts` marks queries whose range filter cannot share an index with the
+  ordering, so a temp B-tree sort of the filtered rows is expected.
+  """
+  name : str
+  view : type
+  params : dict = field(default_factory=dict)
+  kwargs : dict = field(default_factory=dict)
+  staff : bool = False
+  deep_cursor : bool = False
+  sorts : bool = False
+
+
+@dataclass
+class QueryPlan:
+  sql : str
+  plan : list[str]
+  is_count : bool
+  sorts : bool = False
+
+  @property
+  def full_scans(self) -> list[str]:
+    return [line for line in self.plan if line.startswith('SCAN ') and ' USING ' not in line]
+
+  @property
+  def temp_sorts(self) -> list[str]:
+    if self.sorts:
+      return []
+    return [line for line in self.plan if 'USE TEMP B-TREE' in line]
+
+  @property
+  def is_flagged(self) -> bool:
+    # a page-number COUNT(*) over an unfiltered table is a scan by nature
+    return not self.is_count and bool(self.full_scans or self.temp_sorts)
+
+
+HOT_QUERIES = [
+  HotQuery('categories', CategoryListCreate),
+  HotQuery('categories by name', CategoryListCreate, kwargs={'name': 'python'}),
+  HotQuery('courses', CourseListCreate),
+  HotQuery('courses by lesson count', CourseListCreate, params={'min_lessons': 3, 'max_lessons': 10}, sorts=True),
+  HotQuery('courses by title', CourseListCreate, params={'title': 'python'}),
+  HotQuery('courses by rating', CourseListCreate, params={'order': 'rating'}),
+  HotQuery('lessons', LessonListCreate),
+  HotQuery('lessons deep cursor', LessonListCreate, deep_cursor=True),
+  HotQuery('lessons by title', LessonListCreate, params={'title': 'python'}),
+  HotQuery('lessons by rating', LessonListCreate, params={'order': 'rating'}),
+  HotQuery('comments', CommentListCreate),
+  HotQuery('comments deep cursor', CommentListCreate, deep_cursor=True),
+  HotQuery('comments by lesson', CommentListCreate, params={'lesson': 'python'}),
+  HotQuery('comments by user', CommentListCreate, params={'user': 'john'}),
+  HotQuery('saves', SaveListCreate),
+  HotQuery('saves deep cursor', SaveListCreate, deep_cursor=True),
+  HotQuery('saves as staff', SaveListCreate, staff=True),
+  HotQuery('save', SaveRetrieveDestroy, kwargs={'pk': 1}),
+  HotQuery('watcheds', WatchedListCreate),
+  HotQuery('watcheds deep cursor', WatchedListCreate, deep_cursor=True),
+  HotQuery('watcheds as staff', WatchedListCreate, staff=True),
+  HotQuery('watched', WatchedRetrieveUpdateDestroy, kwargs={'pk': 1}),
+]
+
+
+def deep_cursor() -> str:
+  paginator = KeysetPagination()
+  paginator.base_url = '/'
+  url = paginator.encode_cursor({'updated_at': timezone.now(), 'id': 2 ** 31}, reverse=False)
+  return parse_qs(urlparse(url).query)[paginator.cursor_query_param][0]
+
+
+def build_view(hot_query : HotQuery):
+  params = dict(hot_query.params)
+  if hot_query.deep_cursor:
+    params[KeysetPagination.cursor_query_param] = deep_cursor()
+
+  request = APIRequestFactory().get('/', params, HTTP_ACCEPT='application/json; version=v1')
+  # an unsaved user is enough to build the user filters, nothing is written
+  force_authenticate(request, user=User(pk=1, username='query-plan-advisor', is_staff=hot_query.staff))
+
+  view = hot_query.view()
+  view.args, view.kwargs = (), hot_query.kwargs
+  view.format_kwarg = None
+  view.request = view.initialize_request(request, **hot_query.kwargs)
+  view.headers = view.default_response_headers
+  view.initial(view.request, **hot_query.kwargs)
+  return view
+
+
+def run_view_queries(view, is_list : bool):
+  if is_list:
+    queryset = view.filter_queryset(view.get_queryset())
+    if hasattr(view, 'get_collection_fingerprint'):
+      view.get_collection_fingerprint(queryset)
+    if StandardPagination.is_cursor_request(view.request):
+      view.paginate_queryset(queryset)
+    else:
+      # what the page-number paginator runs once there is data to show,
+      # the offset of deeper pages does not change the plan
+      queryset.count()
+      list(queryset[:view.paginator.get_page_size(view.request)])
+  else:
+    try:
+      view.get_object()
+    except Http404:
+      pass
+
+
+def explain(sql : str) -> list[str]:
+  with connection.cursor() as cursor:
+    cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+    return [row[-1] for row in cursor.fetchall()]
+
+
+def suggest_index(queryset) -> list[str] | None:
+  """
+  Proposes a composite index made of the equality filters on the queried
+  table followed by its ordering, e.g. (user_id, updated_at).
+  Returns None when the model already declares that index or the ordering
+  is on a joined table.
+  """
+  query = queryset.query
+  base_alias = query.get_initial_alias()
+  columns = []
+
+  def collect(node):
+    for child in node.children:
+      if hasattr(child, 'children'):
+        collect(child)
+      elif isinstance(child, Exact) and getattr(child.lhs, 'alias', None) == base_alias:
+        columns.append(child.lhs.target.column)
+  collect(query.where)
+
+  ordering = [name.lstrip('-') for name in query.order_by if name.lstrip('-') not in ('id', 'pk')]
+  if any('__' in name for name in ordering):
+    # ordered by a joined table, no index on this one can serve the order
+    return None
+  opts = queryset.model._meta
+  for name in ordering:
+    column = opts.get_field(name).column
+    if column not in columns:
+      columns.append(column)
+
+  declared = [[opts.get_field(name).column for name in index.fields] for index in opts.indexes]
+  if not columns or columns in declared:
+    return None
+  return columns
+
+
+def explain_hot_query(hot_query : HotQuery) -> tuple[list[QueryPlan], list[str] | None]:
+  """
+  Runs the queries the view issues for `hot_query` and returns their plans
+  together with an index suggestion for the view queryset
+  """
+  view = build_view(hot_query)
+  is_list = isinstance(view, ListModelMixin)
+  with CaptureQueriesContext(connection) as captured:
+    run_view_queries(view, is_list)
+
+  # the conditional GET fingerprint counts the same rows as the paginator
+  plans = [
+    QueryPlan(query['sql'], explain(query['sql']), query['sql'].startswith(('SELECT COUNT(*)', 'SELECT MAX(')), hot_query.sorts)
+    for query in captured.captured_queries if query['sql'].startswith('SELECT')]
+  suggestion = suggest_index(view.get_queryset()) if is_list else None
+  return plans, suggestion
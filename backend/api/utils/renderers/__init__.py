@@ -0,0 +1,2 @@
+from .orjson_renderer import ORJSONRenderer
+from .msgpack_renderer import MessagePackRenderer
@@ -0,0 +1,21 @@
+import msgpack
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils import encoders
+
+
+class MessagePackRenderer(BaseRenderer):
+  """
+  Renders the serializer data as MessagePack. Values msgpack has no type
+  for (datetimes, decimals, lazy strings...) go through the DRF JSON
+  encoder, so they carry the same values as in the JSON responses.
+  """
+  media_type = 'application/msgpack'
+  format = 'msgpack'
+  charset = None
+  render_style = 'binary'
+  encoder_class = encoders.JSONEncoder
+
+  def render(self, data, accepted_media_type=None, renderer_context=None):
+    if data is None:
+      return b''
+    return msgpack.packb(data, default=self.encoder_class().default, use_bin_type=True)
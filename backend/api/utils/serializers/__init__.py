@@ -0,0 +1,4 @@
+from .values_list_serializer import ValuesListSerializer, row_converters
+from .cover_srcset_field import CoverSrcsetField
+from .rendered_text_field import RenderedTextField
+from .column_bounds import column_max_value
@@ -0,0 +1,13 @@
+from django.core.validators import MaxValueValidator
+
+
+def column_max_value(model, field_name : str) -> int | None:
+  """
+  The greatest value the column of `model.field_name` holds on the default
+  database, as ModelSerializer derives it, for plain serializer fields
+  writing to that column
+  """
+  limits = [
+    validator.limit_value for validator in model._meta.get_field(field_name).validators
+    if isinstance(validator, MaxValueValidator) and not callable(validator.limit_value)]
+  return min(limits, default=None)
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.urls import reverse
+from rest_framework import serializers
+
+
+class CoverSrcsetField(serializers.Field):
+  """
+  Read only map of width to the URL of the cover scaled to that width, for
+  `srcset`. The format is negotiated by the derivative endpoint, so the URLs
+  do not depend on the client. Null when there is no cover.
+  """
+  def __init__(self, **kwargs):
+    kwargs.setdefault('source', 'cover')
+    kwargs['read_only'] = True
+    super().__init__(**kwargs)
+
+
+  def to_representation(self, value):
+    if not value:
+      return None
+
+    request = self.context.get('request')
+    name = f'{value.instance._meta.model_name}-cover'
+    srcset = {}
+    for width in settings.COVER_WIDTHS:
+      url = reverse(name, kwargs={'pk': value.instance.pk, 'width': width})
+      srcset[str(width)] = request.build_absolute_uri(url) if request is not None else url
+    return srcset
@@ -0,0 +1,18 @@
+from rest_framework import serializers
+
+
+class RenderedTextField(serializers.CharField):
+  """
+  Text written as is to its source column and read back from `read_source`,
+  the html rendered from it when the row was saved (see Lesson.text_html),
+  so reads carry the column once and render nothing.
+  """
+  def __init__(self, read_source : str, **kwargs):
+    self.read_source = read_source
+    super().__init__(**kwargs)
+
+
+  def get_attribute(self, instance):
+    if isinstance(instance, dict):
+      return instance.get(self.read_source)
+    return getattr(instance, self.read_source)
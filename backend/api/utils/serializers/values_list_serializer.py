@@ -0,0 +1,105 @@
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+# fields whose representation only depends on the column value
+COLUMN_FIELDS = (
+  serializers.BooleanField, serializers.CharField, serializers.ChoiceField, serializers.DateField,
+  serializers.DateTimeField, serializers.DecimalField, serializers.DurationField, serializers.FloatField,
+  serializers.IntegerField, serializers.ReadOnlyField, serializers.TimeField, serializers.UUIDField,
+)
+
+# what the `to_representation` of these exact classes boils down to
+SIMPLE_CONVERTERS = {
+  serializers.IntegerField: int,
+  serializers.CharField: str,
+  serializers.FloatField: float,
+  serializers.ReadOnlyField: None,
+}
+
+
+def datetime_converter(field : serializers.DateTimeField):
+  """
+  `field.to_representation` with the output format and time zone resolved
+  once, instead of for every value
+  """
+  output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+  if output_format is None or output_format.lower() != ISO_8601:
+    return field.to_representation
+  field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+  if field_timezone is None:
+    return field.to_representation
+
+  def convert(value):
+    if not isinstance(value, datetime) or value.utcoffset() is None:
+      return field.to_representation(value)
+    value = value.astimezone(field_timezone).isoformat()
+    return value[:-6] + 'Z' if value.endswith('+00:00') else value
+  return convert
+
+
+def column_converter(field):
+  """A cheaper equivalent of `field.to_representation` for column values, None for the identity"""
+  if type(field) in SIMPLE_CONVERTERS:
+    return SIMPLE_CONVERTERS[type(field)]
+  if type(field) is serializers.DateTimeField:
+    return datetime_converter(field)
+  return field.to_representation
+
+
+def row_converters(serializer) -> list[tuple[str, str, object]] | None:
+  """
+  `(field name, column, converter)` for every field `serializer` renders,
+  None when one of them needs a model instance (files, methods, nested or
+  dotted sources...). Foreign keys are rendered from their `_id` column.
+  """
+  if type(serializer).to_representation is not serializers.Serializer.to_representation:
+    return None
+
+  model = serializer.Meta.model
+  converters = []
+  for name, field in serializer.fields.items():
+    if field.write_only:
+      continue
+    if len(field.source_attrs) != 1:
+      return None
+    try:
+      model_field = model._meta.get_field(getattr(field, 'read_source', field.source))
+    except FieldDoesNotExist:
+      return None
+    if not model_field.concrete or model_field.many_to_many:
+      return None
+
+    if model_field.is_relation:
+      if type(field) is not serializers.PrimaryKeyRelatedField or field.pk_field is not None:
+        return None
+      converters.append((name, model_field.attname, None))
+    elif isinstance(field, COLUMN_FIELDS):
+      converters.append((name, model_field.attname, column_converter(field)))
+    else:
+      return None
+  return converters
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+  """
+  ListSerializer that renders `.values()` rows, as read by ValuesListMixin,
+  without building model instances. The output is the same as the child
+  serializer's; model instances are still rendered by the child.
+  """
+
+  def to_representation(self, data):
+    rows = list(data)
+    if not rows or not isinstance(rows[0], dict):
+      return super().to_representation(rows)
+
+    converters = row_converters(self.child)
+    return [
+      {
+        name: None if (value := row[column]) is None else value if convert is None else convert(value)
+        for name, column, convert in converters
+      }
+      for row in rows]
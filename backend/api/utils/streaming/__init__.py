@@ -0,0 +1,3 @@
+from .ranged_file_response import FileRange, RangeNotSatisfiable, parse_range, ranged_file_response
+from .file_content_negotiation import FileContentNegotiation
+from .sendfile_response import internal_location, sendfile_response
@@ -0,0 +1,16 @@
+from rest_framework.negotiation import BaseContentNegotiation
+
+
+class FileContentNegotiation(BaseContentNegotiation):
+  """
+  Negotiation for views answering with files: players send `Accept: video/*`
+  and similar, which must not end in a 406. Errors are rendered with the
+  first renderer.
+  """
+
+  def select_parser(self, request, parsers):
+    return parsers[0]
+
+
+  def select_renderer(self, request, renderers, format_suffix=None):
+    return renderers[0], renderers[0].media_type
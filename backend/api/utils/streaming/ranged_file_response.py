@@ -0,0 +1,139 @@
+import mimetypes
+import os
+from datetime import datetime, timezone
+
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+  pass
+
+
+def parse_range(header : str | None, size : int) -> tuple[int, int] | None:
+  """
+  The `(first, last)` bytes, both included, of a `Range: bytes=` header.
+  None when the whole file has to be sent: no header, another unit, a
+  syntax error or several ranges, which servers may ignore (RFC 9110 14.2)
+  """
+  if not header:
+    return None
+  unit, _, ranges = header.partition('=')
+  if unit.strip().lower() != 'bytes' or ',' in ranges:
+    return None
+
+  first, separator, last = ranges.strip().partition('-')
+  if not separator or not (first or last) or not (first or '0').isdigit() or not (last or '0').isdigit():
+    return None
+
+  if not first:
+    # suffix range, the last `last` bytes
+    if int(last) == 0 or size == 0:
+      raise RangeNotSatisfiable
+    return max(size - int(last), 0), size - 1
+
+  first = int(first)
+  last = min(int(last), size - 1) if last else size - 1
+  if first > last:
+    if first >= size:
+      raise RangeNotSatisfiable
+    return None
+  return first, last
+
+
+class FileRange:
+  """
+  Read only view on `length` bytes of `file` from `offset`. The file
+  position is left at `offset`, so WSGI servers that sendfile() what
+  `fileno()` points at (bounded by Content-Length, like gunicorn) stream it
+  zero-copy; any other server gets it through `read`.
+  """
+  def __init__(self, file, offset : int, length : int):
+    file.seek(offset)
+    self.file = file
+    self.remaining = length
+
+
+  def read(self, size : int = -1) -> bytes:
+    if size < 0 or size > self.remaining:
+      size = self.remaining
+    data = self.file.read(size)
+    self.remaining -= len(data)
+    return data
+
+
+  def fileno(self) -> int:
+    return self.file.fileno()
+
+
+  def close(self):
+    self.file.close()
+
+
+def file_validators(stat) -> tuple[str, datetime]:
+  etag = '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+  return etag, datetime.fromtimestamp(int(stat.st_mtime), tz=timezone.utc)
+
+
+def if_range_matches(request, etag : str, last_modified : datetime) -> bool:
+  """Whether the `If-Range` validator, if any, still matches, which only a strong comparison can tell"""
+  if_range = request.headers.get('If-Range')
+  if if_range is None:
+    return True
+  if if_range.startswith('"'):
+    return if_range == etag
+  date = parse_http_date_safe(if_range)
+  return date is not None and date == int(last_modified.timestamp())
+
+
+def ranged_file_response(request, path : str, content_type : str | None = None,
+                         etag : str | None = None, last_modified : datetime | None = None):
+  """
+  Answers a GET or HEAD for the file at `path`, honoring `Range`,
+  `If-Range` and the `If-None-Match`/`If-Modified-Since` preconditions with
+  206, 416 and 304 answers. The body is a FileResponse over the requested
+  bytes only. The validators default to the file mtime and size.
+  """
+  stat = os.stat(path)
+  default_etag, default_last_modified = file_validators(stat)
+  etag = etag or default_etag
+  last_modified = last_modified or default_last_modified
+  headers = {
+    'Accept-Ranges': 'bytes',
+    'ETag': etag,
+    'Last-Modified': http_date(last_modified.timestamp()),
+  }
+  not_modified = get_conditional_response(request, etag=etag, last_modified=int(last_modified.timestamp()))
+  if not_modified is not None:
+    not_modified['ETag'] = etag
+    not_modified['Last-Modified'] = headers['Last-Modified']
+    return not_modified
+
+  size = stat.st_size
+  content_type = content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+  byte_range = None
+  if if_range_matches(request, etag, last_modified):
+    try:
+      byte_range = parse_range(request.headers.get('Range'), size)
+    except RangeNotSatisfiable:
+      return HttpResponse(status=416, headers={**headers, 'Content-Range': f'bytes */{size}'})
+
+  status, (first, last) = (206, byte_range) if byte_range is not None else (200, (0, size - 1))
+  length = last - first + 1
+  headers['Content-Length'] = str(length)
+  if status == 206:
+    headers['Content-Range'] = f'bytes {first}-{last}/{size}'
+
+  if request.method == 'HEAD':
+    return HttpResponse(status=status, content_type=content_type, headers=headers)
+
+  response = FileResponse(FileRange(open(path, 'rb'), first, length), status=status, content_type=content_type)
+  response.block_size = STREAM_BLOCK_SIZE
+  for header, value in headers.items():
+    response[header] = value
+  return response
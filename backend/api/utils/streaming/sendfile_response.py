@@ -0,0 +1,46 @@
+import mimetypes
+import os
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+
+from .ranged_file_response import ranged_file_response
+
+
+SENDFILE_HEADERS = {
+  'x-accel-redirect': 'X-Accel-Redirect',
+  'x-sendfile': 'X-Sendfile',
+}
+
+
+def internal_location(path : str) -> str | None:
+  """The URI of `path` under the internal proxy location mapped to its root, if any"""
+  for root, location in settings.MEDIA_ACCEL_REDIRECT_LOCATIONS.items():
+    root = os.path.abspath(root)
+    if os.path.commonpath((root, path)) == root:
+      return location.rstrip('/') + '/' + quote(os.path.relpath(path, root).replace(os.sep, '/'))
+  return None
+
+
+def sendfile_response(request, path : str, content_type : str | None = None, **validators):
+  """
+  Hands the transfer of the file at `path` to the front proxy with the
+  MEDIA_SENDFILE_BACKEND header once the view has authorized it; the proxy
+  then deals with ranges and preconditions. Without a backend (local
+  development) the file is streamed by ranged_file_response instead.
+  """
+  backend = settings.MEDIA_SENDFILE_BACKEND
+  if not backend:
+    return ranged_file_response(request, path, content_type, **validators)
+  if backend not in SENDFILE_HEADERS:
+    raise ImproperlyConfigured(f'MEDIA_SENDFILE_BACKEND must be one of {", ".join(SENDFILE_HEADERS)}')
+
+  path = os.path.abspath(path)
+  target = internal_location(path) if backend == 'x-accel-redirect' else path
+  if target is None:
+    return ranged_file_response(request, path, content_type, **validators)
+
+  content_type = content_type or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+  return HttpResponse(content_type=content_type, headers={SENDFILE_HEADERS[backend]: target})
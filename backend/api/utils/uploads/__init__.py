@@ -0,0 +1,5 @@
+from .resumable_upload import (
+  CHECKSUM_ALGORITHMS, ChecksumMismatch, OffsetMismatch, UploadLocked, UploadTooLarge,
+  append_chunk, create_part, finish_upload, remove_part,
+  )
+from .content_hash_upload_handlers import ContentHashMemoryFileUploadHandler, ContentHashTemporaryFileUploadHandler
@@ -0,0 +1,37 @@
+import hashlib
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+
+
+class ContentHashMixin:
+  """
+  Upload handler mixin hashing the chunks it keeps as they stream in, and
+  setting the sha256 as the `content_hash` of the uploaded file, so the
+  content addressed storage does not read the file again to name it
+  """
+
+  def new_file(self, *args, **kwargs):
+    self.content_hash = hashlib.sha256()
+    super().new_file(*args, **kwargs)
+
+
+  def receive_data_chunk(self, raw_data, start):
+    passed_on = super().receive_data_chunk(raw_data, start)
+    if passed_on is None:
+      self.content_hash.update(raw_data)
+    return passed_on
+
+
+  def file_complete(self, file_size):
+    file = super().file_complete(file_size)
+    if file is not None:
+      file.content_hash = self.content_hash.hexdigest()
+    return file
+
+
+class ContentHashMemoryFileUploadHandler(ContentHashMixin, MemoryFileUploadHandler):
+  pass
+
+
+class ContentHashTemporaryFileUploadHandler(ContentHashMixin, TemporaryFileUploadHandler):
+  pass
@@ -0,0 +1,187 @@
+import fcntl
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.core.files import File
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from course.models import VideoUpload
+
+
+BLOCK_SIZE = 1024 * 1024
+CHECKSUM_ALGORITHMS = ('sha1', 'sha256', 'md5')
+# sha256 states of the uploads this process received chunks for
+HASHER_CACHE_SIZE = 128
+
+
+class OffsetMismatch(APIException):
+  status_code = status.HTTP_409_CONFLICT
+  default_detail = 'Upload-Offset does not match the offset of the upload'
+
+
+class UploadLocked(APIException):
+  status_code = status.HTTP_423_LOCKED
+  default_detail = 'another chunk of this upload is being written'
+
+
+class UploadTooLarge(APIException):
+  status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+  default_detail = 'the chunk goes past the Upload-Length of the upload'
+
+
+class ChecksumMismatch(APIException):
+  status_code = 460
+  default_detail = 'the chunk does not match its Upload-Checksum'
+
+
+_hashers : OrderedDict = OrderedDict()
+_hashers_lock = threading.Lock()
+
+
+def get_hasher(upload : VideoUpload):
+  """
+  The sha256 of the first `upload.offset` bytes. Kept from the previous
+  chunk when it was received by this process, else read back from the
+  partial file in blocks.
+  """
+  with _hashers_lock:
+    entry = _hashers.pop(upload.pk, None)
+  if entry is not None and entry[0] == upload.offset:
+    return entry[1]
+
+  hasher = hashlib.sha256()
+  remaining = upload.offset
+  with open(upload.part_path, 'rb') as part:
+    while remaining:
+      block = part.read(min(BLOCK_SIZE, remaining))
+      if not block:
+        break
+      hasher.update(block)
+      remaining -= len(block)
+  return hasher
+
+
+def keep_hasher(upload : VideoUpload, hasher):
+  with _hashers_lock:
+    _hashers[upload.pk] = (upload.offset, hasher)
+    while len(_hashers) > HASHER_CACHE_SIZE:
+      _hashers.popitem(last=False)
+
+
+def forget_hasher(upload : VideoUpload):
+  with _hashers_lock:
+    _hashers.pop(upload.pk, None)
+
+
+def create_part(upload : VideoUpload):
+  os.makedirs(os.path.dirname(upload.part_path), exist_ok=True)
+  with open(upload.part_path, 'xb'):
+    pass
+
+
+@contextmanager
+def locked_part(upload : VideoUpload):
+  """
+  The partial file opened for writing under an exclusive lock, with the
+  upload offset refreshed, so concurrent chunks never interleave
+  """
+  try:
+    part = open(upload.part_path, 'r+b')
+  except FileNotFoundError:
+    raise OffsetMismatch('the partial file of this upload is gone')
+  with part:
+    try:
+      fcntl.flock(part.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+      raise UploadLocked
+    upload.refresh_from_db(fields=['offset', 'completed_at'])
+    yield part
+
+
+def append_chunk(upload : VideoUpload, offset : int, stream, length : int,
+                 checksum : tuple[str, bytes] | None = None) -> VideoUpload:
+  """
+  Writes `length` bytes of `stream` at `offset`, which has to be the current
+  offset of the upload, reading and hashing them a block at a time. With a
+  `(algorithm, digest)` checksum a chunk that does not match is dropped.
+  Finishes the upload once its last byte is written.
+  """
+  with locked_part(upload) as part:
+    if upload.completed_at is not None or offset != upload.offset:
+      raise OffsetMismatch
+    if offset + length > upload.length:
+      raise UploadTooLarge
+
+    hasher = get_hasher(upload)
+    file_hasher = hasher.copy()
+    chunk_hasher = hashlib.new(checksum[0]) if checksum is not None else None
+
+    part.seek(offset)
+    written = 0
+    while stream is not None and written < length:
+      try:
+        block = stream.read(min(BLOCK_SIZE, length - written))
+      except OSError:
+        # the client went away, UnreadablePostError included
+        break
+      if not block:
+        break
+      part.write(block)
+      file_hasher.update(block)
+      if chunk_hasher is not None:
+        chunk_hasher.update(block)
+      written += len(block)
+
+    if chunk_hasher is not None and chunk_hasher.digest() != checksum[1]:
+      part.truncate(offset)
+      keep_hasher(upload, hasher)
+      raise ChecksumMismatch
+
+    # whatever made it to disk counts, so an interrupted chunk is resumed where it stopped
+    part.truncate(offset + written)
+    part.flush()
+    os.fsync(part.fileno())
+    VideoUpload.objects.filter(pk=upload.pk).update(offset=offset + written, updated_at=timezone.now())
+    upload.offset = offset + written
+
+    if upload.offset == upload.length:
+      finish_upload(upload, file_hasher)
+    else:
+      keep_hasher(upload, file_hasher)
+  return upload
+
+
+class PartFile(File):
+  """The finished partial file, moved rather than copied by FileSystemStorage"""
+  def temporary_file_path(self) -> str:
+    return self.file.name
+
+
+def finish_upload(upload : VideoUpload, hasher=None):
+  """Moves the partial file into the lesson `video` and records its sha256"""
+  hasher = hasher or get_hasher(upload)
+  lesson = upload.lesson
+  with open(upload.part_path, 'rb') as part:
+    video = PartFile(part)
+    video.content_hash = hasher.hexdigest()
+    lesson.video.save(upload.filename, video, save=False)
+  lesson.save(update_fields=['video', 'updated_at'])
+
+  upload.sha256 = video.content_hash
+  upload.completed_at = timezone.now()
+  upload.save(update_fields=['sha256', 'completed_at', 'updated_at'])
+  forget_hasher(upload)
+  remove_part(upload)
+
+
+def remove_part(upload : VideoUpload):
+  forget_hasher(upload)
+  try:
+    os.remove(upload.part_path)
+  except FileNotFoundError:
+    pass
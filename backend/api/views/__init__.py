@@ -1,6 +1,10 @@
 from .category_views import CategoryListCreate, CategoryRetrieveUpdateDestroy
 from .course_views import CourseListCreate, CourseRetrieveUpdateDestroy
 from .lesson_views import LessonListCreate, LessonRetrieveUpdateDestroy
-from .comment_views import CommentListCreate, CommentRetrieveUpdateDestroy
+from .comment_views import CommentListCreate, CommentRetrieveUpdateDestroy, CommentThread
 from .save_views import SaveListCreate, SaveRetrieveDestroy
-from .watched_views import WatchedListCreate, WatchedRetrieveUpdateDestroy
\ No newline at end of file
+from .watched_views import WatchedListCreate, WatchedRetrieveUpdateDestroy, WatchedHeartbeat, WatchedLessonUpsert
+from .search_views import SearchList
+from .media_views import MediaServe
+from .cover_views import CoverDerivative, LessonTextImageDerivative
+from .video_upload_views import VideoUploadCreate, VideoUploadDetail
@@ -1,18 +1,20 @@
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from django.shortcuts import get_object_or_404
-from django.http import Http404
 
 from api.serializers import CategorySerializerV1
 from course.models import Category
 from api.utils.pagination.pagination_classes import StandardPagination
+from api.utils.mixins import ConditionalGetMixin, DeferredFieldsMixin, NonEmptyListMixin
+from api.utils.cache import AnonymousResponseCacheMixin
 from api.utils.permissions import IsStaffOrReadOnly
 
 
 most_recent_serializer = CategorySerializerV1
 
 
-class CategoryListCreate(ListCreateAPIView):
+class CategoryListCreate(AnonymousResponseCacheMixin, ConditionalGetMixin, DeferredFieldsMixin, NonEmptyListMixin, ListCreateAPIView):
+  cache_dependencies = ('course.category', )
   permission_classes = [IsAuthenticatedOrReadOnly, IsStaffOrReadOnly, ]
   pagination_class = StandardPagination
 
@@ -29,11 +31,11 @@ class CategoryListCreate(ListCreateAPIView):
     if name != None:
       queryset = queryset.filter(name__icontains=name)
 
-    if not queryset: raise Http404
     return queryset.order_by('-updated_at')
   
 
-class CategoryRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
+class CategoryRetrieveUpdateDestroy(AnonymousResponseCacheMixin, ConditionalGetMixin, DeferredFieldsMixin, RetrieveUpdateDestroyAPIView):
+  cache_dependencies = ('course.category', )
   permission_classes = [IsAuthenticatedOrReadOnly, IsStaffOrReadOnly, ]
 
   def get_serializer_class(self):
@@ -45,8 +47,8 @@ class CategoryRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
   def get_object(self):
     name = self.kwargs.get('name')
     if name != None:
-      return get_object_or_404(Category, name=name)
-    return get_object_or_404(Category, pk=self.kwargs.get('pk'))
+      return get_object_or_404(self.filter_queryset(Category.objects.all()), name=name)
+    return get_object_or_404(self.filter_queryset(Category.objects.all()), pk=self.kwargs.get('pk'))
     
 
   
\ No newline at end of file
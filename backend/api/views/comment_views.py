@@ -1,18 +1,23 @@
-from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
+from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, GenericAPIView
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
 from django.core.exceptions import BadRequest
 from django.http import Http404
 
-from api.serializers import CommentSerializerV1
+from api.serializers import CommentSerializerV1, CommentThreadSerializerV1
 from course.models import Comment
 from api.utils.pagination.pagination_classes import StandardPagination
+from api.utils.mixins import ConditionalGetMixin, DeferredFieldsMixin, NonEmptyListMixin, ValuesListMixin
 from api.utils.permissions import IsStaffOrOwnerOrReadOnly
 
 
 most_recent_serializer = CommentSerializerV1
 
+THREAD_DEFAULT_DEPTH = 10
+THREAD_MAX_DEPTH = 30
 
-class CommentListCreate(ListCreateAPIView):
+
+class CommentListCreate(ConditionalGetMixin, ValuesListMixin, DeferredFieldsMixin, NonEmptyListMixin, ListCreateAPIView):
   permission_classes = [IsAuthenticatedOrReadOnly, ]
   pagination_class = StandardPagination
 
@@ -45,11 +50,10 @@ class CommentListCreate(ListCreateAPIView):
     if stars != None:
       queryset = queryset.filter(stars=int(stars))
 
-    if not queryset: raise Http404
     return queryset.order_by('-updated_at')
     
 
-class CommentRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
+class CommentRetrieveUpdateDestroy(ConditionalGetMixin, DeferredFieldsMixin, RetrieveUpdateDestroyAPIView):
   queryset = Comment.objects.all()
   permission_classes = [IsAuthenticatedOrReadOnly, IsStaffOrOwnerOrReadOnly,]
   
@@ -59,3 +63,20 @@ class CommentRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
       return CommentSerializerV1
 
     return most_recent_serializer
+
+
+class CommentThread(GenericAPIView):
+  """A comment and its replies nested up to `depth` levels, read in one query"""
+  permission_classes = [IsAuthenticatedOrReadOnly, ]
+  serializer_class = CommentThreadSerializerV1
+
+
+  def get(self, request, *args, **kwargs):
+    depth : str = request.query_params.get('depth', str(THREAD_DEFAULT_DEPTH))
+    if not depth.isdigit() or int(depth) > THREAD_MAX_DEPTH:
+      raise BadRequest(f'depth must be an integer between 0 and {THREAD_MAX_DEPTH}')
+
+    root = Comment.objects.thread(self.kwargs.get('pk'), int(depth))
+    if root is None:
+      raise Http404
+    return Response(self.get_serializer(root).data)
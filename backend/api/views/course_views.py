@@ -1,10 +1,10 @@
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
-from django.db.models import Count
 from django.shortcuts import get_object_or_404
-from django.http import Http404
 
-from api.utils.pagination.pagination_classes import StandardPagination
+from api.utils.pagination.pagination_classes import StandardPagination, rating_order
+from api.utils.mixins import ConditionalGetMixin, CoverProcessingMixin, DeferredFieldsMixin, NonEmptyListMixin
+from api.utils.cache import AnonymousResponseCacheMixin
 from course.models import Course
 from api.serializers import CourseSerializerV1
 from api.utils.permissions import IsStaffOrReadOnly
@@ -13,9 +13,11 @@ from api.utils.permissions import IsStaffOrReadOnly
 most_recent_serializer = CourseSerializerV1
 
 
-class CourseListCreate(ListCreateAPIView):
+class CourseListCreate(AnonymousResponseCacheMixin, ConditionalGetMixin, DeferredFieldsMixin, NonEmptyListMixin, CoverProcessingMixin, ListCreateAPIView):
+  cache_dependencies = ('course.course', 'course.category', 'course.lesson', 'course.coursestats', )
   permission_classes = [IsAuthenticatedOrReadOnly, IsStaffOrReadOnly, ]
   pagination_class = StandardPagination
+  validator_fields = ('updated_at', 'stats__updated_at', )
 
 
   def get_serializer_class(self):
@@ -25,7 +27,7 @@ class CourseListCreate(ListCreateAPIView):
   
 
   def get_queryset(self):
-    queryset = Course.objects.all()
+    queryset = Course.objects.select_related('stats')
 
     title = self.request.query_params.get('title')
     category = self.request.query_params.get('category')
@@ -39,23 +41,21 @@ class CourseListCreate(ListCreateAPIView):
       queryset = queryset.filter(category__name__icontains=category)
 
     if max_lessons != None:
-      max_lessons = int(max_lessons)
-      queryset = queryset.annotate(
-        lesson_count=Count('lesson')).filter(
-          lesson_count__lte=max_lessons)
+      queryset = queryset.filter(lesson_count__lte=int(max_lessons))
 
     if min_lessons != None:
-      min_lessons = int(min_lessons)
-      queryset = queryset.annotate(
-        lesson_count=Count('lesson')).filter(
-          lesson_count__gte=min_lessons)
-    
-    if not queryset: raise Http404
+      queryset = queryset.filter(lesson_count__gte=int(min_lessons))
+
+    order = rating_order(self.request, self.pagination_class)
+    if order is not None:
+      return queryset.filter(stats__isnull=False).order_by(*order)
     return queryset.order_by('-updated_at')
   
 
-class CourseRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
+class CourseRetrieveUpdateDestroy(AnonymousResponseCacheMixin, ConditionalGetMixin, DeferredFieldsMixin, CoverProcessingMixin, RetrieveUpdateDestroyAPIView):
+  cache_dependencies = ('course.course', 'course.coursestats', )
   permission_classes = [IsAuthenticatedOrReadOnly, IsStaffOrReadOnly, ]
+  validator_fields = ('updated_at', 'stats__updated_at', )
 
   def get_serializer_class(self):
     if self.request.version == 'v1':
@@ -66,8 +66,8 @@ class CourseRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
   def get_object(self):
     title = self.kwargs.get('title')
     if title != None:
-      return get_object_or_404(Course, title=title)
-    return get_object_or_404(Course, pk=self.kwargs.get('pk'))
+      return get_object_or_404(self.filter_queryset(Course.objects.select_related('stats')), title=title)
+    return get_object_or_404(self.filter_queryset(Course.objects.select_related('stats')), pk=self.kwargs.get('pk'))
     
   
   
\ No newline at end of file
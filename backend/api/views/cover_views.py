@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from PIL import Image, UnidentifiedImageError
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+
+from api.utils.images import (
+  CONTENT_TYPES, derivative_key, get_cover_cache, is_inline_image, negotiate_format, render_derivative,
+  )
+from api.utils.streaming import FileContentNegotiation, sendfile_response
+
+
+class ImageDerivative(APIView):
+  """
+  Serves the image given by `get_source` scaled down to one of COVER_WIDTHS,
+  as AVIF or WebP when the Accept header allows it. Derivatives are made on
+  first request and then served from the cover cache.
+  """
+  permission_classes = [AllowAny, ]
+  content_negotiation_class = FileContentNegotiation
+  versioning_class = None
+  max_age = 60 * 60 * 24
+
+
+  def get_source(self):
+    """The (storage, name) of the source image"""
+    raise NotImplementedError
+
+
+  def get(self, request, *args, **kwargs):
+    width = self.kwargs.get('width')
+    if width not in settings.COVER_WIDTHS:
+      raise Http404
+    storage, name = self.get_source()
+
+    try:
+      size, modified = storage.size(name), storage.get_modified_time(name)
+    except FileNotFoundError:
+      raise Http404
+    image_format = negotiate_format(request.headers.get('Accept', ''), name)
+    key = derivative_key(name, size, modified, width, image_format)
+
+    cache = get_cover_cache()
+    path = cache.get(key)
+    if path is None:
+      try:
+        with storage.open(name, 'rb') as source:
+          path = cache.put(key, render_derivative(source, width, image_format))
+      except (UnidentifiedImageError, Image.DecompressionBombError, OSError):
+        # missing, corrupt, truncated or oversized sources
+        raise Http404
+
+    response = sendfile_response(
+      request, path, CONTENT_TYPES[image_format], etag=f'"{key}"', last_modified=modified)
+    patch_vary_headers(response, ('Accept', ))
+    patch_cache_control(response, public=True, max_age=self.max_age)
+    return response
+
+
+class CoverDerivative(ImageDerivative):
+  """The cover of a `model` instance scaled down to one of COVER_WIDTHS"""
+  model = None
+
+  def get_source(self):
+    cover = get_object_or_404(self.model.objects.only('cover'), pk=self.kwargs.get('pk')).cover
+    if not cover:
+      raise Http404
+    return cover.storage, cover.name
+
+
+class LessonTextImageDerivative(ImageDerivative):
+  """An image inserted in a lesson text scaled down to one of COVER_WIDTHS"""
+
+  def get_source(self):
+    name = self.kwargs.get('name')
+    if not is_inline_image(name):
+      raise Http404
+    return default_storage, name
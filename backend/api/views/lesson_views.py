@@ -1,20 +1,23 @@
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from django.shortcuts import get_object_or_404
-from django.http import Http404
 
 from api.serializers import LessonSerializerV1
 from course.models import Lesson
-from api.utils.pagination.pagination_classes import StandardPagination
+from api.utils.pagination.pagination_classes import StandardPagination, rating_order
+from api.utils.mixins import ConditionalGetMixin, CoverProcessingMixin, DeferredFieldsMixin, NonEmptyListMixin
+from api.utils.cache import AnonymousResponseCacheMixin
 from api.utils.permissions import IsStaffOrReadOnly
 
 
 most_recent_serializer = LessonSerializerV1
 
 
-class LessonListCreate(ListCreateAPIView):
+class LessonListCreate(AnonymousResponseCacheMixin, ConditionalGetMixin, DeferredFieldsMixin, NonEmptyListMixin, CoverProcessingMixin, ListCreateAPIView):
+  cache_dependencies = ('course.lesson', 'course.course', 'course.lessonstats', )
   permission_classes = [IsAuthenticatedOrReadOnly, IsStaffOrReadOnly, ]
   pagination_class = StandardPagination
+  validator_fields = ('updated_at', 'stats__updated_at', )
 
   def get_serializer_class(self):
     if self.request.version == 'v1':
@@ -23,7 +26,7 @@ class LessonListCreate(ListCreateAPIView):
     return most_recent_serializer
   
   def get_queryset(self):
-    queryset = Lesson.objects.all()
+    queryset = Lesson.objects.select_related('stats')
 
     course = self.request.query_params.get('course')
     title = self.request.query_params.get('title')
@@ -35,13 +38,17 @@ class LessonListCreate(ListCreateAPIView):
       queryset = queryset.filter(title__icontains=title)
     if author != None:
       queryset = queryset.filter(author__username__icontains=author)
-      
-    if not queryset: raise Http404
+
+    order = rating_order(self.request, self.pagination_class)
+    if order is not None:
+      return queryset.filter(stats__isnull=False).order_by(*order)
     return queryset.order_by('-updated_at')
   
 
-class LessonRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
+class LessonRetrieveUpdateDestroy(AnonymousResponseCacheMixin, ConditionalGetMixin, DeferredFieldsMixin, CoverProcessingMixin, RetrieveUpdateDestroyAPIView):
+  cache_dependencies = ('course.lesson', 'course.lessonstats', )
   permission_classes = [IsAuthenticatedOrReadOnly, IsStaffOrReadOnly, ]
+  validator_fields = ('updated_at', 'stats__updated_at', )
 
   def get_serializer_class(self):
     if self.request.version == 'v1':
@@ -53,6 +60,6 @@ class LessonRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
   def get_object(self):
     title = self.kwargs.get('title')
     if title is not None:
-      return get_object_or_404(Lesson, title=title)
-    return get_object_or_404(Lesson, pk=self.kwargs.get('pk'))
+      return get_object_or_404(self.filter_queryset(Lesson.objects.select_related('stats')), title=title)
+    return get_object_or_404(self.filter_queryset(Lesson.objects.select_related('stats')), pk=self.kwargs.get('pk'))
 
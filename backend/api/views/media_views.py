@@ -0,0 +1,46 @@
+import os
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import Http404
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control
+from rest_framework.views import APIView
+
+from api.utils.permissions import IsAuthenticatedForVideos, is_lesson_video
+from api.utils.streaming import FileContentNegotiation, sendfile_response
+from course.storages import is_content_addressed
+
+
+# content addressed files never change, their URL changes with their content
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+
+class MediaServe(APIView):
+  """
+  Serves the uploaded files in MEDIA_ROOT with byte range support, so video
+  players can seek. Lesson videos are only served to authenticated users.
+  Files named by their content are cached as immutable. The bytes are sent
+  by the front proxy when MEDIA_SENDFILE_BACKEND is set.
+  """
+  permission_classes = [IsAuthenticatedForVideos, ]
+  content_negotiation_class = FileContentNegotiation
+  versioning_class = None
+
+
+  def get(self, request, *args, **kwargs):
+    try:
+      path = safe_join(settings.MEDIA_ROOT, self.kwargs.get('path'))
+    except SuspiciousFileOperation:
+      raise Http404
+    if not os.path.isfile(path):
+      raise Http404
+
+    response = sendfile_response(request, path)
+    if is_content_addressed(path):
+      # videos need a login, shared caches must not keep them
+      if is_lesson_video(self.kwargs.get('path')):
+        patch_cache_control(response, private=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+      else:
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    return response
@@ -1,18 +1,21 @@
 from rest_framework.generics import ListCreateAPIView, RetrieveDestroyAPIView
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-from api.serializers import SaveSerializerV1
+from api.serializers import SaveSerializerV1, SaveBulkSerializerV1, SaveBulkDeleteSerializerV1
 from course.models import Save
 from api.utils.pagination.pagination_classes import StandardPagination
+from api.utils.mixins import BulkCreateMixin, ConditionalGetMixin, DeferredFieldsMixin, ValuesListMixin
 from api.utils.permissions import IsStaffOrOwner
 
 
 most_recent_serializer = SaveSerializerV1
 
 
-class SaveListCreate(ListCreateAPIView):
+class SaveListCreate(BulkCreateMixin, ConditionalGetMixin, ValuesListMixin, DeferredFieldsMixin, ListCreateAPIView):
   permission_classes = [IsAuthenticated, ]
   pagination_class = StandardPagination
+  bulk_serializer_class = SaveBulkSerializerV1
 
   def get_serializer_class(self):
     if self.request.version == 'v1':
@@ -33,9 +36,28 @@ class SaveListCreate(ListCreateAPIView):
     context = super().get_serializer_context()
     context['request'] = self.request
     return context
+
+
+  def delete(self, request, *args, **kwargs):
+    """Deletes the user's saves of the `lessons` id list, sent in the body or as query params"""
+    data = request.data if 'lessons' in request.data else {'lessons': request.query_params.getlist('lessons')}
+    serializer = SaveBulkDeleteSerializerV1(data=data)
+    serializer.is_valid(raise_exception=True)
+    lessons = serializer.validated_data['lessons']
+
+    saves = Save.objects.filter(user=request.user, lesson_id__in=lessons)
+    found = dict(saves.values_list('lesson_id', 'pk'))
+    if found:
+      Save.objects.filter(pk__in=found.values()).delete()
+
+    results = [
+      {'lesson': lesson, 'status': 'deleted', 'id': found[lesson]} if lesson in found
+      else {'lesson': lesson, 'status': 'not_found'}
+      for lesson in lessons]
+    return Response(results)
   
 
-class SaveRetrieveDestroy(RetrieveDestroyAPIView):
+class SaveRetrieveDestroy(ConditionalGetMixin, DeferredFieldsMixin, RetrieveDestroyAPIView):
   permission_classes = [IsAuthenticated, IsStaffOrOwner,]
 
   def get_serializer_class(self):
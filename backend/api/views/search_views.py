@@ -0,0 +1,38 @@
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import AllowAny
+from django.core.exceptions import BadRequest
+
+from api.serializers import SearchResultSerializerV1
+from course.search import get_search_backend
+from course.search.documents import KINDS
+from api.utils.pagination.pagination_classes import SearchPagination
+
+
+most_recent_serializer = SearchResultSerializerV1
+
+
+class SearchList(ListAPIView):
+  permission_classes = [AllowAny, ]
+  pagination_class = SearchPagination
+
+  def get_serializer_class(self):
+    if self.request.version == 'v1':
+      return SearchResultSerializerV1
+
+    return most_recent_serializer
+
+
+  def get_queryset(self):
+    query : str | None = self.request.query_params.get('q')
+    kind : str | None = self.request.query_params.get('kind')
+
+    if not query:
+      raise BadRequest('a search query must be given with q')
+
+    kinds = None
+    if kind != None:
+      kinds = kind.split(',')
+      if any(k not in KINDS for k in kinds):
+        raise BadRequest(f'kind must be one of {", ".join(KINDS)}')
+
+    return get_search_backend().search(query, kinds)
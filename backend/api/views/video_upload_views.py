@@ -0,0 +1,175 @@
+import base64
+import binascii
+
+from django.conf import settings
+from django.core.exceptions import BadRequest
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.text import get_valid_filename
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from api.serializers import VideoUploadSerializerV1
+from course.models import Lesson, VideoUpload
+from api.utils.permissions import IsStaffOrOwner, IsStaffOrReadOnly
+from api.utils.streaming import FileContentNegotiation
+from api.utils.uploads import CHECKSUM_ALGORITHMS, append_chunk, create_part, finish_upload, remove_part
+
+
+TUS_VERSION = '1.0.0'
+TUS_EXTENSIONS = 'creation,checksum,termination'
+CHUNK_CONTENT_TYPE = 'application/offset+octet-stream'
+DEFAULT_FILENAME = 'video.mp4'
+
+
+def header_int(request, header : str) -> int:
+  value = request.headers.get(header, '')
+  if not value.isdigit():
+    raise BadRequest(f'{header} must be a non negative integer')
+  return int(value)
+
+
+def parse_metadata(header : str) -> dict[str, str]:
+  """`Upload-Metadata`: comma separated `key base64(value)` pairs"""
+  metadata = {}
+  for pair in filter(None, (pair.strip() for pair in header.split(','))):
+    key, _, value = pair.partition(' ')
+    try:
+      metadata[key] = base64.b64decode(value, validate=True).decode()
+    except (binascii.Error, UnicodeDecodeError):
+      raise BadRequest(f'Upload-Metadata {key} is not base64')
+  return metadata
+
+
+def parse_checksum(header : str | None) -> tuple[str, bytes] | None:
+  """`Upload-Checksum`: `algorithm base64(digest)`"""
+  if header is None:
+    return None
+  algorithm, _, digest = header.partition(' ')
+  if algorithm not in CHECKSUM_ALGORITHMS:
+    raise BadRequest(f'Upload-Checksum algorithm must be one of {", ".join(CHECKSUM_ALGORITHMS)}')
+  try:
+    return algorithm, base64.b64decode(digest, validate=True)
+  except binascii.Error:
+    raise BadRequest('Upload-Checksum digest is not base64')
+
+
+class PreconditionFailed(Exception):
+  pass
+
+
+class TusView(APIView):
+  """
+  Base of the resumable upload views, a subset of the tus 1.0 protocol
+  (https://tus.io/protocols/resumable-upload) with the creation, checksum
+  and termination extensions.
+  """
+  content_negotiation_class = FileContentNegotiation
+  versioning_class = None
+
+
+  def initial(self, request, *args, **kwargs):
+    super().initial(request, *args, **kwargs)
+    version = request.headers.get('Tus-Resumable')
+    if request.method != 'OPTIONS' and version is not None and version != TUS_VERSION:
+      raise PreconditionFailed
+
+
+  def handle_exception(self, exc):
+    if isinstance(exc, PreconditionFailed):
+      return Response(status=status.HTTP_412_PRECONDITION_FAILED, headers={'Tus-Version': TUS_VERSION})
+    return super().handle_exception(exc)
+
+
+  def finalize_response(self, request, response, *args, **kwargs):
+    response = super().finalize_response(request, response, *args, **kwargs)
+    response['Tus-Resumable'] = TUS_VERSION
+    return response
+
+
+  def options(self, request, *args, **kwargs):
+    return Response(status=status.HTTP_204_NO_CONTENT, headers={
+      'Tus-Version': TUS_VERSION,
+      'Tus-Extension': TUS_EXTENSIONS,
+      'Tus-Max-Size': str(settings.VIDEO_UPLOAD_MAX_SIZE),
+      'Tus-Checksum-Algorithm': ','.join(CHECKSUM_ALGORITHMS),
+    })
+
+
+class VideoUploadCreate(TusView):
+  """
+  Starts a resumable upload of the video of a lesson: `Upload-Length` is
+  the size of the file, `Upload-Metadata` may carry its `filename`
+  """
+  permission_classes = [IsAuthenticated, IsStaffOrReadOnly, ]
+
+
+  def post(self, request, *args, **kwargs):
+    lesson = get_object_or_404(Lesson, pk=self.kwargs.get('pk'))
+    length = header_int(request, 'Upload-Length')
+    if length > settings.VIDEO_UPLOAD_MAX_SIZE:
+      return Response(
+        {'detail': f'Upload-Length is over the maximum of {settings.VIDEO_UPLOAD_MAX_SIZE} bytes'},
+        status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+    metadata = parse_metadata(request.headers.get('Upload-Metadata', ''))
+    filename = get_valid_filename(metadata.get('filename', '').rsplit('/', 1)[-1] or DEFAULT_FILENAME)
+
+    upload = VideoUpload.objects.create(lesson=lesson, user=request.user, filename=filename, length=length)
+    create_part(upload)
+    if length == 0:
+      finish_upload(upload)
+
+    location = request.build_absolute_uri(reverse('video-upload', kwargs={'pk': upload.pk}))
+    return Response(status=status.HTTP_201_CREATED, headers={'Location': location, 'Upload-Offset': '0'})
+
+
+class VideoUploadDetail(TusView):
+  """
+  `HEAD` tells the offset to resume from, `PATCH` appends a chunk at
+  `Upload-Offset`, `DELETE` drops the upload. `GET` describes the upload,
+  with the sha256 of the file once it is complete.
+  """
+  permission_classes = [IsAuthenticated, IsStaffOrOwner, ]
+
+
+  def get_object(self) -> VideoUpload:
+    upload = get_object_or_404(VideoUpload.objects.select_related('lesson'), pk=self.kwargs.get('pk'))
+    self.check_object_permissions(self.request, upload)
+    return upload
+
+
+  def get(self, request, *args, **kwargs):
+    return Response(VideoUploadSerializerV1(self.get_object()).data)
+
+
+  def head(self, request, *args, **kwargs):
+    upload = self.get_object()
+    return Response(headers={
+      'Upload-Offset': str(upload.offset),
+      'Upload-Length': str(upload.length),
+      'Cache-Control': 'no-store',
+    })
+
+
+  def patch(self, request, *args, **kwargs):
+    upload = self.get_object()
+    if request.content_type.split(';')[0].strip() != CHUNK_CONTENT_TYPE:
+      return Response(
+        {'detail': f'chunks must be sent as {CHUNK_CONTENT_TYPE}'}, status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    offset = header_int(request, 'Upload-Offset')
+    length = int(request.headers.get('Content-Length') or 0)
+    checksum = parse_checksum(request.headers.get('Upload-Checksum'))
+    # the body is read from the stream as it is written, never buffered whole
+    upload = append_chunk(upload, offset, request.stream, length, checksum)
+    return Response(status=status.HTTP_204_NO_CONTENT, headers={'Upload-Offset': str(upload.offset)})
+
+
+  def delete(self, request, *args, **kwargs):
+    upload = self.get_object()
+    remove_part(upload)
+    upload.delete()
+    return Response(status=status.HTTP_204_NO_CONTENT)
@@ -1,19 +1,30 @@
-from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
+from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, GenericAPIView
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework import status
+
 from django.http import Http404
 
-from api.serializers import WatchedSerializerV1
-from course.models import Watched
+from api.serializers import (
+  WatchedSerializerV1, WatchedHeartbeatSerializerV1, WatchedBulkSerializerV1, WatchedUpsertSerializerV1,
+  )
+from course.models import Lesson, Watched
 from api.utils.pagination.pagination_classes import StandardPagination
+from api.utils.mixins import BulkCreateMixin, ConditionalGetMixin, DeferredFieldsMixin, NonEmptyListMixin, ValuesListMixin
+from api.utils.heartbeats import get_heartbeat_buffer
 from api.utils.permissions import IsStaffOrOwner
+from api.utils.serializers import column_max_value
 
 
 most_recent_serializer = WatchedSerializerV1
 
 
-class WatchedListCreate(ListCreateAPIView):
+class WatchedListCreate(BulkCreateMixin, ConditionalGetMixin, ValuesListMixin, DeferredFieldsMixin, NonEmptyListMixin, ListCreateAPIView):
   permission_classes = [IsAuthenticated, ]
   pagination_class = StandardPagination
+  bulk_serializer_class = WatchedBulkSerializerV1
+  # read by the merge of unflushed heartbeats
+  required_fields = ('user', 'lesson', 'watched_time', )
 
   def get_serializer_class(self):
     if self.request.version == 'v1':
@@ -33,11 +44,24 @@ class WatchedListCreate(ListCreateAPIView):
     if not self.request.user.is_staff:
       queryset = queryset.filter(user=self.request.user)
     
-    if not queryset: raise Http404
     return queryset.order_by('-updated_at')
+
+
+  def paginate_queryset(self, queryset):
+    page = super().paginate_queryset(queryset)
+    if page is not None:
+      get_heartbeat_buffer().merge_pending(page)
+    return page
+
+
+  def get_collection_fingerprint(self, queryset) -> dict:
+    fingerprint = super().get_collection_fingerprint(queryset)
+    # unflushed heartbeats change the page without touching the table
+    fingerprint['heartbeats'] = get_heartbeat_buffer().version
+    return fingerprint
   
 
-class WatchedRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
+class WatchedRetrieveUpdateDestroy(ConditionalGetMixin, DeferredFieldsMixin, RetrieveUpdateDestroyAPIView):
   permission_classes = [IsAuthenticated, IsStaffOrOwner, ]
 
   def get_serializer_class(self):
@@ -52,4 +76,47 @@ class WatchedRetrieveUpdateDestroy(RetrieveUpdateDestroyAPIView):
       queryset = Watched.objects.all()
     else:
       queryset = Watched.objects.filter(user=self.request.user)
-    return queryset
\ No newline at end of file
+    return queryset
+
+
+class WatchedHeartbeat(GenericAPIView):
+  """
+  Ingests video progress as `(lesson, watched_time)`. Heartbeats are
+  buffered and written in bulk, so the answer is 202 without a body
+  """
+  permission_classes = [IsAuthenticated, ]
+  serializer_class = WatchedHeartbeatSerializerV1
+
+  def post(self, request, *args, **kwargs):
+    serializer = self.get_serializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    get_heartbeat_buffer().add(
+      request.user.pk, serializer.validated_data['lesson'], serializer.validated_data['watched_time'])
+    return Response(status=status.HTTP_202_ACCEPTED)
+
+
+
+class WatchedLessonUpsert(GenericAPIView):
+  """
+  Sets the user's progress on a lesson addressed by the lesson id, in one
+  upsert that keeps the greatest `watched_time`
+  """
+  permission_classes = [IsAuthenticated, ]
+  serializer_class = WatchedUpsertSerializerV1
+
+
+  def put(self, request, *args, **kwargs):
+    serializer = self.get_serializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    lesson_id = self.kwargs.get('lesson_id')
+    # no lesson has an id the column cannot hold
+    if lesson_id > column_max_value(Lesson, 'id'):
+      raise Http404
+
+    watched, created = Watched.objects.upsert_max(
+      request.user.pk, lesson_id, serializer.validated_data['watched_time'])
+    if watched is None:
+      raise Http404
+
+    data = WatchedSerializerV1(watched, context=self.get_serializer_context()).data
+    return Response(data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
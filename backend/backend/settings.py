@@ -38,6 +38,22 @@ REST_FRAMEWORK = {
     ),
     'DEFAULT_VERSION' : os.getenv('API_VERSION', 'v1'),
     'ALLOWED_VERSIONS' : os.getenv('ALLOWED_VERSIONS', ['v1']),
+    'DEFAULT_RENDERER_CLASSES' : (
+      'api.utils.renderers.ORJSONRenderer',
+      'api.utils.renderers.MessagePackRenderer',
+      'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES' : (
+      'api.utils.parsers.ORJSONParser',
+      'api.utils.parsers.MessagePackParser',
+      'rest_framework.parsers.FormParser',
+      'rest_framework.parsers.MultiPartParser',
+    ),
+    'TEST_REQUEST_RENDERER_CLASSES' : (
+      'rest_framework.renderers.MultiPartRenderer',
+      'rest_framework.renderers.JSONRenderer',
+      'api.utils.renderers.MessagePackRenderer',
+    ),
 }
 
 if DEBUG:
@@ -114,6 +130,80 @@ STATIC_URL = '/static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# uploads are stored once per content, named by their sha256, see
+# course/storages; the upload handlers hash them as they stream in. Files
+# are sharded in this many levels of hash prefix directories
+# (classes/ab/cd/<sha256>.jpg); after changing it, run shard_media
+MEDIA_SHARD_DEPTH = env.int('MEDIA_SHARD_DEPTH', default=2)
+STORAGES = {
+    'default': {
+        'BACKEND': 'course.storages.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+FILE_UPLOAD_HANDLERS = [
+    'api.utils.uploads.ContentHashMemoryFileUploadHandler',
+    'api.utils.uploads.ContentHashTemporaryFileUploadHandler',
+]
+
+# anonymous catalog reads are cached here, see api/utils/cache. Writes
+# invalidate them by bumping generation counters kept in this cache, so the
+# invalidation is only exact when every process shares it (redis,
+# memcached). The default local memory cache is per process: with several
+# workers, the others serve stale reads until API_RESPONSE_CACHE_TIMEOUT
+CACHES = {
+    'default': {
+        'BACKEND': env.str('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': env.str('CACHE_LOCATION', default=''),
+    }
+}
+
+API_RESPONSE_CACHE_ALIAS = 'default'
+API_RESPONSE_CACHE_TIMEOUT = env.int('API_RESPONSE_CACHE_TIMEOUT', default=60 * 60)
+
+# Watched progress heartbeats are coalesced in memory and written in bulk
+# every this many seconds, see api/utils/heartbeats. Each process buffers its
+# own heartbeats; 0 writes them as they come
+WATCHED_HEARTBEAT_FLUSH_INTERVAL = env.float('WATCHED_HEARTBEAT_FLUSH_INTERVAL', default=5)
+
+# resumable lesson video uploads are assembled here before being moved into
+# MEDIA_ROOT, see api/utils/uploads. Keep it on the same filesystem as
+# MEDIA_ROOT so finishing an upload is a rename rather than a copy
+VIDEO_UPLOAD_DIR = env.str('VIDEO_UPLOAD_DIR', default=os.path.join(BASE_DIR, 'uploads'))
+VIDEO_UPLOAD_MAX_SIZE = env.int('VIDEO_UPLOAD_MAX_SIZE', default=20 * 1024 ** 3)
+# unfinished uploads no chunk was appended to for this long are removed by
+# collect_orphaned_media
+VIDEO_UPLOAD_EXPIRY_HOURS = env.float('VIDEO_UPLOAD_EXPIRY_HOURS', default=7 * 24)
+
+# course and lesson covers, and the images of lesson texts, are scaled to
+# these widths on first request and kept in a least recently used cache
+# bounded to COVER_CACHE_MAX_SIZE bytes, see api/utils/images. Outside
+# MEDIA_ROOT, derivatives are not uploads
+COVER_WIDTHS = (160, 320, 640, 1280)
+COVER_CACHE_DIR = env.str('COVER_CACHE_DIR', default=os.path.join(BASE_DIR, 'cache', 'covers'))
+COVER_CACHE_MAX_SIZE = env.int('COVER_CACHE_MAX_SIZE', default=512 * 1024 ** 2)
+
+# uploaded covers are verified, recompressed and given a blurhash placeholder
+# by this many worker processes once committed; 0 processes them in the
+# committing thread
+COVER_PROCESSING_WORKERS = env.int('COVER_PROCESSING_WORKERS', default=2)
+
+# media files and cached covers are sent by the front proxy once a view has
+# authorized them: 'x-accel-redirect' (nginx) or 'x-sendfile' (Apache,
+# lighttpd). Empty streams them from Django, for local development. nginx
+# needs an `internal` location aliasing each root below
+MEDIA_SENDFILE_BACKEND = env.str('MEDIA_SENDFILE_BACKEND', default='')
+MEDIA_ACCEL_REDIRECT_LOCATIONS = {
+    MEDIA_ROOT: env.str('MEDIA_ACCEL_REDIRECT_LOCATION', default='/internal/media/'),
+    COVER_CACHE_DIR: env.str('COVER_CACHE_ACCEL_REDIRECT_LOCATION', default='/internal/covers/'),
+}
+
+# full-text search over categories, courses and lessons, see course/search.
+# Unset, the database decides: FTS5 on SQLite, `icontains` lookups elsewhere
+SEARCH_BACKEND = env.str('SEARCH_BACKEND', default=None)
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'Base course site API',
     'DESCRIPTION': 'This project is meant to be an expandable code for course sites',
@@ -148,6 +238,10 @@ customColorPalette = [
     },
 ]
 
+# lesson text editor uploads are recompressed, scaled down to the widest of
+# COVER_WIDTHS and stored once per content, see api/utils/images
+CKEDITOR_5_FILE_STORAGE = 'api.utils.images.InlineImageStorage'
+
 CKEDITOR_5_CONFIGS = {
 'default': {
     'toolbar': ['heading', '|', 'bold', 'italic', 'link',
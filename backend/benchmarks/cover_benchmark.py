@@ -0,0 +1,72 @@
+"""
+Compares serving a 1920x1080 lesson cover as uploaded against its scaled derivatives:
+body size, the first (generating) request and the cached ones.
+
+  cd backend
+  python -m benchmarks.cover_benchmark --repeat 50
+"""
+import argparse
+import io
+import shutil
+import tempfile
+
+from benchmarks.utils import setup_django, benchmark_database, measure, report
+
+
+def cover_file(width, height):
+  from django.core.files.uploadedfile import SimpleUploadedFile
+  from PIL import Image
+
+  # a gradient compresses like a photo rather than a flat color
+  image = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+  output = io.BytesIO()
+  image.save(output, 'JPEG', quality=90)
+  return SimpleUploadedFile('cover.jpg', output.getvalue(), content_type='image/jpeg')
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--repeat', type=int, default=50)
+  args = parser.parse_args()
+
+  setup_django()
+  from django.conf import settings
+  from django.contrib.auth.models import User
+  from django.test import override_settings
+  from django.urls import reverse
+  from rest_framework.test import APIClient
+  from course.models import Category, Course, Lesson
+  from api.utils.images import get_cover_cache
+
+  media_root, cache_dir = tempfile.mkdtemp(), tempfile.mkdtemp()
+  try:
+    with benchmark_database(), override_settings(MEDIA_ROOT=media_root, COVER_CACHE_DIR=cache_dir):
+      user = User.objects.create(username='benchmark')
+      course = Course.objects.create(title='benchmark', category=Category.objects.create(name='benchmark'))
+      lesson = Lesson.objects.create(title='benchmark', course=course, author=user, cover=cover_file(1920, 1080))
+      client = APIClient()
+
+      def get(url, accept):
+        response = client.get(url, HTTP_ACCEPT=accept)
+        return b''.join(response.streaming_content)
+
+      rows, sizes = [], [f'original {len(get(lesson.cover.url, "*/*"))} bytes']
+      rows.append(('original', measure(lambda: get(lesson.cover.url, '*/*'), args.repeat)))
+      for width in settings.COVER_WIDTHS:
+        url = reverse('lesson-cover', kwargs={'pk': lesson.pk, 'width': width})
+        for label, accept in (('webp', 'image/webp,*/*'), ('jpeg', '*/*')):
+          def first_request():
+            shutil.rmtree(get_cover_cache().directory, ignore_errors=True)
+            get(url, accept)
+
+          rows.append((f'{width}w {label} first request', measure(first_request, max(1, args.repeat // 5))))
+          rows.append((f'{width}w {label} cached', measure(lambda: get(url, accept), args.repeat)))
+          sizes.append(f'{width}w {label} {len(get(url, accept))} bytes')
+      report('1920x1080 lesson cover: ' + ', '.join(sizes), rows)
+  finally:
+    shutil.rmtree(media_root)
+    shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,79 @@
+"""
+Compares JSON and MessagePack responses on 100 item pages of watcheds and comments:
+body size (raw and gzipped), server side rendering, client side decoding and the whole GET.
+
+  cd backend
+  python -m benchmarks.format_benchmark --repeat 200
+"""
+import argparse
+import gzip
+import json
+import random
+
+from benchmarks.utils import setup_django, benchmark_database, measure, report
+
+
+PAGE_SIZE = 100
+WORDS = ('great', 'lesson', 'thanks', 'could', 'explain', 'better', 'ótimo', 'aula', 'obrigado', '👍')
+
+
+def populate(rng):
+  from django.contrib.auth.models import User
+  from course.models import Category, Comment, Course, Lesson, Watched
+
+  user = User.objects.create(username='benchmark')
+  category = Category.objects.create(name='benchmark')
+  course = Course.objects.create(title='benchmark', category=category)
+  lessons = Lesson.objects.bulk_create(
+    Lesson(title=f'lesson {i}', course=course, author=user) for i in range(PAGE_SIZE))
+  Watched.objects.bulk_create(
+    Watched(user=user, lesson=lesson, watched_time=rng.randint(0, 3600)) for lesson in lessons)
+  Comment.objects.bulk_create(
+    Comment(user=user, lesson=rng.choice(lessons), text=' '.join(rng.choices(WORDS, k=25)), stars=rng.randint(0, 5))
+    for _ in range(PAGE_SIZE))
+  return user
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--repeat', type=int, default=200)
+  args = parser.parse_args()
+
+  setup_django()
+  import msgpack
+  import orjson
+  from django.urls import reverse
+  from rest_framework.test import APIClient
+
+  formats = (
+    ('json', 'application/json; version=v1', orjson.loads),
+    ('msgpack', 'application/msgpack; version=v1', msgpack.unpackb),
+  )
+
+  with benchmark_database():
+    user = populate(random.Random(0))
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    for name in ('watcheds', 'comments'):
+      url = reverse(name)
+
+      def get(accept):
+        return client.get(url, {'page_size': PAGE_SIZE}, HTTP_ACCEPT=accept)
+
+      rows, sizes = [], []
+      for label, accept, decode in formats:
+        response = get(accept)
+        content, renderer = response.content, response.accepted_renderer
+        data = response.data
+        assert decode(content) == json.loads(get(formats[0][1]).content)
+        sizes.append(f'{label} {len(content)} bytes, {len(gzip.compress(content))} gzipped')
+
+        rows.append((f'render      {label}', measure(lambda: renderer.render(data), args.repeat)))
+        rows.append((f'decode      {label}', measure(lambda: decode(content), args.repeat)))
+        rows.append((f'GET request {label}', measure(lambda: get(accept), args.repeat)))
+      report(f'{PAGE_SIZE} item page of {name}: ' + ', '.join(sizes), rows)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,71 @@
+"""
+Compares rendering the images of a lesson text on each read against serving
+the html rendered when the lesson was saved, for a text with 10 editor images,
+and the bytes of an editor image as uploaded against as stored.
+
+  cd backend
+  python -m benchmarks.lesson_text_benchmark --repeat 50
+"""
+import argparse
+import io
+import shutil
+import tempfile
+
+from benchmarks.utils import setup_django, benchmark_database, measure, report
+
+
+IMAGES = 10
+
+
+def photo(width, height):
+  from django.core.files.uploadedfile import SimpleUploadedFile
+  from PIL import Image
+
+  image = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+  output = io.BytesIO()
+  image.save(output, 'PNG')
+  return SimpleUploadedFile('photo.png', output.getvalue(), content_type='image/png')
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--repeat', type=int, default=50)
+  args = parser.parse_args()
+
+  setup_django()
+  from django.contrib.auth.models import User
+  from django.test import override_settings
+  from course.models import Category, Course, Lesson
+  from api.utils.images import InlineImageStorage, render_lesson_text
+
+  media_root = tempfile.mkdtemp()
+  try:
+    with benchmark_database(), override_settings(MEDIA_ROOT=media_root):
+      storage = InlineImageStorage()
+      uploaded = photo(3000, 2000)
+      sizes = f'editor image {uploaded.size} bytes uploaded'
+      urls = []
+      for index in range(IMAGES):
+        name = storage.save('photo.png', photo(3000 - index, 2000))
+        urls.append(storage.url(name))
+      sizes += f', {storage.size(name)} bytes stored'
+
+      user = User.objects.create(username='benchmark')
+      course = Course.objects.create(title='benchmark', category=Category.objects.create(name='benchmark'))
+      text = ''.join(f'<p>paragraph {index}</p><figure class="image"><img src="{url}"></figure>'
+                     for index, url in enumerate(urls))
+      lesson = Lesson.objects.create(title='benchmark', course=course, author=user, text=text)
+
+      rows = [
+        ('render on read', measure(
+          lambda: render_lesson_text(Lesson.objects.only('text').get(pk=lesson.pk).text), args.repeat)),
+        ('rendered on save', measure(
+          lambda: Lesson.objects.only('text_html').get(pk=lesson.pk).text_html, args.repeat)),
+      ]
+      report(f'lesson text with {IMAGES} images: {sizes}', rows)
+  finally:
+    shutil.rmtree(media_root)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,93 @@
+"""
+Compares DRF's JSONRenderer/JSONParser against the orjson ones on 100 item pages of lessons and comments.
+
+  cd backend
+  python -m benchmarks.renderer_benchmark --repeat 200
+"""
+import argparse
+import random
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from benchmarks.utils import setup_django, benchmark_database, measure, report
+
+
+PAGE_SIZE = 100
+WORDS = ('lição', 'curso', 'video', 'aula', 'python', 'django', 'rest', 'json', 'café', 'ótimo', '😀')
+
+
+def sentence(rng, length):
+  return ' '.join(rng.choices(WORDS, k=length))
+
+
+def populate(rng):
+  from django.contrib.auth.models import User
+  from django.core.management import call_command
+  from course.models import Category, Comment, Course, Lesson
+
+  users = User.objects.bulk_create(User(username=f'benchmark{i}') for i in range(20))
+  category = Category.objects.create(name='benchmark')
+  course = Course.objects.create(title='benchmark', category=category)
+  lessons = Lesson.objects.bulk_create(
+    Lesson(
+      title=f'lesson {i}',
+      description=sentence(rng, 30),
+      text=f'<p>{sentence(rng, 400)}</p>',
+      cover='classes/cover.jpg',
+      video='classes/video.mp4',
+      course=course,
+      author=users[0])
+    for i in range(PAGE_SIZE))
+  Comment.objects.bulk_create(
+    Comment(user=rng.choice(users), lesson=rng.choice(lessons), text=sentence(rng, 40), stars=rng.randint(0, 5))
+    for _ in range(PAGE_SIZE))
+  call_command('rebuild_rating_stats', stdout=StringIO())
+  return users[0]
+
+
+def get_page(client, name):
+  from django.urls import reverse
+  return client.get(reverse(name), {'page_size': PAGE_SIZE})
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--repeat', type=int, default=200)
+  args = parser.parse_args()
+
+  setup_django()
+  from rest_framework.parsers import JSONParser
+  from rest_framework.renderers import JSONRenderer
+  from rest_framework.test import APIClient
+  from rest_framework.views import APIView
+  from api.utils.parsers import ORJSONParser
+  from api.utils.renderers import ORJSONRenderer
+
+  implementations = (('json', JSONRenderer, JSONParser), ('orjson', ORJSONRenderer, ORJSONParser))
+
+  with benchmark_database():
+    user = populate(random.Random(0))
+    # authenticated, so the anonymous response cache does not answer
+    client = APIClient()
+    client.force_authenticate(user=user)
+    client.credentials(HTTP_ACCEPT='application/json; version=v1')
+
+    for name in ('lessons', 'comments'):
+      response = get_page(client, name)
+      data, content = response.data, response.content
+      assert len(data['results']) == PAGE_SIZE
+
+      rows = []
+      for label, renderer_class, parser_class in implementations:
+        renderer, parser = renderer_class(), parser_class()
+        assert renderer.render(data) == content
+        rows.append((f'render      {label}', measure(lambda: renderer.render(data), args.repeat)))
+        rows.append((f'parse       {label}', measure(
+          lambda: parser.parse(BytesIO(content), 'application/json', {}), args.repeat)))
+        with patch.object(APIView, 'renderer_classes', [renderer_class]):
+          rows.append((f'GET request {label}', measure(lambda: get_page(client, name), args.repeat)))
+      report(f'{PAGE_SIZE} item page of {name} ({len(content)} bytes)', rows)
+
+
+if __name__ == '__main__':
+  main()
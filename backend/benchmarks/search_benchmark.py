@@ -0,0 +1,96 @@
+"""
+Compares catalog search through FTS5 against the icontains filters of the list views.
+
+  cd backend
+  python -m benchmarks.search_benchmark --lessons 1000000
+"""
+import argparse
+import random
+import time
+from itertools import accumulate
+
+from benchmarks.utils import setup_django, benchmark_database, measure, report
+
+
+SYLLABLES = ('ka', 'lo', 'mi', 'ne', 'ru', 'ta', 'vo', 'shi', 'pe', 'zu', 'da', 'fi')
+VOCABULARY = [
+  a + b + c + d for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES for d in SYLLABLES][:5000]
+# zipf-like word frequencies, so the benchmark covers common and rare terms
+CUMULATIVE_WEIGHTS = list(accumulate(1 / (rank + 1) for rank in range(len(VOCABULARY))))
+TERMS = {
+  'common': VOCABULARY[2],
+  'medium': VOCABULARY[200],
+  'rare': VOCABULARY[3000],
+}
+
+
+def sentence(rng, length):
+  return ' '.join(rng.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=length))
+
+
+def populate(lessons : int, batch_size : int = 10000):
+  from django.contrib.auth.models import User
+  from course.models import Category, Course, Lesson
+
+  rng = random.Random(0)
+  author = User.objects.create(username='benchmark')
+  category = Category.objects.create(name='benchmark')
+  courses = Course.objects.bulk_create(
+    Course(title=f'course {i} {sentence(rng, 3)}', category=category) for i in range(max(1, lessons // 100)))
+
+  for start in range(0, lessons, batch_size):
+    Lesson.objects.bulk_create(
+      Lesson(
+        title=f'lesson {i} {sentence(rng, 4)}',
+        description=sentence(rng, 12),
+        text=f'<p>{sentence(rng, 60)}</p>',
+        course=courses[i % len(courses)],
+        author=author)
+      for i in range(start, min(start + batch_size, lessons)))
+
+
+def icontains_page(term):
+  from course.models import Lesson
+
+  # the filters LessonListCreate applies for ?title= and ?course=
+  for lookup in ('title__icontains', 'course__title__icontains'):
+    queryset = Lesson.objects.filter(**{lookup: term}).order_by('-updated_at')
+    queryset.count()
+    list(queryset[:20])
+
+
+def fts_page(term):
+  from course.search import get_search_backend
+
+  results = get_search_backend().search(term, ['lesson'])
+  results.count()
+  results[0:20]
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--lessons', type=int, default=1000000)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args()
+
+  setup_django()
+  from django.core.management import call_command
+
+  with benchmark_database():
+    start = time.perf_counter()
+    populate(args.lessons)
+    print(f'inserted {args.lessons} lessons in {time.perf_counter() - start:.1f}s')
+
+    start = time.perf_counter()
+    call_command('rebuild_search_index')
+    print(f'built the search index in {time.perf_counter() - start:.1f}s')
+
+    rows = []
+    for frequency, term in TERMS.items():
+      rows.append((f'icontains  {frequency} ({term})', measure(lambda: icontains_page(term), args.repeat)))
+      rows.append((f'fts5       {frequency} ({term})', measure(lambda: fts_page(term), args.repeat)))
+    report(f'first page of lesson search over {args.lessons} lessons', rows)
+
+
+if __name__ == '__main__':
+  main()
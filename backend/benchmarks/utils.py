@@ -0,0 +1,58 @@
+import os
+import statistics
+import time
+from contextlib import contextmanager
+
+
+def setup_django():
+  os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+  import django
+  django.setup()
+
+
+@contextmanager
+def benchmark_database():
+  """
+  Runs the benchmark against a throwaway, fully migrated test database
+  """
+  from django.db import connection
+  from django.test.utils import setup_test_environment, teardown_test_environment
+
+  setup_test_environment()
+  old_name = connection.settings_dict['NAME']
+  connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+  try:
+    yield
+  finally:
+    connection.creation.destroy_test_db(old_name, verbosity=0)
+    teardown_test_environment()
+
+
+def measure(function, repeat : int = 20) -> dict:
+  """
+  Calls `function` `repeat` times and returns wall clock p50/p99 and mean CPU, in ms
+  """
+  wall, cpu = [], []
+  for _ in range(repeat):
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    function()
+    wall.append((time.perf_counter() - wall_start) * 1000)
+    cpu.append((time.process_time() - cpu_start) * 1000)
+
+  wall.sort()
+  return {
+    'p50': statistics.median(wall),
+    'p99': wall[min(len(wall) - 1, round(0.99 * (len(wall) - 1)))],
+    'cpu': statistics.mean(cpu),
+  }
+
+
+def report(title : str, rows : list[tuple[str, dict]], items : int | None = None):
+  """Prints the measures of each case, and the items/sec at p50 when each call handles `items`"""
+  print(f'\n{title}')
+  print(f'{"case":<48}{"p50 ms":>10}{"p99 ms":>10}{"cpu ms":>10}' + (f'{"rows/s":>12}' if items else ''))
+  for name, stats in rows:
+    line = f'{name:<48}{stats["p50"]:>10.2f}{stats["p99"]:>10.2f}{stats["cpu"]:>10.2f}'
+    if items:
+      line += f'{items / stats["p50"] * 1000:>12.0f}'
+    print(line)
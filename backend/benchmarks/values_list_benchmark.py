@@ -0,0 +1,63 @@
+"""
+Compares rendering comment, save and watched list pages from model instances and from `.values()` rows.
+
+  cd backend
+  python -m benchmarks.values_list_benchmark --repeat 200
+"""
+import argparse
+import random
+
+from benchmarks.utils import setup_django, benchmark_database, measure, report
+
+
+PAGE_SIZES = (20, 100)
+
+
+def populate(rng, rows : int):
+  from django.contrib.auth.models import User
+  from course.models import Category, Comment, Course, Lesson, Save, Watched
+
+  user = User.objects.create(username='benchmark')
+  category = Category.objects.create(name='benchmark')
+  course = Course.objects.create(title='benchmark', category=category)
+  lessons = Lesson.objects.bulk_create(Lesson(title=f'lesson {i}', course=course, author=user) for i in range(rows))
+  Comment.objects.bulk_create(
+    Comment(user=user, lesson=rng.choice(lessons), text='great lesson ' * rng.randint(1, 20), stars=rng.randint(0, 5))
+    for _ in range(rows))
+  Save.objects.bulk_create(Save(user=user, lesson=lesson) for lesson in lessons)
+  Watched.objects.bulk_create(Watched(user=user, lesson=lesson, watched_time=rng.randint(0, 3600)) for lesson in lessons)
+
+
+def main():
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--repeat', type=int, default=200)
+  args = parser.parse_args()
+
+  setup_django()
+  from api.serializers import CommentSerializerV1, SaveSerializerV1, WatchedSerializerV1
+  from api.utils.serializers import row_converters
+  from course.models import Comment, Save, Watched
+
+  with benchmark_database():
+    populate(random.Random(0), max(PAGE_SIZES))
+
+    for model, serializer_class in ((Comment, CommentSerializerV1), (Save, SaveSerializerV1), (Watched, WatchedSerializerV1)):
+      queryset = model.objects.order_by('-updated_at', '-id')
+      columns = ['id', 'updated_at'] + [column for _, column, _ in row_converters(serializer_class())]
+
+      def instances_page(size):
+        return serializer_class(list(queryset[:size]), many=True).data
+
+      def values_page(size):
+        return serializer_class(list(queryset.values(*dict.fromkeys(columns))[:size]), many=True).data
+
+      for size in PAGE_SIZES:
+        assert instances_page(size) == values_page(size)
+        report(f'{size} item page of {model._meta.verbose_name_plural}', [
+          ('model instances', measure(lambda: instances_page(size), args.repeat)),
+          ('values() rows', measure(lambda: values_page(size), args.repeat)),
+        ], items=size)
+
+
+if __name__ == '__main__':
+  main()
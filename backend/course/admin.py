@@ -8,7 +8,7 @@ class CategoryAdmin(admin.ModelAdmin):
 
 @admin.register(Course)
 class CourseAdmin(admin.ModelAdmin):
-  list_display = ('title', 'description', 'category', 'cover')
+  list_display = ('title', 'description', 'category', 'cover', 'lesson_count')
 
   
 @admin.register(Lesson)
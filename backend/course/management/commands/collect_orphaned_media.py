@@ -0,0 +1,147 @@
+import os
+import uuid
+from datetime import timedelta
+from itertools import chain
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from course.models import MediaBlob, VideoUpload
+from course.signals.media_blob_signals import MEDIA_FIELDS
+from course.storages import merged_names, referenced_names, stored_files, unreferenced_files
+
+
+def batched(iterable, size : int):
+  batch = []
+  for item in iterable:
+    batch.append(item)
+    if len(batch) >= size:
+      yield batch
+      batch = []
+  if batch:
+    yield batch
+
+
+class Command(BaseCommand):
+  help = ('Deletes the media files no course or lesson cover/video points to, walking the storage tree and '
+          'the columns side by side in name order; files touched within the grace period are kept. '
+          'Also removes the resumable video uploads left unfinished for longer than their expiry')
+
+  def add_arguments(self, parser):
+    parser.add_argument('--dry-run', action='store_true', help='only report the orphaned files')
+    parser.add_argument('--grace-hours', type=float, default=24,
+                        help='keep files written, reused or released this recently (in-flight uploads)')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--upload-expiry-hours', type=float, default=None,
+                        help='remove unfinished uploads idle this long, VIDEO_UPLOAD_EXPIRY_HOURS by default')
+
+
+  def handle(self, *args, **options):
+    cutoff = timezone.now() - timedelta(hours=options['grace_hours'])
+    batch_size = options['batch_size']
+
+    # lesson text images (lesson_text/, see api/utils/images) are referenced
+    # from the html rather than a column and are never collected
+    roots = sorted({model._meta.get_field(field).upload_to.strip('/') for model, fields in MEDIA_FIELDS.items()
+                    for field in fields})
+    stored = chain.from_iterable(stored_files(default_storage, root) for root in roots)
+    referenced = merged_names(*(
+      referenced_names(model, field, batch_size) for model, fields in MEDIA_FIELDS.items() for field in fields))
+
+    collected, size, kept = 0, 0, 0
+    for batch in batched(unreferenced_files(stored, referenced), batch_size):
+      orphans = self.past_grace(batch, cutoff)
+      kept += len(batch) - len(orphans)
+      for name, stat in orphans:
+        self.stdout.write(f'{name} ({stat.st_size} bytes)')
+        if not options['dry_run']:
+          self.delete(name)
+        collected += 1
+        size += stat.st_size
+
+    action = 'Found' if options['dry_run'] else 'Deleted'
+    self.stdout.write(self.style.SUCCESS(
+      f'{action} {collected} orphaned file(s), {size} bytes; kept {kept} within the grace period'))
+
+    expiry = options['upload_expiry_hours']
+    if expiry is None:
+      expiry = settings.VIDEO_UPLOAD_EXPIRY_HOURS
+    expired, size = self.collect_expired_uploads(timezone.now() - timedelta(hours=expiry), options['dry_run'])
+    self.stdout.write(self.style.SUCCESS(f'{action} {expired} expired partial upload(s), {size} bytes'))
+
+
+  def collect_expired_uploads(self, cutoff, dry_run : bool) -> tuple[int, int]:
+    """
+    The `.part` files of VIDEO_UPLOAD_DIR no chunk was written to since
+    `cutoff`, along with their unfinished VideoUpload rows
+    """
+    try:
+      entries = list(os.scandir(settings.VIDEO_UPLOAD_DIR))
+    except FileNotFoundError:
+      return 0, 0
+
+    timestamp = cutoff.timestamp()
+    stale = {}
+    for entry in entries:
+      if entry.name.endswith('.part') and entry.is_file(follow_symlinks=False):
+        stat = entry.stat(follow_symlinks=False)
+        if stat.st_mtime <= timestamp:
+          stale[entry.name.removesuffix('.part')] = (entry.path, stat)
+
+    ids = []
+    for name in stale:
+      try:
+        ids.append(uuid.UUID(name))
+      except ValueError:
+        pass
+    # resumed since the scan
+    for pk in VideoUpload.objects.filter(pk__in=ids, updated_at__gt=cutoff).values_list('pk', flat=True):
+      stale.pop(str(pk), None)
+
+    size = 0
+    for path, stat in sorted(stale.values()):
+      self.stdout.write(f'{path} ({stat.st_size} bytes)')
+      size += stat.st_size
+      if not dry_run:
+        try:
+          os.remove(path)
+        except FileNotFoundError:
+          pass
+    if not dry_run:
+      VideoUpload.objects.filter(
+        pk__in=[pk for pk in ids if str(pk) in stale], completed_at__isnull=True, updated_at__lte=cutoff).delete()
+    return len(stale), size
+
+
+  def past_grace(self, batch, cutoff) -> list:
+    """The files of `batch` untouched since `cutoff` and still unreferenced"""
+    names = [name for name, _ in batch]
+    recent = set(MediaBlob.objects.filter(name__in=names, updated_at__gt=cutoff).values_list('name', flat=True))
+    # pointed to after the walk went past them
+    for model, fields in MEDIA_FIELDS.items():
+      lookup = Q()
+      for field in fields:
+        lookup |= Q(**{f'{field}__in': names})
+      for row in model.objects.filter(lookup).values_list(*fields):
+        recent.update(row)
+
+    timestamp = cutoff.timestamp()
+    return [(name, stat) for name, stat in batch if stat.st_mtime <= timestamp and name not in recent]
+
+
+  def delete(self, name : str):
+    default_storage.delete(name)
+    MediaBlob.objects.filter(name=name, references=0).delete()
+
+    # drop the shard directories left empty
+    root = os.path.abspath(default_storage.path(name.split('/', 1)[0]))
+    directory = os.path.dirname(default_storage.path(name))
+    while os.path.abspath(directory) != root:
+      try:
+        os.rmdir(directory)
+      except OSError:
+        return
+      directory = os.path.dirname(directory)
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from course.models import Comment, Course, CourseStats, Lesson, LessonStats
+from course.stats import rebuild_rollups
+
+
+class Command(BaseCommand):
+  help = 'Recomputes the lesson and course rating rollups from the comment table'
+
+  def add_arguments(self, parser):
+    parser.add_argument('--batch-size', type=int, default=500)
+
+
+  def handle(self, *args, **options):
+    lessons, courses = rebuild_rollups(
+      Lesson, Course, Comment, LessonStats, CourseStats, batch_size=options['batch_size'])
+    self.stdout.write(self.style.SUCCESS(f'Rebuilt the rollups of {lessons} lesson(s) and {courses} course(s)'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from course.models import Category, Course, Lesson
+from course.search import get_search_backend, iter_documents
+
+
+class Command(BaseCommand):
+  help = 'Rebuilds the catalog full-text search index from the category, course and lesson tables'
+
+  def handle(self, *args, **options):
+    backend = get_search_backend()
+    indexed = backend.rebuild(iter_documents(Category, Course, Lesson))
+    self.stdout.write(self.style.SUCCESS(
+      f'Indexed {indexed} document(s) with {type(backend).__name__}'))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from course.models import Course, Lesson
+
+
+class Command(BaseCommand):
+  help = 'Recomputes Course.lesson_count from the lesson table and repairs any drift'
+
+  def add_arguments(self, parser):
+    parser.add_argument('--dry-run', action='store_true', help='only report the drifted courses')
+    parser.add_argument('--batch-size', type=int, default=500)
+
+
+  def handle(self, *args, **options):
+    counts = Lesson.objects.filter(course=OuterRef('pk')).order_by().values('course').annotate(
+      count=Count('pk')).values('count')
+    drifted = Course.objects.annotate(
+      actual_count=Coalesce(Subquery(counts), 0)).exclude(
+        lesson_count=F('actual_count')).order_by('pk').values_list('pk', 'lesson_count', 'actual_count')
+
+    repaired = 0
+    batch = []
+    for pk, stored, actual in drifted.iterator(chunk_size=options['batch_size']):
+      self.stdout.write(f'course {pk}: stored {stored}, actual {actual}')
+      batch.append(pk)
+      if len(batch) >= options['batch_size']:
+        repaired += self.repair(batch, counts, options['dry_run'])
+        batch = []
+    repaired += self.repair(batch, counts, options['dry_run'])
+
+    action = 'Found' if options['dry_run'] else 'Repaired'
+    self.stdout.write(self.style.SUCCESS(f'{action} {repaired} drifted course(s)'))
+
+
+  def repair(self, pks, counts, dry_run) -> int:
+    if dry_run or not pks:
+      return len(pks)
+    # recomputed inside the update so lessons added meanwhile are not lost
+    with transaction.atomic():
+      Course.objects.filter(pk__in=pks).update(lesson_count=Coalesce(Subquery(counts), 0))
+    return len(pks)
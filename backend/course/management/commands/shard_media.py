@@ -0,0 +1,106 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from course.models import MediaBlob
+from course.signals.media_blob_signals import MEDIA_FIELDS, media_repointed
+from course.storages import ContentAddressedStorage, content_hash_of, hash_file
+
+
+class Command(BaseCommand):
+  help = ('Moves the course and lesson media into the sharded content addressed layout while the site runs: '
+          'files are hard linked under their new name, then the rows are repointed batch by batch')
+
+  def add_arguments(self, parser):
+    parser.add_argument('--dry-run', action='store_true', help='only report the files that would move')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--unlink', action='store_true',
+                        help='remove the old names once no row points to them, instead of leaving them to '
+                             'the orphan collector (pages and caches holding the old URLs then get 404s)')
+
+
+  def handle(self, *args, **options):
+    moved = 0
+    for model, fields in MEDIA_FIELDS.items():
+      for field in fields:
+        storage = model._meta.get_field(field).storage
+        if not isinstance(storage, ContentAddressedStorage):
+          raise CommandError(f'{model._meta.label}.{field} is not stored in a ContentAddressedStorage')
+        moved += self.shard_field(model, field, storage, options)
+
+    action = 'Would move' if options['dry_run'] else 'Moved'
+    self.stdout.write(self.style.SUCCESS(f'{action} {moved} file reference(s)'))
+
+
+  def shard_field(self, model, field : str, storage, options) -> int:
+    upload_to = model._meta.get_field(field).upload_to
+    rows = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True}).order_by('pk')
+    moved, last_pk = 0, 0
+    while True:
+      batch = list(rows.filter(pk__gt=last_pk).values_list('pk', field)[:options['batch_size']])
+      if not batch:
+        return moved
+      last_pk = batch[-1][0]
+
+      renames = {}
+      for _, name in batch:
+        if name not in renames:
+          renames[name] = self.target_name(storage, upload_to, name)
+      renames = {old: new for old, new in renames.items() if new is not None and new != old}
+
+      for old, new in renames.items():
+        self.stdout.write(f'{model._meta.label}.{field}: {old} -> {new}')
+      if not options['dry_run']:
+        self.link(storage, renames)
+        self.repoint(model, field, [(pk, name) for pk, name in batch if name in renames], renames)
+        if options['unlink']:
+          self.unlink(storage, renames)
+      moved += sum(1 for _, name in batch if name in renames)
+
+
+  def target_name(self, storage, upload_to : str, name : str) -> str | None:
+    """The sharded name of `name`, hashing the files stored before content addressing; None when missing"""
+    content_hash = content_hash_of(name)
+    if content_hash is None:
+      if not storage.exists(name):
+        self.stderr.write(f'missing file {name}, left as is')
+        return None
+      content_hash = hash_file(storage.path(name))
+    return storage.blob_name(os.path.join(upload_to, os.path.basename(name)), content_hash)
+
+
+  def link(self, storage, renames : dict[str, str]):
+    """Gives every file its new name as a hard link, so both names work while rows are repointed"""
+    for old, new in renames.items():
+      if storage.exists(new) or not storage.exists(old):
+        continue
+      storage.make_directory(new)
+      try:
+        os.link(storage.path(old), storage.path(new))
+      except FileExistsError:
+        pass
+
+
+  def repoint(self, model, field : str, rows, renames : dict[str, str]):
+    # a row whose file changed meanwhile keeps its new upload; updated_at
+    # moves so conditional GETs see the new URL
+    now, repointed = timezone.now(), False
+    with transaction.atomic():
+      for pk, old in rows:
+        if model.objects.filter(pk=pk, **{field: old}).update(**{field: renames[old], 'updated_at': now}):
+          MediaBlob.objects.acquire([renames[old]])
+          MediaBlob.objects.release([old])
+          repointed = True
+    if repointed:
+      media_repointed.send(sender=model)
+
+
+  def unlink(self, storage, renames : dict[str, str]):
+    still_referenced = set(MediaBlob.objects.filter(name__in=renames, references__gt=0).values_list('name', flat=True))
+    for old in renames:
+      if old in still_referenced or not storage.exists(renames[old]):
+        continue
+      storage.delete(old)
+      MediaBlob.objects.filter(name=old, references=0).delete()
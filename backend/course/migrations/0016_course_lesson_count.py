@@ -0,0 +1,29 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:35
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_lesson_count(apps, schema_editor):
+    Course = apps.get_model('course', 'Course')
+    Lesson = apps.get_model('course', 'Lesson')
+    counts = Lesson.objects.filter(course=OuterRef('pk')).order_by().values('course').annotate(
+        count=Count('pk')).values('count')
+    Course.objects.update(lesson_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0015_alter_category_name_alter_course_title_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='lesson_count',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_lesson_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+from course.search.documents import iter_documents
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    schema_editor.execute(
+        'CREATE VIRTUAL TABLE course_search_index USING fts5('
+        'kind UNINDEXED, object_id UNINDEXED, title, body, '
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+
+    from course.search.backends.sqlite_fts5 import SQLiteFTS5Backend
+    SQLiteFTS5Backend(using=schema_editor.connection.alias).rebuild(iter_documents(
+        apps.get_model('course', 'Category'),
+        apps.get_model('course', 'Course'),
+        apps.get_model('course', 'Lesson'),
+    ))
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute('DROP TABLE IF EXISTS course_search_index')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0016_course_lesson_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
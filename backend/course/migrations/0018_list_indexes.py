@@ -0,0 +1,51 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0017_course_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['updated_at'], name='category_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['updated_at'], name='comment_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['lesson', 'updated_at'], name='comment_lesson_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['updated_at'], name='course_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lesson',
+            index=models.Index(fields=['updated_at'], name='lesson_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='save',
+            index=models.Index(fields=['updated_at'], name='save_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='save',
+            index=models.Index(fields=['user', 'updated_at'], name='save_user_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='watched',
+            index=models.Index(fields=['updated_at'], name='watched_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='watched',
+            index=models.Index(fields=['user', 'updated_at'], name='watched_user_updated_at_idx'),
+        ),
+    ]
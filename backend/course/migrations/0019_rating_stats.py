@@ -0,0 +1,69 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from course.stats import rebuild_rollups
+
+
+def backfill_rating_stats(apps, schema_editor):
+    rebuild_rollups(
+        apps.get_model('course', 'Lesson'),
+        apps.get_model('course', 'Course'),
+        apps.get_model('course', 'Comment'),
+        apps.get_model('course', 'LessonStats'),
+        apps.get_model('course', 'CourseStats'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0018_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseStats',
+            fields=[
+                ('comment_count', models.PositiveIntegerField(default=0)),
+                ('reply_count', models.PositiveIntegerField(default=0)),
+                ('star_count', models.PositiveIntegerField(default=0)),
+                ('star_sum', models.PositiveIntegerField(default=0)),
+                ('stars_0', models.PositiveIntegerField(default=0)),
+                ('stars_1', models.PositiveIntegerField(default=0)),
+                ('stars_2', models.PositiveIntegerField(default=0)),
+                ('stars_3', models.PositiveIntegerField(default=0)),
+                ('stars_4', models.PositiveIntegerField(default=0)),
+                ('stars_5', models.PositiveIntegerField(default=0)),
+                ('rating', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='course.course')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-rating', '-star_count', '-course'], name='course_stats_rating_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='LessonStats',
+            fields=[
+                ('comment_count', models.PositiveIntegerField(default=0)),
+                ('reply_count', models.PositiveIntegerField(default=0)),
+                ('star_count', models.PositiveIntegerField(default=0)),
+                ('star_sum', models.PositiveIntegerField(default=0)),
+                ('stars_0', models.PositiveIntegerField(default=0)),
+                ('stars_1', models.PositiveIntegerField(default=0)),
+                ('stars_2', models.PositiveIntegerField(default=0)),
+                ('stars_3', models.PositiveIntegerField(default=0)),
+                ('stars_4', models.PositiveIntegerField(default=0)),
+                ('stars_5', models.PositiveIntegerField(default=0)),
+                ('rating', models.FloatField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('lesson', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='course.lesson')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-rating', '-star_count', '-lesson'], name='lesson_stats_rating_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
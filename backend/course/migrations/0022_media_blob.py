@@ -0,0 +1,45 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:33
+
+from collections import Counter
+
+from django.db import migrations, models
+
+
+def count_media_references(apps, schema_editor):
+    Course = apps.get_model('course', 'Course')
+    Lesson = apps.get_model('course', 'Lesson')
+    MediaBlob = apps.get_model('course', 'MediaBlob')
+
+    references = Counter()
+    for name in Course.objects.exclude(cover='').exclude(cover=None).values_list('cover', flat=True).iterator():
+        references[name] += 1
+    for field in ('cover', 'video'):
+        names = Lesson.objects.exclude(**{field: ''}).exclude(**{field: None}).values_list(field, flat=True)
+        for name in names.iterator():
+            references[name] += 1
+
+    MediaBlob.objects.bulk_create(
+        (MediaBlob(name=name, references=count) for name, count in references.items()), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0021_cover_metadata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('name', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('references', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['references', 'updated_at'], name='mediablob_references_idx')],
+            },
+        ),
+        migrations.RunPython(count_media_references, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0022_media_blob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='cover',
+            field=models.ImageField(blank=True, db_index=True, null=True, upload_to='courses/'),
+        ),
+        migrations.AlterField(
+            model_name='lesson',
+            name='cover',
+            field=models.ImageField(blank=True, db_index=True, null=True, upload_to='classes/'),
+        ),
+        migrations.AlterField(
+            model_name='lesson',
+            name='video',
+            field=models.FileField(blank=True, db_index=True, null=True, upload_to='classes/'),
+        ),
+    ]
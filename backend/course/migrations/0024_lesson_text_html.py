@@ -0,0 +1,26 @@
+# Generated by Django 5.0.6 on 2026-10-18 16:43
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_text(apps, schema_editor):
+    # copied as written, `manage.py render_lesson_texts` renders them afterwards
+    Lesson = apps.get_model('course', 'Lesson')
+    Lesson.objects.update(text_html=F('text'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0023_media_name_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='text_html',
+            field=models.TextField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(copy_text, migrations.RunPython.noop),
+    ]
@@ -4,3 +4,7 @@ from .lesson_model import Lesson
 from .comment_model import Comment
 from .save_model import Save
 from .watched_model import Watched
+from .lesson_stats_model import LessonStats
+from .course_stats_model import CourseStats
+from .video_upload_model import VideoUpload
+from .media_blob_model import MediaBlob
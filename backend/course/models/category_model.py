@@ -12,6 +12,12 @@ class Category(models.Model):
   updated_at = models.DateTimeField(auto_now=True)
 
 
+  class Meta:
+    indexes = [
+      models.Index(fields=['updated_at'], name='category_updated_at_idx'),
+    ]
+
+
   def __str__(self) -> str:
     return self.name
   
\ No newline at end of file
@@ -1,9 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.core.exceptions import ValidationError
 
 from .lesson_model import Lesson
+from .managers import CommentManager
 
 
 class Comment(models.Model):
@@ -16,11 +17,26 @@ class Comment(models.Model):
   created_at = models.DateTimeField(auto_now_add=True)
   updated_at = models.DateTimeField(auto_now=True)
 
+  objects = CommentManager()
+
+
+  class Meta:
+    indexes = [
+      models.Index(fields=['updated_at'], name='comment_updated_at_idx'),
+      models.Index(fields=['lesson', 'updated_at'], name='comment_lesson_updated_at_idx'),
+    ]
+
 
   def __str__(self) -> str:
     return self.user.username + self.text
   
 
+  def save(self, *args, **kwargs):
+    # the lesson and course rating rollups are updated by signals inside the same transaction
+    with transaction.atomic():
+      super().save(*args, **kwargs)
+
+
   def clean(self):
     if self.comment_fk == self:
         raise ValidationError('Comment cannot be a parent of itself')
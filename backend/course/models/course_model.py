@@ -8,11 +8,32 @@ class Course(models.Model):
   title = models.CharField(max_length=50, unique=True, validators=[validate_not_numeric, ])
   description = models.TextField(blank=True, null=True)
   category = models.ForeignKey(Category, on_delete=models.CASCADE)
-  cover = models.ImageField(upload_to='courses/', blank=True, null=True)
+  cover = models.ImageField(upload_to='courses/', blank=True, null=True, db_index=True)
+  # filled in once the uploaded cover has been processed, see api/utils/images
+  cover_width = models.PositiveIntegerField(blank=True, null=True, editable=False)
+  cover_height = models.PositiveIntegerField(blank=True, null=True, editable=False)
+  cover_placeholder = models.CharField(max_length=100, blank=True, default='', editable=False)
+  lesson_count = models.PositiveIntegerField(default=0, db_index=True, editable=False)
 
   created_at = models.DateTimeField(auto_now_add=True)
   updated_at = models.DateTimeField(auto_now=True)
 
+
+  class Meta:
+    indexes = [
+      models.Index(fields=['updated_at'], name='course_updated_at_idx'),
+    ]
+
   
   def __str__(self) -> str:
-      return self.title
\ No newline at end of file
+      return self.title
+  
+
+  def save(self, *args, **kwargs):
+    # lesson_count is kept up to date by the lesson signals with F() updates,
+    # so the value loaded in memory may be stale and must not be written back
+    if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+      kwargs['update_fields'] = [
+        field.name for field in self._meta.concrete_fields
+        if not field.primary_key and field.name != 'lesson_count']
+    super().save(*args, **kwargs)
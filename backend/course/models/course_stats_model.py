@@ -0,0 +1,18 @@
+from django.db import models
+
+from .course_model import Course
+from .rating_stats_model import RatingStats
+
+
+class CourseStats(RatingStats):
+  course = models.OneToOneField(Course, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+
+
+  class Meta:
+    indexes = [
+      models.Index(fields=['-rating', '-star_count', '-course'], name='course_stats_rating_idx'),
+    ]
+
+
+  def __str__(self) -> str:
+    return f'{self.course_id} - {self.rating:.2f} ({self.star_count})'
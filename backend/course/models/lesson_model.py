@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
 from django_ckeditor_5.fields import CKEditor5Field
@@ -11,19 +11,37 @@ class Lesson(models.Model):
 	title = models.CharField(max_length=50, unique=True, validators=[validate_not_numeric, ])
 	description = models.TextField(blank=True, null=True)
 	course = models.ForeignKey(Course, on_delete=models.CASCADE)
-	cover = models.ImageField(upload_to='classes/', blank=True, null=True)
-	video = models.FileField(upload_to='classes/', blank=True, null=True)
+	cover = models.ImageField(upload_to='classes/', blank=True, null=True, db_index=True)
+	# filled in once the uploaded cover has been processed, see api/utils/images
+	cover_width = models.PositiveIntegerField(blank=True, null=True, editable=False)
+	cover_height = models.PositiveIntegerField(blank=True, null=True, editable=False)
+	cover_placeholder = models.CharField(max_length=100, blank=True, default='', editable=False)
+	video = models.FileField(upload_to='classes/', blank=True, null=True, db_index=True)
 	text = CKEditor5Field(blank=True, null=True)
+	# text with its images rewritten for the page, rendered when it is saved, see api/utils/images
+	text_html = models.TextField(blank=True, null=True, editable=False)
 	author = models.ForeignKey(User, on_delete=models.CASCADE)
 
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
 
 
+	class Meta:
+		indexes = [
+			models.Index(fields=['updated_at'], name='lesson_updated_at_idx'),
+		]
+
+
 	def __str__(self) -> str:
 			return self.title
 	
 
+	def save(self, *args, **kwargs):
+		# the course lesson_count is updated by signals inside the same transaction
+		with transaction.atomic():
+			super().save(*args, **kwargs)
+
+
 	def clean(self):
 		if self.video == None and self.text == None:
 			raise ValidationError('Lesson must have a video or text')
\ No newline at end of file
@@ -0,0 +1,18 @@
+from django.db import models
+
+from .lesson_model import Lesson
+from .rating_stats_model import RatingStats
+
+
+class LessonStats(RatingStats):
+  lesson = models.OneToOneField(Lesson, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+
+
+  class Meta:
+    indexes = [
+      models.Index(fields=['-rating', '-star_count', '-lesson'], name='lesson_stats_rating_idx'),
+    ]
+
+
+  def __str__(self) -> str:
+    return f'{self.lesson_id} - {self.rating:.2f} ({self.star_count})'
@@ -0,0 +1,3 @@
+from .watched_manager import WatchedManager
+from .comment_manager import CommentManager
+from .media_blob_manager import MediaBlobManager
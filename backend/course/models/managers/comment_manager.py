@@ -0,0 +1,44 @@
+from django.db import connection, models
+
+
+class CommentManager(models.Manager):
+  def thread(self, root_id : int, max_depth : int):
+    """
+    The comment `root_id` with its replies down to `max_depth` levels, read
+    in one recursive CTE query walking the `comment_fk` index. Every comment
+    gets `depth`, `replies` (children, oldest first) and `more_replies`,
+    set when it sits at `max_depth` and has replies that were not read.
+    Returns None when the root does not exist.
+    """
+    quote = connection.ops.quote_name
+    opts = self.model._meta
+    table = quote(opts.db_table)
+    pk = quote(opts.pk.column)
+    parent = quote(opts.get_field('comment_fk').column)
+    created_at = quote(opts.get_field('created_at').column)
+
+    # depth bounds the recursion, so a reply cycle cannot loop forever
+    sql = (
+      f'WITH RECURSIVE thread (id, depth) AS ('
+      f'SELECT {pk}, 0 FROM {table} WHERE {pk} = %s '
+      f'UNION ALL '
+      f'SELECT reply.{pk}, thread.depth + 1 FROM {table} reply '
+      f'INNER JOIN thread ON reply.{parent} = thread.id WHERE thread.depth < %s) '
+      f'SELECT comment.*, thread.depth AS depth, '
+      f'CASE WHEN thread.depth = %s THEN EXISTS (SELECT 1 FROM {table} reply WHERE reply.{parent} = comment.{pk}) '
+      f'ELSE FALSE END AS more_replies '
+      f'FROM {table} comment INNER JOIN thread ON comment.{pk} = thread.id '
+      f'ORDER BY thread.depth, comment.{created_at}, comment.{pk}')
+
+    comments = list(self.raw(sql, [root_id, max_depth, max_depth]))
+    if not comments:
+      return None
+
+    by_id = {}
+    for comment in comments:
+      comment.more_replies = bool(comment.more_replies)
+      comment.replies = []
+      by_id[comment.pk] = comment
+      if comment.depth > 0:
+        by_id[comment.comment_fk_id].replies.append(comment)
+    return comments[0]
@@ -0,0 +1,26 @@
+from collections import Counter
+
+from django.db import models
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+
+class MediaBlobManager(models.Manager):
+  def acquire(self, names):
+    """Adds a reference to each of `names`, creating the blobs first seen"""
+    counts = Counter(name for name in names if name)
+    if not counts:
+      return
+    now = timezone.now()
+    self.bulk_create([self.model(name=name) for name in counts], ignore_conflicts=True)
+    for name, count in counts.items():
+      self.filter(name=name).update(references=F('references') + count, updated_at=now)
+
+
+  def release(self, names):
+    """Drops a reference to each of `names`; blobs left at 0 are kept for the collector"""
+    counts = Counter(name for name in names if name)
+    now = timezone.now()
+    for name, count in counts.items():
+      self.filter(name=name).update(references=Greatest(F('references') - count, 0), updated_at=now)
@@ -0,0 +1,119 @@
+from django.contrib.auth.models import User
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from ..lesson_model import Lesson
+
+
+UPSERT_BATCH_SIZE = 500
+
+
+class WatchedManager(models.Manager):
+  def bulk_upsert_max(self, progress : dict[tuple[int, int], int]) -> int:
+    """
+    Writes `{(user_id, lesson_id): watched_time}` in batched upserts that
+    only ever move `watched_time` forward. Rows for users or lessons deleted
+    in the meantime are dropped. Returns the number of rows sent.
+    """
+    user_ids = User.objects.filter(pk__in={user for user, _ in progress}).values_list('pk', flat=True)
+    lesson_ids = Lesson.objects.filter(pk__in={lesson for _, lesson in progress}).values_list('pk', flat=True)
+    user_ids, lesson_ids = set(user_ids), set(lesson_ids)
+    rows = [
+      (user, lesson, watched_time) for (user, lesson), watched_time in progress.items()
+      if user in user_ids and lesson in lesson_ids]
+
+    if connection.vendor not in ('sqlite', 'postgresql'):
+      with transaction.atomic():
+        for user, lesson, watched_time in rows:
+          self._upsert_one(user, lesson, watched_time)
+      return len(rows)
+
+    with transaction.atomic():
+      for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        self._upsert_batch(rows[start:start + UPSERT_BATCH_SIZE])
+    return len(rows)
+
+
+  def upsert_max(self, user_id : int, lesson_id : int, watched_time : int):
+    """
+    Creates or raises the user's progress on a lesson in one statement,
+    `watched_time` is only ever moved forward. Returns `(watched, created)`,
+    or `(None, False)` when the lesson does not exist.
+    """
+    if connection.vendor not in ('sqlite', 'postgresql') or not connection.features.can_return_columns_from_insert:
+      return self._upsert_one(user_id, lesson_id, watched_time)
+
+    opts = self.model._meta
+    quote = connection.ops.quote_name
+    table, columns = self._table_and_columns()
+    now = timezone.now()
+    db_now = connection.ops.adapt_datetimefield_value(now)
+    raised = f'excluded.{columns["watched_time"]} > {table}.{columns["watched_time"]}'
+    fields = [opts.pk] + [opts.get_field(name) for name in columns]
+
+    # the lesson check rides along as INSERT ... SELECT ... WHERE EXISTS, the
+    # CASEs keep the row unchanged but still RETURNed when progress is lower
+    sql = (
+      f'INSERT INTO {table} ({", ".join(columns.values())}) '
+      f'SELECT %s, %s, %s, %s, %s WHERE EXISTS '
+      f'(SELECT 1 FROM {quote(Lesson._meta.db_table)} WHERE {quote(Lesson._meta.pk.column)} = %s) '
+      f'ON CONFLICT ({columns["user"]}, {columns["lesson"]}) DO UPDATE SET '
+      f'{columns["watched_time"]} = CASE WHEN {raised} '
+      f'THEN excluded.{columns["watched_time"]} ELSE {table}.{columns["watched_time"]} END, '
+      f'{columns["updated_at"]} = CASE WHEN {raised} '
+      f'THEN excluded.{columns["updated_at"]} ELSE {table}.{columns["updated_at"]} END '
+      f'RETURNING {", ".join(f"{table}.{quote(field.column)}" for field in fields)}')
+
+    with connection.cursor() as cursor:
+      cursor.execute(sql, [user_id, lesson_id, watched_time, db_now, db_now, lesson_id])
+      row = cursor.fetchone()
+    if row is None:
+      return None, False
+
+    values = []
+    for field, value in zip(fields, row):
+      column = field.get_col(opts.db_table)
+      for converter in connection.ops.get_db_converters(column) + column.get_db_converters(connection):
+        value = converter(value, column, connection)
+      values.append(value)
+    watched = self.model.from_db(self.db, [field.attname for field in fields], values)
+    return watched, watched.created_at == now
+
+
+  def _table_and_columns(self) -> tuple[str, dict[str, str]]:
+    opts = self.model._meta
+    quote = connection.ops.quote_name
+    columns = {name: quote(opts.get_field(name).column)
+               for name in ('user', 'lesson', 'watched_time', 'created_at', 'updated_at')}
+    return quote(opts.db_table), columns
+
+
+  def _upsert_batch(self, rows : list[tuple[int, int, int]]):
+    table, columns = self._table_and_columns()
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+
+    values = ', '.join(['(%s, %s, %s, %s, %s)'] * len(rows))
+    params = [param for user, lesson, watched_time in rows for param in (user, lesson, watched_time, now, now)]
+    # the WHERE keeps the greatest value without MAX()/GREATEST(), whose
+    # spelling differs between SQLite and PostgreSQL
+    sql = (
+      f'INSERT INTO {table} ({", ".join(columns.values())}) VALUES {values} '
+      f'ON CONFLICT ({columns["user"]}, {columns["lesson"]}) DO UPDATE SET '
+      f'{columns["watched_time"]} = excluded.{columns["watched_time"]}, '
+      f'{columns["updated_at"]} = excluded.{columns["updated_at"]} '
+      f'WHERE excluded.{columns["watched_time"]} > {table}.{columns["watched_time"]}')
+
+    with connection.cursor() as cursor:
+      cursor.execute(sql, params)
+
+
+  def _upsert_one(self, user : int, lesson : int, watched_time : int):
+    if not Lesson.objects.filter(pk=lesson).exists():
+      return None, False
+    with transaction.atomic():
+      watched, created = self.select_for_update().get_or_create(
+        user_id=user, lesson_id=lesson, defaults={'watched_time': watched_time})
+      if not created and watched_time > watched.watched_time:
+        watched.watched_time = watched_time
+        watched.save(update_fields=['watched_time', 'updated_at'])
+    return watched, created
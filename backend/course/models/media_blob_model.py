@@ -0,0 +1,27 @@
+from django.db import models
+
+from .managers import MediaBlobManager
+
+
+class MediaBlob(models.Model):
+  """
+  A stored media file and how many course and lesson `cover`/`video`
+  fields point to it. Files are named by their content, see
+  ContentAddressedStorage, so identical uploads share one blob.
+  """
+  name = models.CharField(max_length=255, primary_key=True)
+  references = models.PositiveIntegerField(default=0)
+
+  created_at = models.DateTimeField(auto_now_add=True)
+  updated_at = models.DateTimeField(auto_now=True)
+
+  objects = MediaBlobManager()
+
+  class Meta:
+    indexes = [
+      models.Index(fields=['references', 'updated_at'], name='mediablob_references_idx'),
+    ]
+
+
+  def __str__(self) -> str:
+    return f'{self.name} ({self.references})'
@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class RatingStats(models.Model):
+  """
+  Rating and engagement rollup of the comments under a lesson or a course.
+  Rows are kept up to date with F() deltas by the comment signals, see
+  course/stats; `rating` is the average of the stars, 0 while unrated.
+  """
+  comment_count = models.PositiveIntegerField(default=0)
+  reply_count = models.PositiveIntegerField(default=0)
+  star_count = models.PositiveIntegerField(default=0)
+  star_sum = models.PositiveIntegerField(default=0)
+  stars_0 = models.PositiveIntegerField(default=0)
+  stars_1 = models.PositiveIntegerField(default=0)
+  stars_2 = models.PositiveIntegerField(default=0)
+  stars_3 = models.PositiveIntegerField(default=0)
+  stars_4 = models.PositiveIntegerField(default=0)
+  stars_5 = models.PositiveIntegerField(default=0)
+  rating = models.FloatField(default=0)
+
+  updated_at = models.DateTimeField(auto_now=True)
+
+
+  class Meta:
+    abstract = True
@@ -14,6 +14,10 @@ class Save(models.Model):
   
   class Meta:
     unique_together = ('user', 'lesson')
+    indexes = [
+      models.Index(fields=['updated_at'], name='save_updated_at_idx'),
+      models.Index(fields=['user', 'updated_at'], name='save_user_updated_at_idx'),
+    ]
 
   
   def __str__(self) -> str:
@@ -0,0 +1,36 @@
+import os
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.contrib.auth.models import User
+
+from .lesson_model import Lesson
+
+
+class VideoUpload(models.Model):
+  """
+  A resumable upload of a lesson video. Chunks are appended to a partial
+  file in VIDEO_UPLOAD_DIR until `offset` reaches `length`; the finished
+  file is then moved into the lesson's `video`.
+  """
+  id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+  lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='video_uploads')
+  user = models.ForeignKey(User, on_delete=models.CASCADE)
+  filename = models.CharField(max_length=255)
+  length = models.BigIntegerField()
+  offset = models.BigIntegerField(default=0)
+  sha256 = models.CharField(max_length=64, blank=True)
+  completed_at = models.DateTimeField(blank=True, null=True)
+
+  created_at = models.DateTimeField(auto_now_add=True)
+  updated_at = models.DateTimeField(auto_now=True)
+
+
+  def __str__(self) -> str:
+    return f'{self.filename} ({self.offset}/{self.length})'
+
+
+  @property
+  def part_path(self) -> str:
+    return os.path.join(settings.VIDEO_UPLOAD_DIR, f'{self.pk}.part')
@@ -3,6 +3,7 @@ from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator
 
 from .lesson_model import Lesson
+from .managers import WatchedManager
 
 
 class Watched(models.Model):
@@ -13,8 +14,14 @@ class Watched(models.Model):
   created_at = models.DateTimeField(auto_now_add=True)
   updated_at = models.DateTimeField(auto_now=True)
 
+  objects = WatchedManager()
+
   class Meta:
     unique_together = ('user', 'lesson')
+    indexes = [
+      models.Index(fields=['updated_at'], name='watched_updated_at_idx'),
+      models.Index(fields=['user', 'updated_at'], name='watched_user_updated_at_idx'),
+    ]
 
 
   def __str__(self) -> str:
@@ -0,0 +1,2 @@
+from .documents import SearchDocument, document_for, iter_documents
+from .backends import get_search_backend
@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+
+from .base import BaseSearchBackend, SearchHit, SearchResults
+
+
+SQLITE_BACKEND = 'course.search.backends.sqlite_fts5.SQLiteFTS5Backend'
+DATABASE_BACKEND = 'course.search.backends.database.DatabaseSearchBackend'
+
+
+@lru_cache
+def load_search_backend(path : str) -> BaseSearchBackend:
+  return import_string(path)()
+
+
+def get_search_backend() -> BaseSearchBackend:
+  """
+  Returns the backend configured in `settings.SEARCH_BACKEND`, defaulting to
+  FTS5 on SQLite and to plain `icontains` lookups on other databases
+  """
+  path = getattr(settings, 'SEARCH_BACKEND', None)
+  if not path:
+    path = SQLITE_BACKEND if connection.vendor == 'sqlite' else DATABASE_BACKEND
+  return load_search_backend(path)
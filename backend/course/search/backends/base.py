@@ -0,0 +1,93 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from course.search.documents import SearchDocument, document_for
+
+
+MAX_TERMS = 8
+
+
+@dataclass(frozen=True)
+class SearchHit:
+  kind : str
+  object_id : int
+  title : str
+  snippet : str
+  rank : float
+
+
+class SearchResults:
+  """
+  Lazy, sliceable search results.
+  `count()` and slices each run one bounded query, so the results can be
+  handed straight to a paginator.
+  """
+
+  def __init__(self, count : Callable[[], int], fetch : Callable[[int, int], list[SearchHit]]):
+    self._count = count
+    self._fetch = fetch
+    self._total = None
+
+
+  def count(self) -> int:
+    if self._total is None:
+      self._total = self._count()
+    return self._total
+
+
+  def __len__(self) -> int:
+    return self.count()
+
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      start = index.start or 0
+      stop = self.count() if index.stop is None else index.stop
+      if stop <= start:
+        return []
+      return self._fetch(start, stop - start)
+    hits = self._fetch(index, 1)
+    if not hits:
+      raise IndexError(index)
+    return hits[0]
+
+
+  @classmethod
+  def empty(cls):
+    return cls(lambda: 0, lambda offset, limit: [])
+
+
+def parse_terms(query : str) -> list[str]:
+  return re.findall(r'\w+', query.lower())[:MAX_TERMS]
+
+
+class BaseSearchBackend:
+  """
+  Interface of the catalog search backends.
+  Backends keep an index of Category, Course and Lesson documents and answer
+  ranked queries over it.
+  """
+
+  def index(self, instance):
+    self.index_documents([document_for(instance)])
+
+
+  def remove(self, instance):
+    self.remove_document(instance._meta.model_name, instance.pk)
+
+
+  def index_documents(self, documents : Iterable[SearchDocument]):
+    raise NotImplementedError
+
+
+  def remove_document(self, kind : str, object_id : int):
+    raise NotImplementedError
+
+
+  def rebuild(self, documents : Iterable[SearchDocument]) -> int:
+    raise NotImplementedError
+
+
+  def search(self, query : str, kinds : Iterable[str] | None = None) -> SearchResults:
+    raise NotImplementedError
@@ -0,0 +1,61 @@
+from typing import Iterable
+
+from django.db.models import CharField, F, FloatField, Q, Value
+
+from course.search.documents import KINDS, SearchDocument
+from .base import BaseSearchBackend, SearchHit, SearchResults, parse_terms
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+  """
+  Unindexed fallback for databases without FTS5: `icontains` lookups over the
+  model tables themselves, so there is nothing to keep in sync
+  """
+  searched_fields = {
+    'category': ('name', ('name', 'description')),
+    'course': ('title', ('title', 'description')),
+    'lesson': ('title', ('title', 'description', 'text')),
+  }
+
+  def index_documents(self, documents : Iterable[SearchDocument]):
+    pass
+
+
+  def remove_document(self, kind : str, object_id : int):
+    pass
+
+
+  def rebuild(self, documents : Iterable[SearchDocument]) -> int:
+    return 0
+
+
+  def get_queryset(self, kind, terms):
+    from course.models import Category, Course, Lesson
+
+    model = {'category': Category, 'course': Course, 'lesson': Lesson}[kind]
+    title_field, fields = self.searched_fields[kind]
+    queryset = model.objects.all()
+    for term in terms:
+      term_filter = Q()
+      for field in fields:
+        term_filter |= Q(**{f'{field}__icontains': term})
+      queryset = queryset.filter(term_filter)
+
+    return queryset.order_by().values_list(
+      Value(kind, output_field=CharField()), 'pk', F(title_field),
+      Value('', output_field=CharField()), Value(0.0, output_field=FloatField()))
+
+
+  def search(self, query : str, kinds : Iterable[str] | None = None) -> SearchResults:
+    terms = parse_terms(query)
+    kinds = [kind for kind in KINDS if kinds is None or kind in kinds]
+    if not terms or not kinds:
+      return SearchResults.empty()
+
+    querysets = [self.get_queryset(kind, terms) for kind in kinds]
+    results = querysets[0].union(*querysets[1:], all=True)
+
+    def fetch(offset, limit):
+      return [SearchHit(*row) for row in results[offset:offset + limit]]
+
+    return SearchResults(results.count, fetch)
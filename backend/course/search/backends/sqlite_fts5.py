@@ -0,0 +1,98 @@
+from itertools import islice
+from typing import Iterable
+
+from django.db import connections, transaction
+
+from course.search.documents import KINDS, SearchDocument
+from .base import BaseSearchBackend, SearchHit, SearchResults, parse_terms
+
+
+TABLE = 'course_search_index'
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+BATCH_SIZE = 1000
+
+# kind, object_id, title, body: titles weigh ten times the body
+RANK = f'bm25({TABLE}, 0.0, 0.0, 10.0, 1.0)'
+SNIPPET = f"snippet({TABLE}, 3, '', '', '…', 16)"
+
+
+def document_rowid(kind : str, object_id : int) -> int:
+  # the rowid encodes the document key, so updates and deletes are rowid lookups
+  return object_id * len(KINDS) + KIND_CODES[kind]
+
+
+def document_row(document : SearchDocument) -> tuple:
+  return (
+    document_rowid(document.kind, document.object_id),
+    document.kind, document.object_id, document.title, document.body)
+
+
+class SQLiteFTS5Backend(BaseSearchBackend):
+  """
+  Search backend over an SQLite FTS5 table, created by the course migrations
+  """
+
+  def __init__(self, using : str = 'default'):
+    self.using = using
+
+
+  @property
+  def connection(self):
+    return connections[self.using]
+
+
+  def index_documents(self, documents : Iterable[SearchDocument]):
+    rows = [document_row(document) for document in documents]
+    with self.connection.cursor() as cursor:
+      cursor.executemany(
+        f'INSERT OR REPLACE INTO {TABLE} (rowid, kind, object_id, title, body) '
+        'VALUES (%s, %s, %s, %s, %s)', rows)
+
+
+  def remove_document(self, kind : str, object_id : int):
+    with self.connection.cursor() as cursor:
+      cursor.execute(f'DELETE FROM {TABLE} WHERE rowid = %s', [document_rowid(kind, object_id)])
+
+
+  def rebuild(self, documents : Iterable[SearchDocument]) -> int:
+    indexed = 0
+    documents = iter(documents)
+    with transaction.atomic(using=self.using):
+      with self.connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE}')
+      while batch := list(islice(documents, BATCH_SIZE)):
+        self.index_documents(batch)
+        indexed += len(batch)
+      with self.connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {TABLE} ({TABLE}) VALUES ('optimize')")
+    return indexed
+
+
+  def search(self, query : str, kinds : Iterable[str] | None = None) -> SearchResults:
+    terms = parse_terms(query)
+    if not terms:
+      return SearchResults.empty()
+
+    where = f'{TABLE} MATCH %s'
+    params = [' '.join(f'"{term}"*' for term in terms)]
+    if kinds is not None:
+      kinds = list(kinds)
+      where += f" AND kind IN ({', '.join(['%s'] * len(kinds))})"
+      params += kinds
+
+    def count():
+      with self.connection.cursor() as cursor:
+        cursor.execute(f'SELECT count(*) FROM {TABLE} WHERE {where}', params)
+        return cursor.fetchone()[0]
+
+    def fetch(offset, limit):
+      with self.connection.cursor() as cursor:
+        cursor.execute(
+          f'SELECT kind, object_id, title, {SNIPPET}, {RANK} FROM {TABLE} '
+          f'WHERE {where} ORDER BY {RANK} LIMIT %s OFFSET %s', params + [limit, offset])
+        # bm25 is lower for better matches, the API exposes higher-is-better
+        return [
+          SearchHit(kind, object_id, title, snippet, -rank)
+          for kind, object_id, title, snippet, rank in cursor.fetchall()]
+
+    return SearchResults(count, fetch)
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from html import unescape
+
+from django.utils.html import strip_tags
+
+
+KINDS = ('category', 'course', 'lesson')
+
+
+@dataclass(frozen=True)
+class SearchDocument:
+  kind : str
+  object_id : int
+  title : str
+  body : str
+
+
+def html_to_text(html : str | None) -> str:
+  if not html:
+    return ''
+  return unescape(strip_tags(html))
+
+
+def join_text(*parts : str | None) -> str:
+  return '\n'.join(part for part in parts if part)
+
+
+def category_document(pk, name, description) -> SearchDocument:
+  return SearchDocument('category', pk, name, description or '')
+
+
+def course_document(pk, title, description) -> SearchDocument:
+  return SearchDocument('course', pk, title, description or '')
+
+
+def lesson_document(pk, title, description, text) -> SearchDocument:
+  return SearchDocument('lesson', pk, title, join_text(description, html_to_text(text)))
+
+
+def document_for(instance) -> SearchDocument:
+  """
+  Builds the search document of a Category, Course or Lesson instance
+  """
+  kind = instance._meta.model_name
+  if kind == 'category':
+    return category_document(instance.pk, instance.name, instance.description)
+  if kind == 'course':
+    return course_document(instance.pk, instance.title, instance.description)
+  if kind == 'lesson':
+    return lesson_document(instance.pk, instance.title, instance.description, instance.text)
+  raise ValueError(f'{kind} is not searchable')
+
+
+def iter_documents(category_model, course_model, lesson_model, chunk_size : int = 2000):
+  """
+  Streams the documents of every searchable row straight from `values_list`,
+  so a rebuild never holds a whole table in memory.
+  Model classes are parameters so migrations can pass their historical models.
+  """
+  for row in category_model.objects.values_list(
+      'pk', 'name', 'description').iterator(chunk_size=chunk_size):
+    yield category_document(*row)
+  for row in course_model.objects.values_list(
+      'pk', 'title', 'description').iterator(chunk_size=chunk_size):
+    yield course_document(*row)
+  for row in lesson_model.objects.values_list(
+      'pk', 'title', 'description', 'text').iterator(chunk_size=chunk_size):
+    yield lesson_document(*row)
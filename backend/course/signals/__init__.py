@@ -0,0 +1,5 @@
+from . import lesson_count_signals
+from . import search_signals
+from . import rating_stats_signals
+from . import media_blob_signals
+from . import video_upload_signals
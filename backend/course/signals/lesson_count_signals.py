@@ -0,0 +1,35 @@
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from course.models import Course, Lesson
+
+
+def update_lesson_count(course_id, delta : int):
+  Course.objects.filter(pk=course_id).update(lesson_count=F('lesson_count') + delta)
+
+
+@receiver(pre_save, sender=Lesson)
+def remember_previous_course(sender, instance, raw=False, **kwargs):
+  instance._previous_course_id = None
+  if raw or instance._state.adding:
+    return
+  instance._previous_course_id = Lesson.objects.filter(
+    pk=instance.pk).values_list('course_id', flat=True).first()
+
+
+@receiver(post_save, sender=Lesson)
+def count_saved_lesson(sender, instance, created, raw=False, **kwargs):
+  if raw:
+    return
+  previous_course_id = getattr(instance, '_previous_course_id', None)
+  if created:
+    update_lesson_count(instance.course_id, 1)
+  elif previous_course_id is not None and previous_course_id != instance.course_id:
+    update_lesson_count(previous_course_id, -1)
+    update_lesson_count(instance.course_id, 1)
+
+
+@receiver(post_delete, sender=Lesson)
+def count_deleted_lesson(sender, instance, **kwargs):
+  update_lesson_count(instance.course_id, -1)
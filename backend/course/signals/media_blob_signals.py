@@ -0,0 +1,57 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import Signal, receiver
+
+from course.models import Course, Lesson, MediaBlob
+
+
+# the file fields whose blobs are reference counted
+MEDIA_FIELDS = {
+  Course: ('cover', ),
+  Lesson: ('cover', 'video', ),
+}
+
+# sent with the model as sender once rows of it were pointed to other files
+# in bulk, without save signals (see shard_media)
+media_repointed = Signal()
+
+
+def saved_fields(sender, update_fields) -> tuple[str, ...]:
+  fields = MEDIA_FIELDS.get(sender, ())
+  if update_fields is not None:
+    fields = tuple(field for field in fields if field in update_fields)
+  return fields
+
+
+@receiver(pre_save, sender=Course)
+@receiver(pre_save, sender=Lesson)
+def remember_previous_files(sender, instance, raw=False, update_fields=None, **kwargs):
+  fields = saved_fields(sender, update_fields)
+  instance._previous_files = {}
+  if raw or not fields or instance._state.adding:
+    return
+  instance._previous_files = sender.objects.filter(pk=instance.pk).values(*fields).first() or {}
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Lesson)
+def count_file_references(sender, instance, raw=False, update_fields=None, **kwargs):
+  fields = saved_fields(sender, update_fields)
+  if raw or not fields:
+    return
+
+  previous = getattr(instance, '_previous_files', {})
+  acquired, released = [], []
+  for field in fields:
+    old, new = previous.get(field) or '', getattr(instance, field).name or ''
+    if old != new:
+      acquired.append(new)
+      released.append(old)
+  MediaBlob.objects.acquire(acquired)
+  MediaBlob.objects.release(released)
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Lesson)
+def release_file_references(sender, instance, **kwargs):
+  fields = MEDIA_FIELDS.get(sender, ())
+  MediaBlob.objects.release(getattr(instance, field).name for field in fields)
@@ -0,0 +1,73 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from course.models import Comment, Course, CourseStats, Lesson, LessonStats
+from course.stats import COUNTER_FIELDS, apply_delta, combine, comment_delta
+
+
+def course_of(lesson_id):
+  return Lesson.objects.filter(pk=lesson_id).values_list('course_id', flat=True).first()
+
+
+def apply_comment_delta(lesson_id, delta):
+  apply_delta(LessonStats, {'lesson_id': lesson_id}, delta)
+  course_id = course_of(lesson_id)
+  if course_id is not None:
+    apply_delta(CourseStats, {'course_id': course_id}, delta)
+
+
+@receiver(pre_save, sender=Comment)
+def remember_previous_rating(sender, instance, raw=False, **kwargs):
+  instance._previous_rating = None
+  if raw or instance._state.adding:
+    return
+  instance._previous_rating = Comment.objects.filter(pk=instance.pk).values_list(
+    'lesson_id', 'stars', 'comment_fk_id').first()
+
+
+@receiver(post_save, sender=Comment)
+def rollup_saved_comment(sender, instance, created, raw=False, **kwargs):
+  if raw:
+    return
+  added = comment_delta(instance.stars, instance.comment_fk_id is not None)
+  previous = getattr(instance, '_previous_rating', None)
+  if created or previous is None:
+    apply_comment_delta(instance.lesson_id, added)
+    return
+
+  lesson_id, stars, comment_fk_id = previous
+  removed = comment_delta(stars, comment_fk_id is not None, sign=-1)
+  if lesson_id == instance.lesson_id:
+    apply_comment_delta(lesson_id, combine(removed, added))
+  else:
+    apply_comment_delta(lesson_id, removed)
+    apply_comment_delta(instance.lesson_id, added)
+
+
+@receiver(post_delete, sender=Comment)
+def rollup_deleted_comment(sender, instance, **kwargs):
+  apply_comment_delta(instance.lesson_id, comment_delta(instance.stars, instance.comment_fk_id is not None, sign=-1))
+
+
+@receiver(post_save, sender=Lesson)
+def rollup_saved_lesson(sender, instance, created, raw=False, **kwargs):
+  if raw:
+    return
+  if created:
+    LessonStats.objects.get_or_create(lesson=instance)
+    return
+
+  # set by the lesson count pre_save receiver, see lesson_count_signals
+  previous_course_id = getattr(instance, '_previous_course_id', None)
+  if previous_course_id is None or previous_course_id == instance.course_id:
+    return
+  moved = LessonStats.objects.filter(lesson=instance).values(*COUNTER_FIELDS).first()
+  if moved is not None:
+    apply_delta(CourseStats, {'course_id': previous_course_id}, {field: -value for field, value in moved.items()})
+    apply_delta(CourseStats, {'course_id': instance.course_id}, moved)
+
+
+@receiver(post_save, sender=Course)
+def rollup_saved_course(sender, instance, created, raw=False, **kwargs):
+  if created and not raw:
+    CourseStats.objects.get_or_create(course=instance)
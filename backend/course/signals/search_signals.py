@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from course.models import Category, Course, Lesson
+from course.search import get_search_backend
+
+
+SEARCHABLE_MODELS = (Category, Course, Lesson)
+
+
+@receiver(post_save)
+def index_searchable_instance(sender, instance, raw=False, **kwargs):
+  if raw or sender not in SEARCHABLE_MODELS:
+    return
+  get_search_backend().index(instance)
+
+
+@receiver(post_delete)
+def remove_searchable_instance(sender, instance, **kwargs):
+  if sender not in SEARCHABLE_MODELS:
+    return
+  get_search_backend().remove(instance)
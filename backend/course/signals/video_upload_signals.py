@@ -0,0 +1,22 @@
+import os
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from course.models import VideoUpload
+
+
+def remove_file(path : str):
+  try:
+    os.remove(path)
+  except FileNotFoundError:
+    pass
+
+
+@receiver(post_delete, sender=VideoUpload)
+def remove_partial_file(sender, instance, **kwargs):
+  # uploads go with their lesson or user too; once committed, so a rolled
+  # back delete keeps the upload resumable
+  path = instance.part_path
+  transaction.on_commit(lambda: remove_file(path))
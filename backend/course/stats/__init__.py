@@ -0,0 +1,4 @@
+from .rollups import (
+  COUNTER_FIELDS, HISTOGRAM_FIELDS, STAR_VALUES,
+  apply_delta, combine, comment_delta, rebuild_rollups,
+  )
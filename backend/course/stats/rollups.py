@@ -0,0 +1,107 @@
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.lookups import GreaterThan
+from django.utils import timezone
+
+
+STAR_VALUES = range(0, 6)
+HISTOGRAM_FIELDS = tuple(f'stars_{stars}' for stars in STAR_VALUES)
+COUNTER_FIELDS = ('comment_count', 'reply_count', 'star_count', 'star_sum') + HISTOGRAM_FIELDS
+
+
+def comment_delta(stars : int | None, is_reply : bool, sign : int = 1) -> dict[str, int]:
+  """What one comment adds to (or with `sign=-1` removes from) a rollup"""
+  delta = dict.fromkeys(COUNTER_FIELDS, 0)
+  delta['reply_count' if is_reply else 'comment_count'] = sign
+  if stars is not None:
+    delta['star_count'] = sign
+    delta['star_sum'] = sign * stars
+    delta[f'stars_{stars}'] = sign
+  return delta
+
+
+def combine(*deltas : dict[str, int]) -> dict[str, int]:
+  return {field: sum(delta[field] for delta in deltas) for field in COUNTER_FIELDS}
+
+
+def rating_expression(star_sum, star_count):
+  return Case(
+    When(GreaterThan(star_count, 0), then=Cast(star_sum, FloatField()) / star_count),
+    default=Value(0.0), output_field=FloatField())
+
+
+def apply_delta(stats_model, key : dict, delta : dict[str, int]):
+  """
+  Adds `delta` to the rollup row matching `key` in a single UPDATE.
+  A missing row is only created for additions: subtracting from a row that
+  is gone means its lesson or course is being deleted.
+  """
+  if not any(delta.values()):
+    return
+
+  updates = {field: F(field) + value for field, value in delta.items() if value}
+  updates['rating'] = rating_expression(
+    F('star_sum') + delta['star_sum'], F('star_count') + delta['star_count'])
+  updates['updated_at'] = timezone.now()
+
+  if stats_model.objects.filter(**key).update(**updates):
+    return
+  if all(value >= 0 for value in delta.values()):
+    stats_model.objects.get_or_create(**key)
+    stats_model.objects.filter(**key).update(**updates)
+
+
+def lesson_aggregates(comment_model, lesson_ids) -> dict[int, dict[str, int]]:
+  """Rollup values of `lesson_ids` computed from the comment table"""
+  counters = {
+    'comment_count': Count('pk', filter=Q(comment_fk__isnull=True)),
+    'reply_count': Count('pk', filter=Q(comment_fk__isnull=False)),
+    'star_count': Count('stars'),
+    'star_sum': Coalesce(Sum('stars'), 0),
+  }
+  counters.update({f'stars_{stars}': Count('pk', filter=Q(stars=stars)) for stars in STAR_VALUES})
+  rows = comment_model.objects.filter(lesson_id__in=lesson_ids).order_by().values('lesson_id').annotate(**counters)
+  return {row.pop('lesson_id'): row for row in rows}
+
+
+def course_aggregates(lesson_stats_model, course_ids) -> dict[int, dict[str, int]]:
+  """Rollup values of `course_ids` summed up from their lessons' rollups"""
+  counters = {field: Sum(field) for field in COUNTER_FIELDS}
+  rows = lesson_stats_model.objects.filter(lesson__course_id__in=course_ids).order_by().values(
+    'lesson__course_id').annotate(**counters)
+  return {row.pop('lesson__course_id'): row for row in rows}
+
+
+def write_rollups(stats_model, key_field : str, ids, values : dict[int, dict[str, int]]):
+  now = timezone.now()
+  rows = []
+  for pk in ids:
+    counters = values.get(pk) or dict.fromkeys(COUNTER_FIELDS, 0)
+    rating = counters['star_sum'] / counters['star_count'] if counters['star_count'] else 0.0
+    rows.append(stats_model(**{f'{key_field}_id': pk}, **counters, rating=rating, updated_at=now))
+  stats_model.objects.bulk_create(
+    rows, update_conflicts=True, unique_fields=[key_field],
+    update_fields=list(COUNTER_FIELDS) + ['rating', 'updated_at'])
+
+
+def rebuild_rollups(lesson_model, course_model, comment_model, lesson_stats_model, course_stats_model,
+                    batch_size : int = 500) -> tuple[int, int]:
+  """
+  Recomputes every lesson and course rollup from the comments, a batch of
+  lessons or courses per transaction. Takes the models so migrations can
+  pass their historical versions. Returns how many rows were written.
+  """
+  lesson_ids = list(lesson_model.objects.order_by('pk').values_list('pk', flat=True))
+  for start in range(0, len(lesson_ids), batch_size):
+    batch = lesson_ids[start:start + batch_size]
+    with transaction.atomic():
+      write_rollups(lesson_stats_model, 'lesson', batch, lesson_aggregates(comment_model, batch))
+
+  course_ids = list(course_model.objects.order_by('pk').values_list('pk', flat=True))
+  for start in range(0, len(course_ids), batch_size):
+    batch = course_ids[start:start + batch_size]
+    with transaction.atomic():
+      write_rollups(course_stats_model, 'course', batch, course_aggregates(lesson_stats_model, batch))
+
+  return len(lesson_ids), len(course_ids)
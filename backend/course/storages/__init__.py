@@ -0,0 +1,2 @@
+from .content_addressed_storage import ContentAddressedStorage, content_hash_of, hash_file, is_content_addressed
+from .orphaned_media import merged_names, referenced_names, stored_files, unreferenced_files
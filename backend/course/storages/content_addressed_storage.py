@@ -0,0 +1,125 @@
+import hashlib
+import os
+import re
+import uuid
+
+from django.conf import settings
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+
+HASH_BLOCK_SIZE = 1024 * 1024
+CONTENT_ADDRESSED_NAME = re.compile(r'^[0-9a-f]{64}(\.[0-9A-Za-z]+)?$')
+
+
+def is_content_addressed(name : str) -> bool:
+  """Whether `name` is a blob named by its content, which never changes"""
+  return CONTENT_ADDRESSED_NAME.match(os.path.basename(name)) is not None
+
+
+def content_hash_of(name : str) -> str | None:
+  """The sha256 a content addressed `name` was named after"""
+  if not is_content_addressed(name):
+    return None
+  return os.path.splitext(os.path.basename(name))[0]
+
+
+def hash_file(path : str) -> str:
+  digest = hashlib.sha256()
+  with open(path, 'rb') as file:
+    while block := file.read(HASH_BLOCK_SIZE):
+      digest.update(block)
+  return digest.hexdigest()
+
+
+@deconstructible(path='course.storages.ContentAddressedStorage')
+class ContentAddressedStorage(FileSystemStorage):
+  """
+  FileSystemStorage naming every file `<upload_to>/<sha256><extension>`,
+  sharded in MEDIA_SHARD_DEPTH levels of directories by hash prefix so no
+  directory grows too large.
+  A file whose content is already stored is not written again and gets
+  the name of the existing blob, see MediaBlob for who references it.
+  The sha256 is taken from the `content_hash` of uploads hashed as they
+  streamed in (see api/utils/uploads), else computed while writing.
+  """
+
+  def get_available_name(self, name, max_length=None):
+    # the name is only final once the content is hashed, and the same
+    # content under the same name is the same blob
+    return name
+
+
+  @property
+  def shard_depth(self) -> int:
+    return settings.MEDIA_SHARD_DEPTH
+
+
+  def blob_name(self, name : str, content_hash : str) -> str:
+    """`<directory of name>/ab/cd/<content_hash><extension>`, with `shard_depth` levels"""
+    directory, filename = os.path.split(name)
+    extension = os.path.splitext(filename)[1].lower()
+    shards = [content_hash[2 * level:2 * level + 2] for level in range(self.shard_depth)]
+    return os.path.join(directory, *shards, content_hash + extension)
+
+
+  def make_directory(self, name : str) -> str:
+    directory = os.path.dirname(self.path(name))
+    os.makedirs(directory, mode=self.directory_permissions_mode or 0o777, exist_ok=True)
+    return directory
+
+
+  def _save(self, name, content):
+    directory = self.make_directory(name)
+
+    content_hash = getattr(content, 'content_hash', None)
+    if hasattr(content, 'temporary_file_path'):
+      name = self.blob_name(name, content_hash or hash_file(content.temporary_file_path()))
+      if not self.reuse(name):
+        self.make_directory(name)
+        file_move_safe(content.temporary_file_path(), self.path(name), allow_overwrite=True)
+        self.set_permissions(name)
+      return name
+
+    if content_hash is not None and self.reuse(self.blob_name(name, content_hash)):
+      return self.blob_name(name, content_hash)
+
+    digest = hashlib.sha256()
+    temporary = os.path.join(directory, f'.{uuid.uuid4().hex}.part')
+    try:
+      with os.fdopen(os.open(temporary, self.OS_OPEN_FLAGS, 0o666), 'wb') as file:
+        for chunk in content.chunks():
+          chunk = chunk.encode() if isinstance(chunk, str) else chunk
+          digest.update(chunk)
+          file.write(chunk)
+
+      name = self.blob_name(name, digest.hexdigest())
+      if self.reuse(name):
+        os.remove(temporary)
+      else:
+        self.make_directory(name)
+        os.replace(temporary, self.path(name))
+    except BaseException:
+      if os.path.exists(temporary):
+        os.remove(temporary)
+      raise
+    self.set_permissions(name)
+    return name
+
+
+  def reuse(self, name : str) -> bool:
+    """
+    Whether the blob `name` is already stored. Its mtime is refreshed, so the
+    grace period of the orphan collector covers the row about to point to it.
+    """
+    try:
+      os.utime(self.path(name))
+    except FileNotFoundError:
+      return False
+    return True
+
+
+  def set_permissions(self, name : str):
+    if self.file_permissions_mode is not None:
+      os.chmod(self.path(name), self.file_permissions_mode)
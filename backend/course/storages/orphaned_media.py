@@ -0,0 +1,71 @@
+import heapq
+import os
+
+from django.db import connection
+from django.db.models.functions import Collate
+
+
+# code point order, the order Python compares the stored names in
+BINARY_COLLATIONS = {
+  'sqlite': 'BINARY',
+  'postgresql': 'C',
+  'mysql': 'utf8mb4_bin',
+}
+
+
+def stored_files(storage, directory : str):
+  """
+  `(name, stat)` of every file under `directory`, in name order. Directories
+  are listed one at a time and sorted as if their name ended with `/`, so the
+  walk yields the same order as sorting the full names.
+  """
+  try:
+    entries = list(os.scandir(storage.path(directory)))
+  except FileNotFoundError:
+    return
+  entries.sort(key=lambda entry: entry.name + '/' if entry.is_dir(follow_symlinks=False) else entry.name)
+  for entry in entries:
+    name = f'{directory}/{entry.name}' if directory else entry.name
+    if entry.is_dir(follow_symlinks=False):
+      yield from stored_files(storage, name)
+    elif entry.is_file(follow_symlinks=False):
+      yield name, entry.stat(follow_symlinks=False)
+
+
+def referenced_names(model, field : str, batch_size : int):
+  """The distinct names in the `field` column, in name order, read in keyset batches"""
+  collation = BINARY_COLLATIONS.get(connection.vendor)
+  key = Collate(field, collation) if collation else field
+  queryset = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True}).annotate(
+    ordered_name=key).order_by('ordered_name').values_list('ordered_name', flat=True).distinct()
+
+  last = None
+  while True:
+    batch = list((queryset if last is None else queryset.filter(ordered_name__gt=last))[:batch_size])
+    if not batch:
+      return
+    yield from batch
+    last = batch[-1]
+
+
+def unreferenced_files(stored, referenced):
+  """
+  Merge join of two name ordered streams: the `(name, stat)` of `stored`
+  whose name is not in `referenced`. Neither stream is held in memory.
+  """
+  referenced = iter(referenced)
+  current = next(referenced, None)
+  for name, stat in stored:
+    while current is not None and current < name:
+      current = next(referenced, None)
+    if current != name:
+      yield name, stat
+
+
+def merged_names(*streams):
+  """The union of name ordered streams, in order and without duplicates"""
+  last = None
+  for name in heapq.merge(*streams):
+    if name != last:
+      yield name
+      last = name
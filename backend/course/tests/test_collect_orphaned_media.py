@@ -0,0 +1,176 @@
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from course.factories import CategoryFactory, CourseFactory, LessonFactory
+from course.models import Lesson, MediaBlob, VideoUpload
+from course.storages import merged_names, referenced_names, stored_files, unreferenced_files
+
+
+TWO_DAYS = 2 * 24 * 60 * 60
+
+
+class CollectOrphanedMediaTestCase(TestCase):
+  def setUp(self):
+    self.media_root = tempfile.mkdtemp()
+    self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+    self.settings_override.enable()
+
+    self.lesson = LessonFactory(video=ContentFile(b'first video', 'intro.mp4'))
+    self.old_video = self.lesson.video.name
+    self.lesson.video = ContentFile(b'second video', 'intro.mp4')
+    self.lesson.save()
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.media_root)
+
+
+  def age(self, name):
+    past = time.time() - TWO_DAYS
+    os.utime(default_storage.path(name), (past, past))
+    MediaBlob.objects.filter(name=name).update(updated_at=timezone.now() - timedelta(seconds=TWO_DAYS))
+
+
+  def collect(self, *args):
+    output = StringIO()
+    call_command('collect_orphaned_media', *args, stdout=output)
+    return output.getvalue()
+
+
+  def test_replaced_files_are_collected_after_the_grace_period(self):
+    self.age(self.old_video)
+    output = self.collect()
+
+    self.assertIn(self.old_video, output)
+    self.assertFalse(default_storage.exists(self.old_video))
+    self.assertFalse(MediaBlob.objects.filter(name=self.old_video).exists())
+    # the emptied shard directories go too
+    self.assertFalse(os.path.exists(os.path.dirname(default_storage.path(self.old_video))))
+
+    lesson = Lesson.objects.get(pk=self.lesson.pk)
+    for name in (lesson.video.name, lesson.cover.name, lesson.course.cover.name):
+      self.assertTrue(default_storage.exists(name))
+
+
+  def test_dry_run_only_reports(self):
+    self.age(self.old_video)
+    output = self.collect('--dry-run')
+    self.assertIn(self.old_video, output)
+    self.assertIn('Found 1 orphaned file(s)', output)
+    self.assertTrue(default_storage.exists(self.old_video))
+
+
+  def test_recent_files_are_kept(self):
+    output = self.collect()
+    self.assertTrue(default_storage.exists(self.old_video))
+    self.assertIn('kept 1 within the grace period', output)
+
+    # an old file released a moment ago is kept as well
+    past = time.time() - TWO_DAYS
+    os.utime(default_storage.path(self.old_video), (past, past))
+    self.collect()
+    self.assertTrue(default_storage.exists(self.old_video))
+
+
+  def test_cascades_orphan_every_file(self):
+    category = CategoryFactory()
+    course = CourseFactory(category=category)
+    lesson = LessonFactory(course=course, video=ContentFile(b'cascaded video', 'intro.mp4'))
+    video = lesson.video.name
+    category.delete()
+    self.age(video)
+
+    self.collect('--grace-hours', '1')
+    self.assertFalse(default_storage.exists(video))
+
+
+  def test_streams_are_in_the_same_order(self):
+    for name in ('classes/ab-c.jpg', 'classes/ab/x.jpg', 'classes/ab.jpg', 'classes/a/b.jpg'):
+      self.write(name)
+    names = [name for name, _ in stored_files(default_storage, 'classes')]
+    self.assertEqual(names, sorted(names))
+
+    referenced = list(merged_names(referenced_names(Lesson, 'cover', 1), referenced_names(Lesson, 'video', 1)))
+    self.assertEqual(referenced, sorted(set(Lesson.objects.values_list('cover', flat=True)) |
+                                        set(Lesson.objects.values_list('video', flat=True))))
+    orphans = [name for name, _ in unreferenced_files(stored_files(default_storage, 'classes'), referenced)]
+    self.assertEqual(orphans, sorted(set(names) - set(referenced)))
+
+
+  def write(self, name):
+    path = default_storage.path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as file:
+      file.write(b'x')
+
+
+class CollectExpiredUploadsTestCase(TestCase):
+  def setUp(self):
+    self.upload_dir = tempfile.mkdtemp()
+    self.settings_override = override_settings(VIDEO_UPLOAD_DIR=self.upload_dir, VIDEO_UPLOAD_EXPIRY_HOURS=24)
+    self.settings_override.enable()
+    self.lesson = LessonFactory()
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.upload_dir)
+
+
+  def upload(self, idle_seconds=0):
+    upload = VideoUpload.objects.create(lesson=self.lesson, user=self.lesson.author, filename='intro.mp4', length=10)
+    with open(upload.part_path, 'wb') as part:
+      part.write(b'12345')
+    if idle_seconds:
+      past = time.time() - idle_seconds
+      os.utime(upload.part_path, (past, past))
+      VideoUpload.objects.filter(pk=upload.pk).update(updated_at=timezone.now() - timedelta(seconds=idle_seconds))
+    return upload
+
+
+  def test_expired_uploads_are_removed(self):
+    expired, active = self.upload(idle_seconds=TWO_DAYS), self.upload()
+    leftover = os.path.join(self.upload_dir, 'leftover.part')
+    with open(leftover, 'wb') as part:
+      part.write(b'x')
+    os.utime(leftover, (time.time() - TWO_DAYS, ) * 2)
+
+    output = StringIO()
+    call_command('collect_orphaned_media', stdout=output)
+    self.assertIn('Deleted 2 expired partial upload(s), 6 bytes', output.getvalue())
+
+    self.assertFalse(os.path.exists(expired.part_path))
+    self.assertFalse(os.path.exists(leftover))
+    self.assertFalse(VideoUpload.objects.filter(pk=expired.pk).exists())
+    self.assertTrue(os.path.exists(active.part_path))
+    self.assertTrue(VideoUpload.objects.filter(pk=active.pk).exists())
+
+
+  def test_expiry_can_be_set_per_run(self):
+    upload = self.upload(idle_seconds=2 * 60 * 60)
+    call_command('collect_orphaned_media', '--upload-expiry-hours', '3', stdout=StringIO())
+    self.assertTrue(os.path.exists(upload.part_path))
+
+    call_command('collect_orphaned_media', '--upload-expiry-hours', '1', '--dry-run', stdout=StringIO())
+    self.assertTrue(os.path.exists(upload.part_path))
+
+    call_command('collect_orphaned_media', '--upload-expiry-hours', '1', stdout=StringIO())
+    self.assertFalse(os.path.exists(upload.part_path))
+
+
+  def test_deleting_the_lesson_removes_its_partial_uploads(self):
+    upload = self.upload()
+    with self.captureOnCommitCallbacks(execute=True):
+      self.lesson.delete()
+    self.assertFalse(os.path.exists(upload.part_path))
@@ -1,5 +1,7 @@
 from django.test import TestCase
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from io import StringIO
 import tempfile
 
 from course.models import Course
@@ -152,4 +154,62 @@ class TestCourseModel(TestCase):
     self.assertEqual(Course.objects.count(), 1)
 
 
-  
\ No newline at end of file
+  def test_lesson_count_follows_created_lessons(self):
+    LessonFactory(course=self.course)
+    LessonFactory(course=self.course)
+    self.course.refresh_from_db()
+    self.assertEqual(self.course.lesson_count, 2)
+
+  
+  def test_lesson_count_follows_deleted_lessons(self):
+    lesson = LessonFactory(course=self.course)
+    LessonFactory(course=self.course)
+    lesson.delete()
+    self.course.refresh_from_db()
+    self.assertEqual(self.course.lesson_count, 1)
+
+  
+  def test_lesson_count_follows_lessons_moved_between_courses(self):
+    course = CourseFactory()
+    lesson = LessonFactory(course=self.course)
+    lesson.course = course
+    lesson.save()
+
+    self.course.refresh_from_db()
+    course.refresh_from_db()
+    self.assertEqual(self.course.lesson_count, 0)
+    self.assertEqual(course.lesson_count, 1)
+
+  
+  def test_saving_course_does_not_overwrite_lesson_count(self):
+    stale_course = Course.objects.get(pk=self.course.pk)
+    LessonFactory(course=self.course)
+    stale_course.description = "Updated Description"
+    stale_course.save()
+
+    self.course.refresh_from_db()
+    self.assertEqual(self.course.lesson_count, 1)
+    self.assertEqual(self.course.description, "Updated Description")
+
+  
+  def test_reconcile_lesson_counts_repairs_drift(self):
+    LessonFactory(course=self.course)
+    drifted = CourseFactory()
+    Course.objects.filter(pk=self.course.pk).update(lesson_count=7)
+    Course.objects.filter(pk=drifted.pk).update(lesson_count=3)
+
+    out = StringIO()
+    call_command('reconcile_lesson_counts', stdout=out)
+
+    self.assertIn('Repaired 2 drifted course(s)', out.getvalue())
+    self.assertEqual(Course.objects.get(pk=self.course.pk).lesson_count, 1)
+    self.assertEqual(Course.objects.get(pk=drifted.pk).lesson_count, 0)
+
+  
+  def test_reconcile_lesson_counts_dry_run_changes_nothing(self):
+    Course.objects.filter(pk=self.course.pk).update(lesson_count=7)
+    out = StringIO()
+    call_command('reconcile_lesson_counts', '--dry-run', stdout=out)
+
+    self.assertIn('Found 1 drifted course(s)', out.getvalue())
+    self.assertEqual(Course.objects.get(pk=self.course.pk).lesson_count, 7)
@@ -0,0 +1,139 @@
+import hashlib
+import os
+import shutil
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from course.factories import CategoryFactory, CourseFactory, LessonFactory, UserFactory
+from course.models import Lesson, MediaBlob
+from course.storages import ContentAddressedStorage, is_content_addressed
+
+
+VIDEO = b'intro video ' * 1000
+DIGEST = hashlib.sha256(VIDEO).hexdigest()
+SHARDED = f'{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}'
+
+
+class ContentAddressedStorageTestCase(TestCase):
+  def setUp(self):
+    self.location = tempfile.mkdtemp()
+    self.storage = ContentAddressedStorage(location=self.location)
+
+
+  def tearDown(self):
+    shutil.rmtree(self.location)
+
+
+  def test_files_are_named_by_content(self):
+    name = self.storage.save('classes/intro.MP4', ContentFile(VIDEO))
+    self.assertEqual(name, f'classes/{SHARDED}.mp4')
+    self.assertTrue(is_content_addressed(name))
+    with self.storage.open(name) as file:
+      self.assertEqual(file.read(), VIDEO)
+
+
+  def test_identical_content_is_stored_once(self):
+    first = self.storage.save('classes/intro.mp4', ContentFile(VIDEO))
+    second = self.storage.save('classes/copy.mp4', ContentFile(VIDEO))
+    self.assertEqual(first, second)
+    self.assertEqual(self.storage.listdir(f'classes/{DIGEST[:2]}/{DIGEST[2:4]}'), ([], [f'{DIGEST}.mp4']))
+
+
+  def test_reused_blobs_are_touched(self):
+    name = self.storage.save('classes/intro.mp4', ContentFile(VIDEO))
+    os.utime(self.storage.path(name), (0, 0))
+    self.storage.save('classes/copy.mp4', ContentFile(VIDEO))
+    self.assertGreater(os.stat(self.storage.path(name)).st_mtime, 0)
+
+
+  def test_streamed_hash_is_used(self):
+    upload = SimpleUploadedFile('intro.mp4', VIDEO)
+    upload.content_hash = DIGEST
+    self.assertEqual(self.storage.save('classes/intro.mp4', upload), f'classes/{SHARDED}.mp4')
+
+
+class MediaBlobReferencesTestCase(TestCase):
+  def setUp(self):
+    self.media_root = tempfile.mkdtemp()
+    self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+    self.settings_override.enable()
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.media_root)
+
+
+  def references(self, name):
+    return MediaBlob.objects.filter(name=name).values_list('references', flat=True).first()
+
+
+  def test_shared_files_are_counted_across_fields(self):
+    lesson = LessonFactory(video=ContentFile(VIDEO, 'intro.mp4'))
+    other = LessonFactory(video=ContentFile(VIDEO, 'reused.mp4'))
+    self.assertEqual(lesson.video.name, other.video.name)
+    self.assertEqual(self.references(lesson.video.name), 2)
+
+    # the factory covers are all alike, and a video may be the same file too
+    with lesson.cover.open('rb') as cover:
+      LessonFactory(video=ContentFile(cover.read(), 'still.jpg'))
+    self.assertEqual(self.references(lesson.cover.name), 3 + 1)
+
+
+  def test_replaced_and_deleted_files_are_released(self):
+    lesson = LessonFactory(video=ContentFile(VIDEO, 'intro.mp4'))
+    name = lesson.video.name
+
+    lesson.video = ContentFile(b'another video', 'other.mp4')
+    lesson.save()
+    self.assertEqual(self.references(name), 0)
+    self.assertEqual(self.references(lesson.video.name), 1)
+
+    lesson.delete()
+    self.assertEqual(self.references(lesson.video.name), 0)
+
+
+  def test_category_cascade_releases_every_file(self):
+    category = CategoryFactory()
+    course = CourseFactory(category=category)
+    LessonFactory(course=course, video=ContentFile(VIDEO, 'intro.mp4'))
+    category.delete()
+    self.assertFalse(MediaBlob.objects.filter(references__gt=0).exists())
+
+
+  def test_uploads_are_hashed_as_they_stream_in(self):
+    staff = UserFactory(is_staff=True)
+    lesson = LessonFactory()
+    client = APIClient()
+    client.force_authenticate(user=staff)
+    response = client.patch(
+      reverse('lesson', kwargs={'pk': lesson.pk}), {'video': SimpleUploadedFile('intro.mp4', VIDEO)},
+      format='multipart', HTTP_ACCEPT='application/json; version=v1')
+
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(Lesson.objects.get(pk=lesson.pk).video.name, f'classes/{SHARDED}.mp4')
+    self.assertEqual(self.references(f'classes/{SHARDED}.mp4'), 1)
+
+
+  def test_content_addressed_media_is_immutable(self):
+    course = CourseFactory()
+    response = APIClient().get(course.cover.url)
+    self.assertIn('immutable', response['Cache-Control'])
+    self.assertIn('public', response['Cache-Control'])
+
+    lesson = LessonFactory(video=ContentFile(VIDEO, 'intro.mp4'))
+    client = APIClient()
+    client.force_authenticate(user=UserFactory())
+    self.assertIn('private', client.get(lesson.video.url)['Cache-Control'])
+
+
+  def test_other_models_are_not_tracked(self):
+    user = UserFactory()
+    with self.assertNumQueries(1):
+      user.save(update_fields=['last_login'])
+    self.assertFalse(hasattr(user, '_previous_files'))
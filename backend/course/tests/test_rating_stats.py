@@ -0,0 +1,115 @@
+from django.test import TestCase
+from django.core.management import call_command
+from io import StringIO
+
+from course.models import Comment, CourseStats, LessonStats
+from course.factories import CommentFactory, CourseFactory, LessonFactory
+from course.stats import COUNTER_FIELDS, STAR_VALUES
+
+
+class TestRatingStats(TestCase):
+  def setUp(self):
+    self.course = CourseFactory()
+    self.lesson = LessonFactory(course=self.course)
+    self.other_lesson = LessonFactory(course=self.course)
+
+
+  def assert_rollups_match_comments(self):
+    for lesson_stats in LessonStats.objects.all():
+      comments = Comment.objects.filter(lesson=lesson_stats.lesson_id)
+      self.assert_stats_match(lesson_stats, comments)
+    for course_stats in CourseStats.objects.all():
+      comments = Comment.objects.filter(lesson__course=course_stats.course_id)
+      self.assert_stats_match(course_stats, comments)
+
+
+  def assert_stats_match(self, stats, comments):
+    stars = [comment.stars for comment in comments if comment.stars is not None]
+    self.assertEqual(stats.comment_count, comments.filter(comment_fk__isnull=True).count())
+    self.assertEqual(stats.reply_count, comments.filter(comment_fk__isnull=False).count())
+    self.assertEqual(stats.star_count, len(stars))
+    self.assertEqual(stats.star_sum, sum(stars))
+    for value in STAR_VALUES:
+      self.assertEqual(getattr(stats, f'stars_{value}'), stars.count(value))
+    self.assertAlmostEqual(stats.rating, sum(stars) / len(stars) if stars else 0)
+
+
+  def test_lessons_and_courses_start_with_empty_rollups(self):
+    stats = LessonStats.objects.get(lesson=self.lesson)
+    self.assertEqual(stats.star_count, 0)
+    self.assertEqual(stats.rating, 0)
+    self.assertTrue(CourseStats.objects.filter(course=self.course).exists())
+
+
+  def test_comments_update_lesson_and_course_rollups(self):
+    root = CommentFactory(lesson=self.lesson, stars=5)
+    CommentFactory(lesson=self.lesson, stars=2, comment_fk=root)
+    CommentFactory(lesson=self.other_lesson, stars=None)
+
+    lesson_stats = LessonStats.objects.get(lesson=self.lesson)
+    self.assertEqual((lesson_stats.comment_count, lesson_stats.reply_count), (1, 1))
+    self.assertEqual((lesson_stats.stars_5, lesson_stats.stars_2), (1, 1))
+    self.assertAlmostEqual(lesson_stats.rating, 3.5)
+
+    course_stats = CourseStats.objects.get(course=self.course)
+    self.assertEqual((course_stats.comment_count, course_stats.reply_count, course_stats.star_count), (2, 1, 2))
+    self.assert_rollups_match_comments()
+
+
+  def test_updated_and_deleted_comments_move_the_rollups(self):
+    comment = CommentFactory(lesson=self.lesson, stars=1)
+    comment.stars = 4
+    comment.save()
+    self.assertAlmostEqual(LessonStats.objects.get(lesson=self.lesson).rating, 4)
+
+    comment.lesson = self.other_lesson
+    comment.save()
+    self.assert_rollups_match_comments()
+
+    comment.delete()
+    self.assert_rollups_match_comments()
+    self.assertEqual(CourseStats.objects.get(course=self.course).star_count, 0)
+
+
+  def test_deleting_a_root_comment_removes_its_replies(self):
+    root = CommentFactory(lesson=self.lesson, stars=3)
+    CommentFactory(lesson=self.lesson, stars=1, comment_fk=root)
+    root.delete()
+
+    stats = LessonStats.objects.get(lesson=self.lesson)
+    self.assertEqual((stats.comment_count, stats.reply_count, stats.star_count), (0, 0, 0))
+    self.assert_rollups_match_comments()
+
+
+  def test_lesson_moving_course_moves_its_rollup(self):
+    CommentFactory(lesson=self.lesson, stars=5)
+    other_course = CourseFactory()
+    self.lesson.course = other_course
+    self.lesson.save()
+
+    self.assertEqual(CourseStats.objects.get(course=self.course).star_count, 0)
+    self.assertEqual(CourseStats.objects.get(course=other_course).star_count, 1)
+    self.assert_rollups_match_comments()
+
+
+  def test_deleting_a_lesson_removes_its_comments_from_the_course(self):
+    CommentFactory(lesson=self.lesson, stars=5)
+    CommentFactory(lesson=self.other_lesson, stars=1)
+    self.lesson.delete()
+
+    self.assertAlmostEqual(CourseStats.objects.get(course=self.course).rating, 1)
+    self.assert_rollups_match_comments()
+
+
+  def test_rebuild_command_repairs_drift(self):
+    for stars in (1, 2, 5):
+      CommentFactory(lesson=self.lesson, stars=stars)
+    LessonStats.objects.update(**dict.fromkeys(COUNTER_FIELDS, 0), rating=0)
+    CourseStats.objects.all().delete()
+
+    out = StringIO()
+    call_command('rebuild_rating_stats', batch_size=1, stdout=out)
+
+    self.assertIn('2 lesson(s) and 1 course(s)', out.getvalue())
+    self.assert_rollups_match_comments()
+    self.assertAlmostEqual(CourseStats.objects.get(course=self.course).rating, 8 / 3)
@@ -0,0 +1,91 @@
+from django.test import TestCase, override_settings
+from django.core.management import call_command
+from django.db import connection
+from io import StringIO
+from unittest import mock
+
+from course.factories import CategoryFactory, CourseFactory, LessonFactory
+from course.search import get_search_backend
+from course.search.backends.database import DatabaseSearchBackend
+from course.search.backends.sqlite_fts5 import SQLiteFTS5Backend
+from backend.faker_base import faker
+
+
+class TestSearchIndex(TestCase):
+  def setUp(self):
+    faker.unique.clear()
+    self.category = CategoryFactory(name='Programming', description='Software courses')
+    self.course = CourseFactory(title='Django for beginners', description='Web apps', category=self.category)
+    self.lesson = LessonFactory(
+      title='Models and migrations', course=self.course, description='',
+      text='<p>Querysets are <strong>lazy</strong> &amp; chainable</p>')
+    self.backend = get_search_backend()
+
+
+  def search(self, query, kinds=None):
+    results = self.backend.search(query, kinds)
+    return [(hit.kind, hit.object_id) for hit in results[0:results.count()]]
+
+
+  def test_created_objects_are_indexed(self):
+    self.assertEqual(self.search('django'), [('course', self.course.pk)])
+    self.assertEqual(self.search('programming'), [('category', self.category.pk)])
+
+
+  def test_lesson_html_is_indexed_as_text(self):
+    self.assertEqual(self.search('lazy chainable'), [('lesson', self.lesson.pk)])
+    self.assertEqual(self.search('strong'), [])
+
+
+  def test_terms_match_as_prefixes(self):
+    self.assertEqual(self.search('migra'), [('lesson', self.lesson.pk)])
+
+
+  def test_updated_objects_are_reindexed(self):
+    self.course.title = 'Flask for beginners'
+    self.course.save()
+    self.assertEqual(self.search('django'), [])
+    self.assertEqual(self.search('flask'), [('course', self.course.pk)])
+
+
+  def test_deleted_objects_are_removed(self):
+    self.category.delete()
+    self.assertEqual(self.search('programming'), [])
+    self.assertEqual(self.search('migrations'), [])
+
+
+  def test_titles_rank_above_bodies(self):
+    course = CourseFactory(title='Advanced topics', description='More about django', category=self.category)
+    self.assertEqual(self.search('django', ['course']), [('course', self.course.pk), ('course', course.pk)])
+
+
+  def test_search_can_be_restricted_to_kinds(self):
+    LessonFactory(title='Deploying django', course=self.course)
+    self.assertEqual([kind for kind, _ in self.search('django', ['lesson'])], ['lesson'])
+
+
+  def test_rebuild_search_index_restores_documents(self):
+    with connection.cursor() as cursor:
+      cursor.execute('DELETE FROM course_search_index')
+    self.assertEqual(self.search('django'), [])
+
+    out = StringIO()
+    call_command('rebuild_search_index', stdout=out)
+    self.assertIn('Indexed', out.getvalue())
+    self.assertEqual(self.search('django'), [('course', self.course.pk)])
+
+
+  @override_settings(SEARCH_BACKEND=None)
+  def test_unset_backend_is_chosen_by_the_database(self):
+    self.assertIsInstance(get_search_backend(), SQLiteFTS5Backend)
+    # other databases have no search index table, see migration 0017
+    with mock.patch.object(connection, 'vendor', 'postgresql'):
+      self.assertIsInstance(get_search_backend(), DatabaseSearchBackend)
+
+
+  @override_settings(SEARCH_BACKEND='course.search.backends.database.DatabaseSearchBackend')
+  def test_database_backend_can_be_plugged_in(self):
+    self.assertIsInstance(get_search_backend(), DatabaseSearchBackend)
+    results = get_search_backend().search('lazy')
+    self.assertEqual(results.count(), 1)
+    self.assertEqual(results[0].object_id, self.lesson.pk)
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from course.factories import CourseFactory, LessonFactory
+from course.management.commands.shard_media import Command
+from course.models import Course, Lesson, MediaBlob
+
+
+VIDEO = b'intro video ' * 1000
+DIGEST = hashlib.sha256(VIDEO).hexdigest()
+
+
+class ShardMediaTestCase(TestCase):
+  def setUp(self):
+    self.media_root = tempfile.mkdtemp()
+    self.settings_override = override_settings(MEDIA_ROOT=self.media_root, MEDIA_SHARD_DEPTH=0)
+    self.settings_override.enable()
+
+    self.lesson = LessonFactory(video=ContentFile(VIDEO, 'intro.mp4'))
+    self.other = LessonFactory(video=ContentFile(VIDEO, 'reused.mp4'))
+    self.course = CourseFactory()
+
+
+  def tearDown(self):
+    self.settings_override.disable()
+    shutil.rmtree(self.media_root)
+
+
+  def shard(self, *args):
+    with override_settings(MEDIA_SHARD_DEPTH=2):
+      call_command('shard_media', *args, stdout=StringIO(), stderr=StringIO())
+
+
+  def path(self, name):
+    return os.path.join(self.media_root, name)
+
+
+  def test_files_are_moved_into_shards(self):
+    flat = self.lesson.video.name
+    self.assertEqual(flat, f'classes/{DIGEST}.mp4')
+    self.shard()
+
+    sharded = f'classes/{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}.mp4'
+    self.assertEqual(Lesson.objects.get(pk=self.lesson.pk).video.name, sharded)
+    self.assertEqual(Lesson.objects.get(pk=self.other.pk).video.name, sharded)
+    self.assertTrue(Course.objects.get(pk=self.course.pk).cover.name.startswith('courses/'))
+    self.assertEqual(MediaBlob.objects.get(name=sharded).references, 2)
+    self.assertEqual(MediaBlob.objects.get(name=flat).references, 0)
+
+    # the old name is a hard link kept for readers holding it
+    self.assertTrue(os.path.samefile(self.path(flat), self.path(sharded)))
+
+
+  def test_cached_and_validated_responses_see_the_new_names(self):
+    client = APIClient()
+    client.credentials(HTTP_ACCEPT='application/json; version=v1')
+    url = reverse('lesson', kwargs={'pk': self.lesson.pk})
+    before = client.get(url)
+    self.assertTrue(before.data['video'].endswith(f'classes/{DIGEST}.mp4'))
+
+    self.shard('--unlink')
+    response = client.get(url, HTTP_IF_NONE_MATCH=before['ETag'])
+    self.assertEqual(response.status_code, status.HTTP_200_OK)
+    self.assertTrue(response.data['video'].endswith(f'classes/{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}.mp4'))
+    self.assertGreater(Lesson.objects.get(pk=self.lesson.pk).updated_at, self.lesson.updated_at)
+
+
+  def test_files_stored_before_content_addressing_are_hashed(self):
+    os.makedirs(self.path('classes'), exist_ok=True)
+    with open(self.path('classes/legacy_video.mp4'), 'wb') as file:
+      file.write(VIDEO)
+    Lesson.objects.filter(pk=self.lesson.pk).update(video='classes/legacy_video.mp4')
+    MediaBlob.objects.acquire(['classes/legacy_video.mp4'])
+
+    self.shard('--unlink')
+    self.assertEqual(
+      Lesson.objects.get(pk=self.lesson.pk).video.name, f'classes/{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}.mp4')
+    self.assertFalse(os.path.exists(self.path('classes/legacy_video.mp4')))
+
+
+  def test_unlink_removes_the_old_names(self):
+    self.shard('--unlink')
+    self.assertFalse(os.path.exists(self.path(f'classes/{DIGEST}.mp4')))
+    self.assertFalse(MediaBlob.objects.filter(name=f'classes/{DIGEST}.mp4').exists())
+    with Lesson.objects.get(pk=self.lesson.pk).video.open('rb') as video:
+      self.assertEqual(video.read(), VIDEO)
+
+
+  def test_dry_run_and_reruns_change_nothing(self):
+    self.shard('--dry-run')
+    self.assertEqual(Lesson.objects.get(pk=self.lesson.pk).video.name, f'classes/{DIGEST}.mp4')
+
+    self.shard()
+    names = list(Lesson.objects.order_by('pk').values_list('cover', 'video'))
+    self.shard()
+    self.assertEqual(list(Lesson.objects.order_by('pk').values_list('cover', 'video')), names)
+
+
+  def test_rows_changed_meanwhile_keep_their_upload(self):
+    flat = self.lesson.video.name
+    self.lesson.video = ContentFile(b'new video', 'new.mp4')
+    self.lesson.save()
+    new_name = self.lesson.video.name
+
+    with override_settings(MEDIA_SHARD_DEPTH=2):
+      Command().repoint(Lesson, 'video', [(self.lesson.pk, flat)], {flat: 'classes/x/y/z.mp4'})
+    self.assertEqual(Lesson.objects.get(pk=self.lesson.pk).video.name, new_name)
@@ -77,4 +77,25 @@ class TestWatchedModel(TestCase):
     with self.assertRaises(ValidationError):
       watched.full_clean()
       watched.save()
-    self.assertEqual(Watched.objects.count(), 1)
\ No newline at end of file
+    self.assertEqual(Watched.objects.count(), 1)
+
+  def test_bulk_upsert_max_inserts_and_only_moves_forward(self):
+    lesson = LessonFactory()
+    progress = {
+      (self.watched.user_id, self.watched.lesson_id): self.watched.watched_time + 10,
+      (self.watched.user_id, lesson.pk): 7,
+    }
+    Watched.objects.bulk_upsert_max(progress)
+
+    self.watched.refresh_from_db()
+    self.assertEqual(self.watched.watched_time, progress[(self.watched.user_id, self.watched.lesson_id)])
+    self.assertEqual(Watched.objects.get(user=self.watched.user, lesson=lesson).watched_time, 7)
+
+    Watched.objects.bulk_upsert_max({(self.watched.user_id, lesson.pk): 3})
+    self.assertEqual(Watched.objects.get(user=self.watched.user, lesson=lesson).watched_time, 7)
+
+
+  def test_bulk_upsert_max_drops_missing_lessons(self):
+    sent = Watched.objects.bulk_upsert_max({(self.watched.user_id, 2 ** 31): 5})
+    self.assertEqual(sent, 0)
+    self.assertEqual(Watched.objects.count(), 1)